@@ -0,0 +1,80 @@
+"""
+Benchmark: fan-out of alerts to thousands of live subscribers in one event loop.
+
+Each subscriber is a task taking alerts from its subscription, as the SSE and WebSocket routes do, without
+the network. Bursts of alerts are published while the subscribers keep up, then again with a share of the
+subscribers stuck, to show publishing cost does not depend on them and that they get dropped.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_alert_broadcast.py [--subscribers N] [--bursts N] [--burst-size N]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+from my_mission_control.api.alert_broadcaster import AlertBroadcaster, AlertSubscription
+from my_mission_control.entity.alert import Alert
+
+EPOCH_US = 1_514_847_669_521_000
+
+
+async def consume(subscription: AlertSubscription, latencies: List[float], published_at: List[float]):
+    while await subscription.get_batch():
+        latencies.append(time.perf_counter() - published_at[-1])
+
+
+async def run(subscriber_count: int, bursts: int, burst_size: int, stuck_share: float) -> None:
+    broadcaster = AlertBroadcaster()
+    stuck_count = int(subscriber_count * stuck_share)
+    latencies: List[float] = []
+    published_at: List[float] = []
+    consumers = []
+    for index in range(subscriber_count):
+        subscription = broadcaster.subscribe("apollo")
+        if index >= stuck_count:
+            consumers.append(asyncio.create_task(consume(subscription, latencies, published_at)))
+    await asyncio.sleep(0)
+
+    publish_times: List[float] = []
+    start = time.perf_counter()
+    for burst in range(bursts):
+        alerts = [Alert(satellite_id=1000 + i % 50, severity="RED LOW", component="BATT", timestamp=EPOCH_US + burst * burst_size + i) for i in range(burst_size)]
+        published_at.append(time.perf_counter())
+        broadcaster.publish("apollo", alerts)
+        publish_times.append(time.perf_counter() - published_at[-1])
+        # Let the subscribers drain the burst, like the network writes between two uploaded chunks
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+
+    deliveries = bursts * burst_size * (subscriber_count - stuck_count)
+    label = f"{subscriber_count:,} subscribers, {stuck_count:,} stuck"
+    print(f"{label:<40} {elapsed:8.3f}s {deliveries / elapsed:>14,.0f} deliveries/sec")
+    publish_ms = sorted(t * 1000 for t in publish_times)
+    print(f"{'  publish per burst p50 / p99':<40} {statistics.median(publish_ms):8.3f}ms {publish_ms[int(len(publish_ms) * 0.99) - 1]:8.3f}ms")
+    if latencies:
+        latency_ms = sorted(t * 1000 for t in latencies)
+        print(f"{'  burst delivered p50 / p99':<40} {statistics.median(latency_ms):8.3f}ms {latency_ms[int(len(latency_ms) * 0.99) - 1]:8.3f}ms")
+    print(f"{'  dropped subscribers':<40} {broadcaster.dropped_subscriber_count:8,}")
+
+    for subscription in list(broadcaster._subscriptions.get("apollo", ())):
+        broadcaster.unsubscribe(subscription)
+    await asyncio.gather(*consumers)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark fanning alerts out to live subscribers.")
+    arg_parser.add_argument("--subscribers", type=int, default=5000, help="Number of subscribers (default: 5,000)")
+    arg_parser.add_argument("--bursts", type=int, default=200, help="Number of published bursts (default: 200)")
+    arg_parser.add_argument("--burst-size", type=int, default=10, help="Alerts per burst (default: 10)")
+    args = arg_parser.parse_args()
+
+    for stuck_share in (0.0, 0.1):
+        asyncio.run(run(args.subscribers, args.bursts, args.burst_size, stuck_share))
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Microbenchmark: Alert serialization, asdict + snake_to_camel + strftime vs the precompiled AlertSerializer.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_alert_serializer.py [--alerts N]
+"""
+
+import argparse
+import json
+import time
+from dataclasses import asdict
+from datetime import datetime
+from typing import Callable, List
+
+from my_mission_control.config.settings import AlertOutputCfg
+from my_mission_control.entity.alert import ALERT_SERIALIZER, Alert
+from my_mission_control.utils.epoch_time import datetime_to_epoch_us, epoch_us_to_datetime
+from my_mission_control.utils.utility import snake_to_camel
+
+
+def baseline_to_dict(alert: Alert) -> dict:
+    """
+    Alert.to_dict as it was before the precompiled serializer.
+    """
+    raw_dict = asdict(alert)
+    timestamp = alert.timestamp if isinstance(alert.timestamp, datetime) else epoch_us_to_datetime(alert.timestamp)
+    raw_dict["timestamp"] = timestamp.strftime(AlertOutputCfg.TIMESTAMP_FORMAT)
+    return {snake_to_camel(k): v for k, v in raw_dict.items()}
+
+
+def baseline_to_json(alert: Alert) -> str:
+    return json.dumps(baseline_to_dict(alert))
+
+
+def baseline_to_ndjson_bytes(alert: Alert) -> bytes:
+    return json.dumps(baseline_to_dict(alert), separators=(",", ":")).encode() + b"\n"
+
+
+def make_alerts(count: int) -> List[Alert]:
+    """
+    Alerts of an alert storm, a second apart on the same few days.
+    """
+    base_us = datetime_to_epoch_us(datetime(2018, 1, 1, 0, 0, 0))
+    return [Alert(1000 + i % 50, "RED HIGH" if i % 2 else "RED LOW", "TSTAT" if i % 2 else "BATT", base_us + i * 1_000_123) for i in range(count)]
+
+
+def run(label: str, func: Callable[[Alert], object], alerts: List[Alert]) -> float:
+    start = time.perf_counter()
+    for alert in alerts:
+        func(alert)
+    elapsed = time.perf_counter() - start
+    rate = len(alerts) / elapsed
+    print(f"{label:<40} {elapsed:8.3f}s {rate:>14,.0f} alerts/sec")
+    return rate
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark Alert serialization.")
+    arg_parser.add_argument("--alerts", type=int, default=500_000, help="Number of alerts to serialize (default: 500,000)")
+    args = arg_parser.parse_args()
+
+    alerts = make_alerts(args.alerts)
+    print(f"{args.alerts:,} alerts")
+    for label, before, after in (
+        ("to_dict", baseline_to_dict, ALERT_SERIALIZER.to_dict),
+        ("to_json", baseline_to_json, ALERT_SERIALIZER.to_json),
+        ("NDJSON bytes", baseline_to_ndjson_bytes, ALERT_SERIALIZER.to_ndjson_bytes),
+    ):
+        before_rate = run(f"{label} (asdict + snake_to_camel)", before, alerts)
+        after_rate = run(f"{label} (AlertSerializer)", after, alerts)
+        print(f"{'speedup':<40} {after_rate / before_rate:8.1f}x\n")
+
+
+if __name__ == "__main__":
+    main()
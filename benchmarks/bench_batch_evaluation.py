@@ -0,0 +1,63 @@
+"""
+Benchmark: evaluating a chunk of parsed log lines row by row vs column-wise with evaluate_batch.
+
+Usage:
+    PYTHONPATH=src:benchmarks python benchmarks/bench_batch_evaluation.py [--lines N] [--satellites N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Callable, List
+
+from bench_vectorized_alerts import write_log_file
+
+from my_mission_control.alerter.alert_strategy import AlertEvalStrategy, evaluate_log_columns
+from my_mission_control.alerter.alert_tracker_factory import create_alert_eval_strategy_map
+from my_mission_control.alerter.log_batch_parser import LogColumns, parse_log_lines_batch
+
+
+def evaluate_rows(columns: LogColumns) -> List[int]:
+    """
+    Baseline: one LogEntry and one evaluate call per row, as the batch paths did before evaluate_batch.
+    """
+    strategies = create_alert_eval_strategy_map()
+    violation_rows = []
+    for row, log_entry in enumerate(columns.log_entries()):
+        strategy: AlertEvalStrategy = strategies[log_entry.component]
+        if strategy.evaluate(log_entry):
+            violation_rows.append(row)
+    return violation_rows
+
+
+def run(label: str, func: Callable[[], List], count: int) -> float:
+    start = time.perf_counter()
+    violations = func()
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed
+    print(f"{label:<40} {elapsed:8.3f}s {rate:>14,.0f} lines/sec {len(violations):>10,} violations")
+    return rate
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark column-wise alert evaluation.")
+    arg_parser.add_argument("--lines", type=int, default=1_000_000, help="Number of log lines (default: 1,000,000)")
+    arg_parser.add_argument("--satellites", type=int, default=100, help="Number of distinct satellites (default: 100)")
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "telemetry.log")
+        write_log_file(path, args.lines, args.satellites)
+        with open(path) as log_lines:
+            columns = parse_log_lines_batch(log_lines)
+
+    strategies = create_alert_eval_strategy_map()
+    print(f"Evaluation, {args.lines:,} lines, {args.satellites:,} satellites")
+    before = run("evaluate per row", lambda: evaluate_rows(columns), args.lines)
+    after = run("evaluate_log_columns", lambda: evaluate_log_columns(columns, strategies)[0].tolist(), args.lines)
+    print(f"{'speedup':<40} {after / before:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Restart benchmark: reprocessing a log file from byte 0 vs resuming from a tracker checkpoint.
+
+Processes a whole file with checkpointing, appends a few lines, then times a restart both ways, along with
+saving and loading the checkpoint on its own.
+
+Usage:
+    PYTHONPATH=src:benchmarks python benchmarks/bench_checkpoint_resume.py [--lines N] [--satellites N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from bench_vectorized_alerts import write_log_file
+
+from my_mission_control.alerter.log_file_processor_v2 import process_log_file, process_log_file_checkpointed
+from my_mission_control.alerter.tracker_checkpoint import load_checkpoint, save_checkpoint
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark restarting from a tracker checkpoint.")
+    arg_parser.add_argument("--lines", type=int, default=2_000_000, help="Number of log lines (default: 2,000,000)")
+    arg_parser.add_argument("--satellites", type=int, default=10_000, help="Number of distinct satellites (default: 10,000)")
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        log_file = os.path.join(directory, "telemetry.log")
+        checkpoint_file = os.path.join(directory, "telemetry.ckpt")
+        write_log_file(log_file, args.lines, args.satellites)
+        process_log_file_checkpointed(log_file, checkpoint_file)
+        with open(log_file, "a") as log_lines:
+            log_lines.write("20180201 00:00:00.000|1000|17|15|9|8|7.5|BATT\n" * 10)
+
+        print(f"{args.lines:,} lines, {os.path.getsize(log_file) / 2**20:,.0f} MiB, checkpoint {os.path.getsize(checkpoint_file) / 2**10:,.0f} KiB")
+
+        start = time.perf_counter()
+        process_log_file(log_file)
+        reprocess = time.perf_counter() - start
+        print(f"{'reprocess from byte 0':<32} {reprocess * 1000:10.1f} ms")
+
+        start = time.perf_counter()
+        process_log_file_checkpointed(log_file, checkpoint_file, resume=True)
+        resume = time.perf_counter() - start
+        print(f"{'resume from checkpoint':<32} {resume * 1000:10.1f} ms")
+        print(f"{'speedup':<32} {reprocess / resume:10.0f}x")
+
+        start = time.perf_counter()
+        checkpoint = load_checkpoint(checkpoint_file)
+        print(f"{'load checkpoint':<32} {(time.perf_counter() - start) * 1000:10.1f} ms ({len(checkpoint.violation_windows):,} windows)")
+        start = time.perf_counter()
+        save_checkpoint(checkpoint_file, checkpoint)
+        print(f"{'save checkpoint':<32} {(time.perf_counter() - start) * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark: decompressing an archive to disk before processing it vs streaming decompression into the parser.
+
+Decompression only overlaps parsing in the background thread when more than one CPU core is available.
+
+Usage:
+    PYTHONPATH=src:benchmarks python benchmarks/bench_compressed_logs.py [--lines N] [--format gzip|bz2|xz]
+"""
+
+import argparse
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+import tempfile
+import time
+from typing import Callable
+
+from bench_vectorized_alerts import write_log_file
+
+from my_mission_control.alerter.log_file_decompressor import iter_decompressed_log_lines
+from my_mission_control.alerter.log_file_processor_v2 import process_log_file
+from my_mission_control.alerter.log_file_scanner import iter_log_lines_mmap
+
+OPENERS = {"gzip": gzip.open, "bz2": bz2.open, "xz": lzma.open}
+
+
+def run(label: str, func: Callable[[], object], count: int) -> float:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed
+    print(f"{label:<40} {elapsed:8.3f}s {rate:>14,.0f} lines/sec")
+    return rate
+
+
+def decompress_then_process(archive: str, compression: str, tmp_dir: str, process: Callable[[str], object]):
+    # Separate decompress-to-disk step, as zcat archive > file
+    path = os.path.join(tmp_dir, "decompressed.log")
+    with OPENERS[compression](archive, "rb") as compressed, open(path, "wb") as decompressed:
+        shutil.copyfileobj(compressed, decompressed, 1 << 20)
+    process(path)
+    os.remove(path)
+
+
+def count_lines(lines) -> int:
+    return sum(1 for _ in lines)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark streaming decompression of compressed log files.")
+    arg_parser.add_argument("--lines", type=int, default=1_000_000, help="Number of log lines (default: 1,000,000)")
+    arg_parser.add_argument("--format", choices=sorted(OPENERS), default="gzip", help="Compression format (default: gzip)")
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "telemetry.log")
+        write_log_file(path, args.lines, 50)
+        archive = os.path.join(tmp_dir, "telemetry.log.archive")
+        with open(path, "rb") as plain, OPENERS[args.format](archive, "wb") as compressed:
+            shutil.copyfileobj(plain, compressed, 1 << 20)
+        os.remove(path)
+        print(f"{args.format} archive of {args.lines:,} lines, {os.path.getsize(archive):,} bytes\n")
+
+        print(f"Read lines, {args.lines:,} lines")
+        before = run("decompress to disk + iter_log_lines_mmap", lambda: decompress_then_process(archive, args.format, tmp_dir, lambda path: count_lines(iter_log_lines_mmap(path))), args.lines)
+        after = run("iter_decompressed_log_lines", lambda: count_lines(iter_decompressed_log_lines(archive, args.format)), args.lines)
+        print(f"{'speedup':<40} {after / before:8.1f}x")
+        after = run("iter_decompressed_log_lines(threaded)", lambda: count_lines(iter_decompressed_log_lines(archive, args.format, threaded=True)), args.lines)
+        print(f"{'speedup':<40} {after / before:8.1f}x\n")
+
+        print(f"End to end, {args.lines:,} lines")
+        before = run("decompress to disk + memory_mapped", lambda: decompress_then_process(archive, args.format, tmp_dir, lambda path: process_log_file(path, memory_mapped=True)), args.lines)
+        after = run("process_log_file", lambda: process_log_file(archive), args.lines)
+        print(f"{'speedup':<40} {after / before:8.1f}x")
+        after = run("process_log_file(decompress_in_thread)", lambda: process_log_file(archive, decompress_in_thread=True), args.lines)
+        print(f"{'speedup':<40} {after / before:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark: AlertTracker on datetime timestamps vs int epoch microsecond timestamps.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_epoch_timestamps.py [--lines N]
+"""
+
+import argparse
+import io
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+from my_mission_control.alerter.alert_tracker_factory import create_alert_tracker
+from my_mission_control.alerter.log_file_processor_v2 import _process_log_lines
+from my_mission_control.alerter.log_line_parser import parse_log_line, parse_log_line_us
+from my_mission_control.config.settings import InputLogFileCfg
+from my_mission_control.entity.log_entry import LogEntry
+from my_mission_control.utils.epoch_time import datetime_to_epoch_us
+
+
+def run(label: str, func: Callable[[], object], count: int) -> float:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed
+    print(f"{label:<40} {elapsed:8.3f}s {rate:>14,.0f} lines/sec")
+    return rate
+
+
+def track(log_entries: List[LogEntry]):
+    alert_tracker = create_alert_tracker()
+    for log_entry in log_entries:
+        alert_tracker.process_log_entry(log_entry)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark epoch microsecond timestamps in the tracking hot path.")
+    arg_parser.add_argument("--lines", type=int, default=1_000_000, help="Number of log lines (default: 1,000,000)")
+    args = arg_parser.parse_args()
+
+    base_time = datetime(2018, 1, 1, 0, 0, 0)
+    timestamps = [base_time + timedelta(milliseconds=i * 250) for i in range(args.lines)]
+    # Every line violates its limit, so every line goes through the window logic
+    datetime_entries = [LogEntry(ts, 1000 + i % 50, 17, 15, 9, 8, 7.5, "BATT") for i, ts in enumerate(timestamps)]
+    epoch_us_entries = [LogEntry(datetime_to_epoch_us(ts), 1000 + i % 50, 17, 15, 9, 8, 7.5, "BATT") for i, ts in enumerate(timestamps)]
+
+    print(f"AlertTracker.process_log_entry, {args.lines:,} violations")
+    before = run("datetime timestamps", lambda: track(datetime_entries), args.lines)
+    after = run("epoch microsecond timestamps", lambda: track(epoch_us_entries), args.lines)
+    print(f"{'speedup':<40} {after / before:8.1f}x\n")
+
+    log_data = "\n".join(f"{ts.strftime(InputLogFileCfg.LOG_LINE_TIMESTAMP_FORMAT)[:-3]}|{1000 + i % 50}|17|15|9|8|7.5|BATT" for i, ts in enumerate(timestamps))
+    print(f"Parse and track, {args.lines:,} lines")
+    before = run("parse_log_line (datetime)", lambda: _process_log_lines(io.StringIO(log_data), parse_log_line), args.lines)
+    after = run("parse_log_line_us (epoch microseconds)", lambda: _process_log_lines(io.StringIO(log_data), parse_log_line_us), args.lines)
+    print(f"{'speedup':<40} {after / before:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Long-running benchmark: AlertTracker live keys and throughput with and without idle key eviction.
+
+Streams violations from a fleet whose satellites are replaced over time, each satellite reporting for a limited
+number of minutes before it is decommissioned. Without eviction every satellite ever seen keeps its state.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_idle_key_eviction.py [--entries N] [--active N] [--lifetime-minutes N]
+"""
+
+import argparse
+import time
+from datetime import datetime
+from typing import Iterator
+
+from my_mission_control.alerter.alert_strategy import RedHighAlertStrategy, RedLowAlertStrategy
+from my_mission_control.alerter.alert_tracker import AlertTracker
+from my_mission_control.config.settings import InputLogFileCfg
+from my_mission_control.entity.log_entry import LogEntry
+from my_mission_control.utils.epoch_time import datetime_to_epoch_us
+
+
+def make_stream(entries: int, active: int, lifetime_minutes: int) -> Iterator[LogEntry]:
+    """
+    One log entry per second per active satellite, satellites retire after lifetime_minutes.
+    """
+    base_us = datetime_to_epoch_us(datetime(2018, 1, 1, 0, 0, 0))
+    generation_seconds = lifetime_minutes * 60
+    for i in range(entries):
+        second, slot = divmod(i, active)
+        satellite_id = (second // generation_seconds) * active + slot
+        ts = base_us + second * 1_000_000 + slot
+        if i % 2:
+            yield LogEntry(ts, satellite_id, 101, 98, 25, 20, 102.5, InputLogFileCfg.LOG_LINE_COMPONENT_TSTAT)
+        else:
+            yield LogEntry(ts, satellite_id, 17, 15, 9, 8, 7.5 if i % 7 < 3 else 9.5, InputLogFileCfg.LOG_LINE_COMPONENT_BATT)
+
+
+def run(label: str, evict_idle_keys: bool, args: argparse.Namespace):
+    alert_tracker = AlertTracker({InputLogFileCfg.LOG_LINE_COMPONENT_BATT: RedLowAlertStrategy(), InputLogFileCfg.LOG_LINE_COMPONENT_TSTAT: RedHighAlertStrategy()}, evict_idle_keys)
+    alerts = 0
+    start = time.perf_counter()
+    for log_entry in make_stream(args.entries, args.active, args.lifetime_minutes):
+        if alert_tracker.process_log_entry(log_entry):
+            alerts += 1
+    elapsed = time.perf_counter() - start
+    print(f"{label:<20} {elapsed:8.3f}s {args.entries / elapsed:>12,.0f} entries/sec {alerts:>10,} alerts {alert_tracker.live_key_count:>10,} live keys {alert_tracker.evicted_key_count:>10,} evicted")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark AlertTracker idle key eviction on a changing fleet.")
+    arg_parser.add_argument("--entries", type=int, default=3_000_000, help="Number of log entries (default: 3,000,000)")
+    arg_parser.add_argument("--active", type=int, default=500, help="Satellites reporting at any time (default: 500)")
+    arg_parser.add_argument("--lifetime-minutes", type=int, default=10, help="Minutes a satellite reports before it retires (default: 10)")
+    args = arg_parser.parse_args()
+
+    print(f"{args.entries:,} entries, {args.active:,} active satellites, {args.lifetime_minutes} minute lifetime")
+    run("no eviction", False, args)
+    run("idle key eviction", True, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Benchmark: request latency of the ingestion service while large uploads are being processed.
+
+Ground stations stream large uploads in 64 KiB chunks while a probe sends small uploads, then schema requests,
+at a fixed rate, all through the ASGI interface in one event loop. With lines processed on the event loop,
+every chunk holds up the probe for as long as it takes to parse; with the ingestion executor, the event loop
+only splits and routes lines. Worker processes only add parsing capacity when more than one CPU core is available.
+
+Usage:
+    PYTHONPATH=src:benchmarks python benchmarks/bench_ingestion_latency.py [--lines N] [--uploaders N] [--workers N] [--probes N]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from typing import AsyncIterator, Awaitable, Callable, List
+
+import httpx
+from bench_vectorized_alerts import write_log_file
+
+from my_mission_control.api.app import create_app
+from my_mission_control.api.ingestion_executor import IngestionExecutor
+
+CHUNK_SIZE = 65536
+
+
+def read_upload(count: int, satellites: int) -> bytes:
+    fd, path = tempfile.mkstemp(suffix=".log")
+    os.close(fd)
+    try:
+        write_log_file(path, count, satellites)
+        with open(path, "rb") as log_file:
+            return log_file.read()
+    finally:
+        os.remove(path)
+
+
+async def stream_body(data: bytes) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), CHUNK_SIZE):
+        # Yield to the event loop between chunks, as a socket read would
+        await asyncio.sleep(0)
+        yield data[start : start + CHUNK_SIZE]
+
+
+async def upload_until(client: httpx.AsyncClient, data: bytes, stop: asyncio.Event, line_counts: List[int]):
+    while not stop.is_set():
+        response = await client.post("/missions/load/telemetry", content=stream_body(data))
+        response.raise_for_status()
+        line_counts.append(int(response.headers["X-Telemetry-Lines"]))
+
+
+async def timed(send: Callable[[], Awaitable[httpx.Response]], due: float) -> float:
+    response = await send()
+    response.raise_for_status()
+    return time.perf_counter() - due
+
+
+async def probe(send: Callable[[], Awaitable[httpx.Response]], count: int, interval: float) -> List[float]:
+    """
+    Sends requests at a fixed rate without waiting for responses, and times each from when it was due, so a
+    stalled event loop delaying the send counts against the request rather than going unnoticed.
+    """
+    requests = []
+    start = time.perf_counter()
+    for index in range(count):
+        due = start + index * interval
+        await asyncio.sleep(max(0.0, due - time.perf_counter()))
+        requests.append(asyncio.create_task(timed(send, due)))
+    return list(await asyncio.gather(*requests))
+
+
+def report(label: str, latencies: List[float]):
+    latency_ms = sorted(t * 1000 for t in latencies)
+    print(f"{label:<40} {statistics.median(latency_ms):8.2f}ms {latency_ms[int(len(latency_ms) * 0.99) - 1]:8.2f}ms {latency_ms[-1]:8.2f}ms")
+
+
+async def run(label: str, executor: IngestionExecutor, load: bytes, probe_upload: bytes, uploaders: int, probes: int, interval: float) -> None:
+    app = create_app()
+    app.state.ingestion_executor = executor
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        # Warm up the schema cache and the workers, worker processes start on their first chunk
+        await client.get("/openapi.json")
+        await client.post("/missions/probe/telemetry", content=probe_upload)
+
+        stop = asyncio.Event()
+        line_counts: List[int] = []
+        loaders = [asyncio.create_task(upload_until(client, load, stop, line_counts)) for _ in range(uploaders)]
+        start = time.perf_counter()
+        upload_latencies = await probe(lambda: client.post("/missions/probe/telemetry", content=probe_upload), probes, interval)
+        schema_latencies = await probe(lambda: client.get("/openapi.json"), probes, interval)
+        stop.set()
+        await asyncio.gather(*loaders)
+        elapsed = time.perf_counter() - start
+    executor.close()
+
+    print(f"{label:<40} {sum(line_counts) / elapsed:>14,.0f} uploaded lines/sec")
+    report("  small upload p50 / p99 / max", upload_latencies)
+    report("  schema request p50 / p99 / max", schema_latencies)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark request latency of the ingestion service under upload load.")
+    arg_parser.add_argument("--lines", type=int, default=100_000, help="Lines per large upload (default: 100,000)")
+    arg_parser.add_argument("--satellites", type=int, default=50, help="Distinct satellite ids (default: 50)")
+    arg_parser.add_argument("--uploaders", type=int, default=4, help="Concurrent large uploads (default: 4)")
+    arg_parser.add_argument("--workers", type=int, default=2, help="Ingestion workers (default: 2)")
+    arg_parser.add_argument("--probes", type=int, default=200, help="Requests per probe (default: 200)")
+    arg_parser.add_argument("--interval-ms", type=float, default=20, help="Interval between probe requests (default: 20)")
+    args = arg_parser.parse_args()
+
+    load = read_upload(args.lines, args.satellites)
+    probe_upload = read_upload(10, args.satellites)
+    interval = args.interval_ms / 1000
+    print(f"{args.uploaders} uploads of {args.lines:,} lines ({len(load) / 1e6:.1f} MB) at a time, {os.cpu_count()} CPU cores")
+    print()
+
+    modes = [
+        ("no load, event loop", IngestionExecutor(0), 0),
+        ("event loop", IngestionExecutor(0), args.uploaders),
+        (f"{args.workers} worker threads", IngestionExecutor(args.workers, "thread"), args.uploaders),
+        (f"{args.workers} worker processes", IngestionExecutor(args.workers, "process"), args.uploaders),
+    ]
+    for label, executor, uploaders in modes:
+        asyncio.run(run(label, executor, load, probe_upload, uploaders, args.probes, interval))
+        print()
+
+
+if __name__ == "__main__":
+    main()
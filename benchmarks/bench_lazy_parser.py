@@ -0,0 +1,58 @@
+"""
+Benchmark: full parse of every line vs lazy two-phase parsing, on mostly nominal telemetry.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_lazy_parser.py [--lines N] [--violation-rate R]
+"""
+
+import argparse
+import io
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+from my_mission_control.alerter.log_file_processor_v2 import _process_log_lines, _process_log_lines_lazy
+from my_mission_control.config.settings import InputLogFileCfg
+
+
+def make_log_data(count: int, violation_rate: float) -> str:
+    """
+    Generates telemetry lines where one line in 1 / violation_rate violates its red limit.
+    """
+    base_time = datetime(2018, 1, 1, 0, 0, 0)
+    every = max(1, round(1 / violation_rate)) if violation_rate > 0 else count + 1
+    lines: List[str] = []
+    for i in range(count):
+        ts = (base_time + timedelta(milliseconds=i * 250)).strftime(InputLogFileCfg.LOG_LINE_TIMESTAMP_FORMAT)[:-3]
+        if i % 2:
+            lines.append(f"{ts}|{1000 + i % 50}|17|15|9|8|{7.5 if i % every == 1 else 12.5}|BATT")
+        else:
+            lines.append(f"{ts}|{1000 + i % 50}|101|98|25|20|{101.5 if i % every == 0 else 50.5}|TSTAT")
+    return "\n".join(lines)
+
+
+def run(label: str, func: Callable[[], List], count: int) -> float:
+    start = time.perf_counter()
+    alerts = func()
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed
+    print(f"{label:<40} {elapsed:8.3f}s {rate:>14,.0f} lines/sec {len(alerts):>10,} alerts")
+    return rate
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark lazy log line parsing.")
+    arg_parser.add_argument("--lines", type=int, default=1_000_000, help="Number of log lines (default: 1,000,000)")
+    arg_parser.add_argument("--violation-rate", type=float, default=0.01, help="Fraction of violating lines (default: 0.01)")
+    args = arg_parser.parse_args()
+
+    log_data = make_log_data(args.lines, args.violation_rate)
+
+    print(f"{args.lines:,} lines, violation rate {args.violation_rate}")
+    before = run("_process_log_lines", lambda: _process_log_lines(io.StringIO(log_data)), args.lines)
+    after = run("_process_log_lines_lazy", lambda: _process_log_lines_lazy(io.StringIO(log_data)), args.lines)
+    print(f"{'speedup':<40} {after / before:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
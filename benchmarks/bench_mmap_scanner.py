@@ -0,0 +1,84 @@
+"""
+Benchmark: text-mode line reading vs the memory-mapped bytes scanner.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_mmap_scanner.py [--lines N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+
+from my_mission_control.alerter.log_file_processor_v2 import process_log_file
+from my_mission_control.alerter.log_file_scanner import iter_log_lines_mmap
+from my_mission_control.alerter.log_line_parser import parse_log_line, parse_log_line_bytes
+from my_mission_control.config.settings import InputLogFileCfg
+
+
+def write_log_file(path: str, count: int):
+    """
+    Writes a telemetry log with a violation on one line in ten.
+    """
+    base_time = datetime(2018, 1, 1, 0, 0, 0)
+    with open(path, "w") as log_file:
+        for i in range(count):
+            ts = (base_time + timedelta(milliseconds=i * 250)).strftime(InputLogFileCfg.LOG_LINE_TIMESTAMP_FORMAT)[:-3]
+            log_file.write(f"{ts}|{1000 + i % 50}|17|15|9|8|{7.5 if i % 10 == 0 else 12.5}|BATT\n")
+
+
+def run(label: str, func: Callable[[], object], count: int) -> float:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed
+    print(f"{label:<40} {elapsed:8.3f}s {rate:>14,.0f} lines/sec")
+    return rate
+
+
+def read_text(path: str):
+    with open(path, "r") as log_lines:
+        for _ in log_lines:
+            pass
+
+
+def parse_text(path: str):
+    with open(path, "r") as log_lines:
+        for line in log_lines:
+            parse_log_line(line)
+
+
+def parse_mmap(path: str):
+    for line in iter_log_lines_mmap(path):
+        parse_log_line_bytes(line)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark the memory-mapped log file scanner.")
+    arg_parser.add_argument("--lines", type=int, default=2_000_000, help="Number of log lines (default: 2,000,000)")
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "telemetry.log")
+        write_log_file(path, args.lines)
+
+        print(f"Read lines, {args.lines:,} lines")
+        before = run("text mode", lambda: read_text(path), args.lines)
+        after = run("iter_log_lines_mmap", lambda: sum(1 for _ in iter_log_lines_mmap(path)), args.lines)
+        print(f"{'speedup':<40} {after / before:8.1f}x\n")
+
+        print(f"Read and parse lines, {args.lines:,} lines")
+        before = run("text mode + parse_log_line", lambda: parse_text(path), args.lines)
+        after = run("mmap + parse_log_line_bytes", lambda: parse_mmap(path), args.lines)
+        print(f"{'speedup':<40} {after / before:8.1f}x\n")
+
+        print(f"End to end, {args.lines:,} lines")
+        before = run("process_log_file", lambda: process_log_file(path), args.lines)
+        after = run("process_log_file(memory_mapped=True)", lambda: process_log_file(path, memory_mapped=True), args.lines)
+        print(f"{'speedup':<40} {after / before:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
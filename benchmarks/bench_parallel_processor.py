@@ -0,0 +1,47 @@
+"""
+Benchmark: sequential process_log_file vs byte-range parallel processing with a growing number of workers.
+
+Usage:
+    PYTHONPATH=src:benchmarks python benchmarks/bench_parallel_processor.py [--lines N] [--workers N ...]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Callable, List
+
+from bench_vectorized_alerts import write_log_file
+
+from my_mission_control.alerter.log_file_processor_v2 import process_log_file
+from my_mission_control.alerter.parallel_log_processor import process_log_file_parallel
+
+
+def run(label: str, func: Callable[[], List], count: int) -> float:
+    start = time.perf_counter()
+    alerts = func()
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed
+    print(f"{label:<40} {elapsed:8.3f}s {rate:>14,.0f} lines/sec {len(alerts):>10,} alerts")
+    return rate
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark parallel log file processing.")
+    arg_parser.add_argument("--lines", type=int, default=2_000_000, help="Number of log lines (default: 2,000,000)")
+    arg_parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, os.cpu_count() or 1], help="Worker counts to measure (default: 2 4 <cpu count>)")
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "telemetry.log")
+        write_log_file(path, args.lines, 100)
+
+        print(f"End to end, {args.lines:,} lines, {os.cpu_count()} cpus")
+        before = run("process_log_file", lambda: process_log_file(path), args.lines)
+        for workers in args.workers:
+            after = run(f"process_log_file_parallel({workers})", lambda: process_log_file_parallel(path, workers), args.lines)
+            print(f"{'speedup':<40} {after / before:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark: sequential process_log_file vs satellite-sharded processing, across fleet sizes and worker counts.
+
+Usage:
+    PYTHONPATH=src:benchmarks python benchmarks/bench_sharded_processor.py [--lines N] [--satellites N ...] [--workers N ...]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Callable, List
+
+from bench_vectorized_alerts import write_log_file
+
+from my_mission_control.alerter.log_file_processor_v2 import process_log_file
+from my_mission_control.alerter.sharded_log_processor import process_log_file_sharded
+
+
+def run(label: str, func: Callable[[], List], count: int) -> float:
+    start = time.perf_counter()
+    alerts = func()
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed
+    print(f"{label:<40} {elapsed:8.3f}s {rate:>14,.0f} lines/sec {len(alerts):>10,} alerts")
+    return rate
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark satellite-sharded log file processing.")
+    arg_parser.add_argument("--lines", type=int, default=2_000_000, help="Number of log lines (default: 2,000,000)")
+    arg_parser.add_argument("--satellites", type=int, nargs="+", default=[100, 10_000], help="Fleet sizes to measure (default: 100 10000)")
+    arg_parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, os.cpu_count() or 1], help="Worker counts to measure (default: 2 4 <cpu count>)")
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for satellites in args.satellites:
+            path = os.path.join(tmp_dir, f"telemetry-{satellites}.log")
+            write_log_file(path, args.lines, satellites)
+
+            print(f"End to end, {args.lines:,} lines, {satellites:,} satellites, {os.cpu_count()} cpus")
+            before = run("process_log_file", lambda: process_log_file(path), args.lines)
+            for workers in args.workers:
+                after = run(f"process_log_file_sharded({workers})", lambda: process_log_file_sharded(path, workers), args.lines)
+                print(f"{'speedup':<40} {after / before:8.1f}x")
+            print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Output benchmark: collecting all alerts then json.dumps(indent=4) vs streaming NDJSON through iter_alerts.
+
+Reports time to first alert, total time and peak traced memory of each output path.
+
+Usage:
+    PYTHONPATH=src:benchmarks python benchmarks/bench_streaming_output.py [--lines N] [--satellites N]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from bench_vectorized_alerts import write_log_file
+
+from my_mission_control.alerter.log_file_processor_v2 import iter_alerts, process_log_file
+from my_mission_control.utils.alert_writer import write_alerts_ndjson
+
+
+class FirstWriteTimer:
+    """
+    Discarding binary stream that records when it is first written to.
+    """
+
+    def __init__(self):
+        self.first_write = None
+
+    def write(self, data: bytes) -> int:
+        if self.first_write is None:
+            self.first_write = time.perf_counter()
+        return len(data)
+
+    def flush(self):
+        pass
+
+
+def run_json(log_file: str):
+    start = time.perf_counter()
+    output = json.dumps(process_log_file(log_file), indent=4).encode()
+    first_write = time.perf_counter()
+    FirstWriteTimer().write(output)
+    return start, first_write
+
+
+def run_ndjson(log_file: str):
+    stream = FirstWriteTimer()
+    start = time.perf_counter()
+    write_alerts_ndjson(iter_alerts(log_file), stream)
+    return start, stream.first_write
+
+
+def measure(label: str, func, log_file: str):
+    tracemalloc.start()
+    start, first_write = func(log_file)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} first alert {(first_write - start) * 1000:10.1f} ms   total {elapsed:8.3f}s   peak {peak / 2**20:8.1f} MiB")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark JSON vs streaming NDJSON alert output.")
+    arg_parser.add_argument("--lines", type=int, default=1_000_000, help="Number of log lines (default: 1,000,000)")
+    arg_parser.add_argument("--satellites", type=int, default=100, help="Number of distinct satellites (default: 100)")
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        log_file = os.path.join(directory, "telemetry.log")
+        write_log_file(log_file, args.lines, args.satellites)
+        print(f"{args.lines:,} lines, {args.satellites:,} satellites")
+        measure("list + json.dumps(indent=4)", run_json, log_file)
+        measure("iter_alerts + NDJSON", run_ndjson, log_file)
+
+
+if __name__ == "__main__":
+    main()
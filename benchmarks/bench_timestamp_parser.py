@@ -0,0 +1,65 @@
+"""
+Microbenchmark: log line timestamp decoding, datetime.strptime vs the fixed-width parser.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_timestamp_parser.py [--lines N]
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+from my_mission_control.alerter.log_line_parser import parse_log_line
+from my_mission_control.alerter.timestamp_parser import parse_log_timestamp
+from my_mission_control.config.settings import InputLogFileCfg
+
+
+def make_timestamps(count: int) -> List[str]:
+    """
+    Generates log line timestamps one second apart, spanning several days for large counts.
+    """
+    base_time = datetime(2018, 1, 1, 0, 0, 0)
+    return [(base_time + timedelta(seconds=i, milliseconds=i % 1000)).strftime(InputLogFileCfg.LOG_LINE_TIMESTAMP_FORMAT)[:-3] for i in range(count)]
+
+
+def run(label: str, func: Callable[[str], object], items: List[str]) -> float:
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    elapsed = time.perf_counter() - start
+    rate = len(items) / elapsed
+    print(f"{label:<40} {elapsed:8.3f}s {rate:>14,.0f} lines/sec")
+    return rate
+
+
+def strptime_parse_log_line(line: str):
+    """
+    Baseline parse_log_line, as it was before the fixed-width timestamp parser.
+    """
+    ts_str, sat_id, rhl, yhl, yll, rll, val, cmpnt = line.strip().split(InputLogFileCfg.LOG_LINE_DELIMITER)
+    return (datetime.strptime(ts_str, InputLogFileCfg.LOG_LINE_TIMESTAMP_FORMAT), int(sat_id), int(rhl), int(yhl), int(yll), int(rll), float(val), cmpnt)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark log line timestamp parsing.")
+    arg_parser.add_argument("--lines", type=int, default=2_000_000, help="Number of lines to parse (default: 2,000,000)")
+    args = arg_parser.parse_args()
+
+    timestamps = make_timestamps(args.lines)
+    lines = [f"{ts}|1000|17|15|9|8|7.8|BATT" for ts in timestamps]
+    strptime_format = InputLogFileCfg.LOG_LINE_TIMESTAMP_FORMAT
+
+    print(f"Timestamps only, {args.lines:,} lines")
+    before = run("datetime.strptime", lambda ts: datetime.strptime(ts, strptime_format), timestamps)
+    after = run("parse_log_timestamp", parse_log_timestamp, timestamps)
+    print(f"{'speedup':<40} {after / before:8.1f}x\n")
+
+    print(f"Full line parse, {args.lines:,} lines")
+    before = run("split + strptime (baseline)", strptime_parse_log_line, lines)
+    after = run("parse_log_line", parse_log_line, lines)
+    print(f"{'speedup':<40} {after / before:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Memory benchmark: AlertTracker state per (satellite, component) key for large fleets.
+
+Compares the flat state table keyed by packed (satellite_id, component_code) integers with the former nested
+defaultdict-of-lambdas layout holding deques of datetimes, for a fleet where every satellite reports a couple of
+violations per component and never alerts.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_tracker_state_memory.py [--satellites N] [--violations N]
+"""
+
+import argparse
+import tracemalloc
+from collections import defaultdict, deque
+from datetime import datetime, timedelta
+from typing import Callable, Deque, Dict, List, Optional
+
+from my_mission_control.alerter.alert_tracker import TIME_DELTA
+from my_mission_control.alerter.alert_tracker_factory import create_alert_tracker
+from my_mission_control.config.settings import InputLogFileCfg
+from my_mission_control.entity.log_entry import LogEntry
+from my_mission_control.utils.epoch_time import datetime_to_epoch_us
+
+COMPONENTS = (InputLogFileCfg.LOG_LINE_COMPONENT_BATT, InputLogFileCfg.LOG_LINE_COMPONENT_TSTAT)
+
+
+class NestedStateTracker:
+    """
+    Baseline state layout, as AlertTracker kept it before the flat state table.
+    """
+
+    def __init__(self):
+        self.alert_timestamps: Dict[int, Dict[str, Deque[datetime]]] = defaultdict(lambda: defaultdict(deque))
+        self.last_alert_timestamp: Dict[int, Dict[str, Optional[datetime]]] = defaultdict(lambda: defaultdict(lambda: None))
+
+    def process_log_entry(self, log_entry: LogEntry):
+        timestamps_dq = self.alert_timestamps[log_entry.satellite_id][log_entry.component]
+        timestamps_dq.append(log_entry.timestamp)
+        while timestamps_dq and (log_entry.timestamp - timestamps_dq[0]) > TIME_DELTA:
+            timestamps_dq.popleft()
+        self.last_alert_timestamp[log_entry.satellite_id][log_entry.component]
+
+
+def make_violations(satellites: int, violations: int, epoch_us: bool) -> List[LogEntry]:
+    base_time = datetime(2018, 1, 1, 0, 0, 0)
+    log_entries = []
+    for violation in range(violations):
+        ts = base_time + timedelta(minutes=10 * violation)
+        timestamp = datetime_to_epoch_us(ts) if epoch_us else ts
+        for sat_id in range(satellites):
+            log_entries.append(LogEntry(timestamp, sat_id, 101, 98, 25, 20, 102.5, InputLogFileCfg.LOG_LINE_COMPONENT_TSTAT))
+            log_entries.append(LogEntry(timestamp, sat_id, 17, 15, 9, 8, 7.5, InputLogFileCfg.LOG_LINE_COMPONENT_BATT))
+    return log_entries
+
+
+def measure(label: str, make_tracker: Callable[[], object], log_entries: List[LogEntry], keys: int):
+    tracemalloc.start()
+    tracker = make_tracker()
+    for log_entry in log_entries:
+        tracker.process_log_entry(log_entry)  # type: ignore[attr-defined]
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<32} {memory / 2**20:10.1f} MiB {memory / keys:8,.0f} B/key")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark AlertTracker state memory for large fleets.")
+    arg_parser.add_argument("--satellites", type=int, default=100_000, help="Number of satellites (default: 100,000)")
+    arg_parser.add_argument("--violations", type=int, default=2, help="Violations per (satellite, component), 10 minutes apart (default: 2)")
+    args = arg_parser.parse_args()
+
+    keys = args.satellites * len(COMPONENTS)
+    print(f"{args.satellites:,} satellites, {keys:,} keys, {args.violations} violations per key")
+    measure("nested defaultdict + deque", NestedStateTracker, make_violations(args.satellites, args.violations, epoch_us=False), keys)
+    measure("flat state table", create_alert_tracker, make_violations(args.satellites, args.violations, epoch_us=True), keys)
+
+
+if __name__ == "__main__":
+    main()
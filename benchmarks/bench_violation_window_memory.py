@@ -0,0 +1,71 @@
+"""
+Memory benchmark: per (satellite, component) window state, deque of datetimes vs ViolationWindow ring buffers.
+
+Feeds synthetic violation storms to many keys and reports traced memory of the window state, during the storm
+(every key at its peak) and once the storm has passed (one late violation per key).
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_violation_window_memory.py [--keys N] [--storm N]
+"""
+
+import argparse
+import tracemalloc
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+from my_mission_control.alerter.alert_tracker import TIME_DELTA, TIME_DELTA_US
+from my_mission_control.alerter.violation_window import ViolationWindow
+from my_mission_control.utils.epoch_time import datetime_to_epoch_us
+
+
+def deque_add(windows: Dict[int, deque], key: int, ts: datetime):
+    """
+    Baseline window update, as AlertTracker did it before ViolationWindow.
+    """
+    window = windows.setdefault(key, deque())
+    window.append(ts)
+    while window and ts - window[0] > TIME_DELTA:
+        window.popleft()
+
+
+def ring_add(windows: Dict[int, ViolationWindow], key: int, ts: datetime):
+    window = windows.get(key)
+    if window is None:
+        window = windows[key] = ViolationWindow()
+    window.add(datetime_to_epoch_us(ts), TIME_DELTA_US)
+
+
+def measure(label: str, add: Callable[[Dict, int, datetime], None], keys: int, storm: List[datetime], after_storm: datetime):
+    tracemalloc.start()
+    windows: Dict = {}
+    # Every log line is parsed into its own datetime object
+    for ts in storm:
+        for key in range(keys):
+            add(windows, key, ts.replace())
+    during, _ = tracemalloc.get_traced_memory()
+    for key in range(keys):
+        add(windows, key, after_storm.replace())
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<24} storm {during / 2**20:10.1f} MiB {during / keys:10,.0f} B/key   after {after / 2**20:10.1f} MiB {after / keys:10,.0f} B/key")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark violation window memory under storms.")
+    arg_parser.add_argument("--keys", type=int, default=10_000, help="Number of (satellite, component) keys (default: 10,000)")
+    arg_parser.add_argument("--storm", type=int, default=200, help="Violations per key within one time window (default: 200)")
+    args = arg_parser.parse_args()
+
+    base_time = datetime(2018, 1, 1, 0, 0, 0)
+    step = TIME_DELTA / (args.storm + 1)
+    storm = [base_time + step * i for i in range(args.storm)]
+    after_storm = base_time + 3 * TIME_DELTA + timedelta(seconds=1)
+
+    print(f"{args.keys:,} keys, {args.storm:,} violations per key within {TIME_DELTA}")
+    measure("deque[datetime]", deque_add, args.keys, storm, after_storm)
+    measure("ViolationWindow", ring_add, args.keys, storm, after_storm)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""
+Declarative alert rules, loaded from a TOML rule table and compiled into alert evaluation strategies.
+
+Each rule names a component, the limit its raw value is compared with, the comparison, the severity to
+report, and how many violations within how many minutes raise an alert:
+
+    [[rules]]
+    component = "BATT"
+    limit = "red_low_limit"
+    comparison = "<"
+    severity = "RED LOW"
+    threshold = 3
+    window_minutes = 5
+
+A rule with bands = true instead of limit, comparison and severity classifies readings into the RED LOW,
+YELLOW LOW, YELLOW HIGH and RED HIGH bands with one comparison ladder, each band alerting on its own windows:
+
+    [[rules]]
+    component = "TSTAT"
+    bands = true
+    threshold = 3
+    window_minutes = 5
+
+Rules are validated and compiled once, into a dispatch table mapping each component to a strategy holding its
+comparison function, limit getter, threshold and window in integer microseconds. Evaluating a line is one
+dict lookup on the component whatever the number of rules, and a component without a rule misses that lookup.
+"""
+
+import math
+import operator
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import tomli as toml
+
+from my_mission_control.alerter.alert_strategy import NO_SEVERITY, AlertEvalStrategy, SeverityBandAlertStrategy
+from my_mission_control.alerter.log_batch_parser import LogColumns
+from my_mission_control.entity.log_entry import LogEntry
+
+MICROSECONDS_PER_MINUTE = 60_000_000
+
+LIMIT_FIELDS = ("red_high_limit", "yellow_high_limit", "yellow_low_limit", "red_low_limit")
+
+# Comparison of the raw value with the limit, per row and column-wise
+_COMPARISONS: Dict[str, Tuple[Callable[[Any, Any], bool], np.ufunc]] = {
+    "<": (operator.lt, np.less),
+    "<=": (operator.le, np.less_equal),
+    ">": (operator.gt, np.greater),
+    ">=": (operator.ge, np.greater_equal),
+}
+
+_RULE_KEYS = {"component", "limit", "comparison", "severity", "threshold", "window_minutes"}
+_BAND_RULE_KEYS = {"component", "bands", "threshold", "window_minutes"}
+
+
+class ComparisonAlertStrategy(AlertEvalStrategy):
+    """
+    Evaluates whether a log entry value compares true against one of its limits, compiled from a rule.
+    """
+
+    def __init__(self, limit_field: str, comparison: str, severity: str, threshold: int, window_us: int):
+        """
+        Initializes the strategy.
+
+        Args:
+            limit_field (str): LogEntry field holding the limit, one of LIMIT_FIELDS.
+            comparison (str): Comparison of the raw value with the limit, one of <, <=, > and >=.
+            severity (str): Severity reported when the comparison holds.
+            threshold (int): Number of violations within the window that raises an alert.
+            window_us (int): Length of the alert time window in microseconds.
+        """
+        self.limit_field = limit_field
+        self.comparison = comparison
+        self.severity = severity
+        self.threshold = threshold
+        self.window_us = window_us
+        self.required_fields = ("raw_value", limit_field)
+        self._limit = attrgetter(limit_field)
+        self._compare, self._compare_columns = _COMPARISONS[comparison]
+
+    def evaluate(self, log_entry: LogEntry) -> Optional[str]:
+        """
+        Returns the rule severity if the raw value compares true against the limit
+        """
+        if self._compare(log_entry.raw_value, self._limit(log_entry)):
+            return self.severity
+        return None
+
+    def evaluate_batch(self, columns: LogColumns, rows: np.ndarray) -> Tuple[np.ndarray, Sequence[str]]:
+        """
+        Returns code 0, the rule severity, for the rows whose raw value compares true against the limit
+        """
+        violations = self._compare_columns(columns.raw_value[rows], getattr(columns, self.limit_field)[rows])
+        return np.where(violations, 0, NO_SEVERITY).astype(np.int8), (self.severity,)
+
+
+def _compile_rule(rule: Mapping[str, Any]) -> Tuple[str, AlertEvalStrategy]:
+    """
+    Validates one rule and compiles it into the strategy of its component.
+
+    Raises:
+        ValueError: If a key is missing or unknown, or a value is invalid.
+    """
+    bands = rule.get("bands", False)
+    rule_keys = _BAND_RULE_KEYS if bands is True else _RULE_KEYS
+    missing = rule_keys - rule.keys()
+    unknown = rule.keys() - rule_keys
+    if missing or unknown:
+        raise ValueError(f"Alert rule {dict(rule)} has missing keys {sorted(missing)} or unknown keys {sorted(unknown)}")
+
+    component, threshold, window_minutes = rule["component"], rule["threshold"], rule["window_minutes"]
+    if not isinstance(component, str) or not component:
+        raise ValueError(f"Alert rule component must be a non-empty string, got {component!r}")
+    if type(threshold) is not int or threshold < 1:
+        raise ValueError(f"Alert rule threshold of {component} must be a positive integer, got {threshold!r}")
+    if type(window_minutes) not in (int, float) or not math.isfinite(window_minutes) or not window_minutes > 0:
+        raise ValueError(f"Alert rule window_minutes of {component} must be a positive finite number, got {window_minutes!r}")
+    window_us = round(window_minutes * MICROSECONDS_PER_MINUTE)
+    if window_us < 1:
+        raise ValueError(f"Alert rule window_minutes of {component} must be at least one microsecond, got {window_minutes!r}")
+    if bands is True:
+        return component, SeverityBandAlertStrategy(threshold, window_us)
+
+    limit_field, comparison, severity = rule["limit"], rule["comparison"], rule["severity"]
+    if limit_field not in LIMIT_FIELDS:
+        raise ValueError(f"Alert rule limit of {component} must be one of {', '.join(LIMIT_FIELDS)}, got {limit_field!r}")
+    if comparison not in _COMPARISONS:
+        raise ValueError(f"Alert rule comparison of {component} must be one of {', '.join(_COMPARISONS)}, got {comparison!r}")
+    if not isinstance(severity, str) or not severity:
+        raise ValueError(f"Alert rule severity of {component} must be a non-empty string, got {severity!r}")
+
+    return component, ComparisonAlertStrategy(limit_field, comparison, severity, threshold, window_us)
+
+
+def compile_alert_rules(rules: List[Mapping[str, Any]]) -> Dict[str, AlertEvalStrategy]:
+    """
+    Compiles alert rules into a dispatch table of component names to alert evaluation strategies.
+
+    Args:
+        rules (List[Mapping[str, Any]]): Rules as parsed from the rules array of a rule table.
+
+    Returns:
+        Dict[str, AlertEvalStrategy]: Strategy of each component, to initialize an AlertTracker with.
+
+    Raises:
+        ValueError: If a rule is invalid, or a component has more than one rule.
+    """
+    alert_eval_strategy_map: Dict[str, AlertEvalStrategy] = {}
+    for rule in rules:
+        if not isinstance(rule, Mapping):
+            raise ValueError(f"Alert rule must be a table, got {rule!r}")
+        component, strategy = _compile_rule(rule)
+        if component in alert_eval_strategy_map:
+            raise ValueError(f"Duplicate alert rule for component {component}")
+        alert_eval_strategy_map[component] = strategy
+    return alert_eval_strategy_map
+
+
+def load_alert_rules(rules_file: str) -> Dict[str, AlertEvalStrategy]:
+    """
+    Reads a TOML rule table and compiles its rules.
+
+    Args:
+        rules_file (str): Path to a TOML file with a rules array of tables.
+
+    Returns:
+        Dict[str, AlertEvalStrategy]: Strategy of each component, to initialize an AlertTracker with.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not valid TOML, or holds no rules or an invalid rule.
+    """
+    with open(rules_file, "rb") as rule_table:
+        try:
+            rules = toml.load(rule_table).get("rules")
+        except toml.TOMLDecodeError as e:
+            raise ValueError(f"Invalid alert rule table {rules_file} - {e}") from e
+    if not isinstance(rules, list) or not rules:
+        raise ValueError(f"Alert rule table {rules_file} has no [[rules]]")
+    return compile_alert_rules(rules)
@@ -5,27 +5,72 @@ Implements the Strategy Pattern to support flexible and extensible alert evaluat
 """
 
 from abc import ABC
-from typing import Optional
+from dataclasses import fields
+from typing import Dict, Optional, Sequence, Tuple
 
-from my_mission_control.config.settings import AlertOutputCfg
+import numpy as np
+from structlog.stdlib import get_logger
+
+from my_mission_control.alerter.log_batch_parser import LogColumns
+from my_mission_control.config.settings import AlertOutputCfg, AlertRuleCfg
 from my_mission_control.entity.log_entry import LogEntry
 
+logger = get_logger(__name__)
+
+# Severity code of rows that trigger no alert in evaluate_batch results
+NO_SEVERITY = -1
+
 
 class AlertEvalStrategy(ABC):
     """
     Abstract base for alert evaluation strategy.
         Extend this class to implement custom alert evaluation for the log entry
+
+    required_fields names the LogEntry fields evaluate reads. Lazy parsing decodes only these fields
+    before evaluating a line, so strategies reading fewer fields should narrow it.
+
+    evaluate_batch evaluates many rows of a LogColumns chunk at once. The default calls evaluate row by row,
+    strategies whose condition is a comparison of columns should override it with NumPy operations.
+
+    threshold and window_us are the alert rule of the component the strategy is mapped to: an alert is raised
+    when threshold violations fall within window_us microseconds. They default to the global AlertRuleCfg rule.
     """
 
+    required_fields: Tuple[str, ...] = tuple(field.name for field in fields(LogEntry))
+    threshold: int = AlertRuleCfg.ALERT_VIOLATION_COUNT_THRESHOLD
+    window_us: int = AlertRuleCfg.ALERT_VIOLATION_TIME_WINDOW_MINUTES * 60_000_000
+
     def evaluate(self, log_entry: LogEntry) -> Optional[str]:
         pass
 
+    def evaluate_batch(self, columns: LogColumns, rows: np.ndarray) -> Tuple[np.ndarray, Sequence[str]]:
+        """
+        Evaluates rows of a chunk of parsed log lines, the same way evaluate does one log entry.
+
+        Args:
+            columns (LogColumns): A chunk of parsed log lines.
+            rows (np.ndarray): Indices of the rows to evaluate, all of a component this strategy applies to.
+
+        Returns:
+            Tuple[np.ndarray, Sequence[str]]: Severity code per evaluated row, NO_SEVERITY where no alert condition
+                is met, and the severities the codes index.
+        """
+        severity_codes: Dict[str, int] = {}
+        codes = np.full(len(rows), NO_SEVERITY, dtype=np.int8)
+        for position, log_entry in enumerate(columns.log_entries(rows)):
+            severity = self.evaluate(log_entry)
+            if severity:
+                codes[position] = severity_codes.setdefault(severity, len(severity_codes))
+        return codes, tuple(severity_codes)
+
 
 class RedLowAlertStrategy(AlertEvalStrategy):
     """
     Evaluates whether a log entry value is below red-low-limit
     """
 
+    required_fields = ("raw_value", "red_low_limit")
+
     def evaluate(self, log_entry: LogEntry) -> Optional[str]:
         """
         Returns 'RED LOW' if condition is met
@@ -34,12 +79,21 @@ class RedLowAlertStrategy(AlertEvalStrategy):
             return AlertOutputCfg.SEVERITY_RED_LOW
         return None
 
+    def evaluate_batch(self, columns: LogColumns, rows: np.ndarray) -> Tuple[np.ndarray, Sequence[str]]:
+        """
+        Returns code 0, 'RED LOW', for the rows below their red-low-limit
+        """
+        violations = columns.raw_value[rows] < columns.red_low_limit[rows]
+        return np.where(violations, 0, NO_SEVERITY).astype(np.int8), (AlertOutputCfg.SEVERITY_RED_LOW,)
+
 
 class RedHighAlertStrategy(AlertEvalStrategy):
     """
     Evaluates whether a log entry value is abor red-high-limit
     """
 
+    required_fields = ("raw_value", "red_high_limit")
+
     def evaluate(self, log_entry: LogEntry) -> Optional[str]:
         """
         Returns 'RED HIGH' if condition is met
@@ -47,3 +101,95 @@ class RedHighAlertStrategy(AlertEvalStrategy):
         if log_entry.raw_value > log_entry.red_high_limit:
             return AlertOutputCfg.SEVERITY_RED_HIGH
         return None
+
+    def evaluate_batch(self, columns: LogColumns, rows: np.ndarray) -> Tuple[np.ndarray, Sequence[str]]:
+        """
+        Returns code 0, 'RED HIGH', for the rows above their red-high-limit
+        """
+        violations = columns.raw_value[rows] > columns.red_high_limit[rows]
+        return np.where(violations, 0, NO_SEVERITY).astype(np.int8), (AlertOutputCfg.SEVERITY_RED_HIGH,)
+
+
+class SeverityBandAlertStrategy(AlertEvalStrategy):
+    """
+    Classifies a log entry value into a severity band, from red-low to red-high, with one comparison ladder
+
+    Readings between the yellow limits are nominal. Each band of a satellite component has its own violation
+    window in AlertTracker, so red and yellow excursions alert independently.
+    """
+
+    required_fields = ("raw_value", "red_high_limit", "yellow_high_limit", "yellow_low_limit", "red_low_limit")
+
+    # Severities in ladder order, the severity codes of evaluate_batch
+    severities = (AlertOutputCfg.SEVERITY_RED_LOW, AlertOutputCfg.SEVERITY_YELLOW_LOW, AlertOutputCfg.SEVERITY_RED_HIGH, AlertOutputCfg.SEVERITY_YELLOW_HIGH)
+
+    def __init__(self, threshold: int = AlertEvalStrategy.threshold, window_us: int = AlertEvalStrategy.window_us):
+        """
+        Initializes the strategy with the alert rule shared by all bands.
+
+        Args:
+            threshold (int): Number of violations of one band within the window that raises an alert.
+            window_us (int): Length of the alert time window in microseconds.
+        """
+        self.threshold = threshold
+        self.window_us = window_us
+
+    def evaluate(self, log_entry: LogEntry) -> Optional[str]:
+        """
+        Returns 'RED LOW', 'YELLOW LOW', 'RED HIGH' or 'YELLOW HIGH', the first band whose limit the value crosses
+        """
+        raw_value = log_entry.raw_value
+        if raw_value < log_entry.red_low_limit:
+            return AlertOutputCfg.SEVERITY_RED_LOW
+        if raw_value < log_entry.yellow_low_limit:
+            return AlertOutputCfg.SEVERITY_YELLOW_LOW
+        if raw_value > log_entry.red_high_limit:
+            return AlertOutputCfg.SEVERITY_RED_HIGH
+        if raw_value > log_entry.yellow_high_limit:
+            return AlertOutputCfg.SEVERITY_YELLOW_HIGH
+        return None
+
+    def evaluate_batch(self, columns: LogColumns, rows: np.ndarray) -> Tuple[np.ndarray, Sequence[str]]:
+        """
+        Returns the code of the band of each row in severities order, the first condition that holds wins
+        """
+        raw_value = columns.raw_value[rows]
+        conditions = [
+            raw_value < columns.red_low_limit[rows],
+            raw_value < columns.yellow_low_limit[rows],
+            raw_value > columns.red_high_limit[rows],
+            raw_value > columns.yellow_high_limit[rows],
+        ]
+        return np.select(conditions, np.arange(len(conditions), dtype=np.int8), NO_SEVERITY).astype(np.int8), self.severities
+
+
+def evaluate_log_columns(columns: LogColumns, alert_eval_strategy_map: Dict[str, AlertEvalStrategy]) -> Tuple[np.ndarray, np.ndarray, Tuple[str, ...]]:
+    """
+    Evaluates a chunk of parsed log lines with the strategy of each component and keeps the violation rows.
+
+    Components without a strategy are skipped with a warning.
+
+    Args:
+        columns (LogColumns): A chunk of parsed log lines.
+        alert_eval_strategy_map (Dict[str, AlertEvalStrategy]): Mapping of component names to their alert evaluation strategies.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, Tuple[str, ...]]: Indices of the violation rows in ascending order, the severity
+            code of each, and the severities the codes index.
+    """
+    severity_codes: Dict[str, int] = {}
+    row_severity = np.full(len(columns), NO_SEVERITY, dtype=np.int16)
+    for code, component in enumerate(columns.component_names):
+        strategy = alert_eval_strategy_map.get(component)
+        if strategy is None:
+            logger.warning(f"No alert evaluation strategy found for {component}")
+            continue
+        rows = np.flatnonzero(columns.component_code == code) if len(columns.component_names) > 1 else np.arange(len(columns))
+        codes, severities = strategy.evaluate_batch(columns, rows)
+        violations = codes != NO_SEVERITY
+        if violations.any():
+            chunk_codes = np.array([severity_codes.setdefault(severity, len(severity_codes)) for severity in severities], dtype=np.int16)
+            row_severity[rows[violations]] = chunk_codes[codes[violations]]
+
+    violation_rows = np.flatnonzero(row_severity != NO_SEVERITY)
+    return violation_rows, row_severity[violation_rows], tuple(severity_codes)
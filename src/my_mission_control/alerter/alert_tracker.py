@@ -6,95 +6,247 @@ Alerts are generated when violations exceed a defined threshold within a time wi
 """
 
 import os
-from collections import defaultdict, deque
-from datetime import datetime, timedelta
-from typing import Deque, Dict, Optional
+from datetime import timedelta
+from typing import Dict, List, Optional
 
 from structlog.stdlib import get_logger
 
-from my_mission_control.alerter.alert_strategy import AlertEvalStrategy
+from my_mission_control.alerter.alert_strategy import AlertEvalStrategy, evaluate_log_columns
+from my_mission_control.alerter.idle_key_timer import IdleKeyTimerWheel
+from my_mission_control.alerter.log_batch_parser import LogColumns
+from my_mission_control.alerter.violation_window import ViolationWindow
 from my_mission_control.config.settings import AlertRuleCfg
 from my_mission_control.entity.alert import Alert
 from my_mission_control.entity.log_entry import LogEntry
+from my_mission_control.utils.epoch_time import datetime_to_epoch_us, epoch_us_to_datetime
 from my_mission_control.utils.utility import get_env_var_int
 
 logger = get_logger(__name__)
 
 
 TIME_DELTA: timedelta = timedelta(minutes=AlertRuleCfg.ALERT_VIOLATION_TIME_WINDOW_MINUTES)
+TIME_DELTA_US: int = TIME_DELTA // timedelta(microseconds=1)
+
+# State keys pack the satellite id above a severity code and a component code of this many bits
+COMPONENT_CODE_BITS = 16
+SEVERITY_CODE_BITS = 8
 
 
 class AlertTracker:
     """
     Tracks alerts conditions for satellite components over time.
 
-    Maintains the timestamp queues and applies evaluation strategies to determine whether alerts should be triggered.
+    Maintains a violation window per satellite component and severity band, and applies evaluation strategies to determine whether alerts should be triggered.
     """
 
-    def __init__(self, alert_eval_strategy_map: Dict[str, AlertEvalStrategy]):
+    def __init__(self, alert_eval_strategy_map: Dict[str, AlertEvalStrategy], evict_idle_keys: bool = False):
         """
         Initializes the AlertTracker with evaluation stratergies.
 
         Args:
             alert_evaluation_stragegy_map (Dict[str, AlertEvalStrategy]):
             Mapping of component names to their alert evaluation strategies.
+            evict_idle_keys (bool): Drop the state of satellite components that can no longer affect an alert,
+            as event time moves on. Meant for long-running trackers, alerts are unchanged for log entries in timestamp order.
         """
         self.alert_eval_strategy_map = alert_eval_strategy_map
-        # For each satellite maintain queue for each of its component to store timestamp of alert condition
-        self.alert_timestamps: Dict[int, Dict[str, Deque[datetime]]] = defaultdict(lambda: defaultdict(deque))
-        # For each satellite maintain dictionary for each of its component to store timestamp of last alert condition
-        self.last_alert_timestamp: Dict[int, Dict[str, Optional[datetime]]] = defaultdict(lambda: defaultdict(lambda: None))
+        # Components and severities interned to small integer codes, in order of first violation
+        self.component_codes: Dict[str, int] = {}
+        self.severity_codes: Dict[str, int] = {}
+        # One flat table for all satellite components, keyed by state_key(satellite_id, component, severity), so
+        # each severity band of a component has its own window. Each window holds the epoch microsecond
+        # timestamps of alert conditions and of the last alert
+        self.violation_windows: Dict[int, ViolationWindow] = {}
+
+        # Newest log entry timestamp seen, drives idle key eviction
+        self.event_time_us: Optional[int] = None
+        # A key is idle once event time is past the longest alert time window of any component, which is also
+        # the slot width, so idle keys are evicted at most one window after they can no longer raise an alert
+        self.idle_window_us: int = max((strategy.window_us for strategy in alert_eval_strategy_map.values()), default=TIME_DELTA_US)
+        self.idle_key_timer: Optional[IdleKeyTimerWheel] = IdleKeyTimerWheel(self.idle_window_us) if evict_idle_keys else None
+        self.evicted_key_count = 0
+
+    @property
+    def live_key_count(self) -> int:
+        """
+        Number of satellite component severity bands currently holding alert state.
+        """
+        return len(self.violation_windows)
 
-    def process_log_entry(self, log_entry: LogEntry) -> Optional[Alert]:
+    def advance_event_time(self, now_us: int):
         """
-        Processes a log entry and determines if an alert should be generated.
+        Moves event time forward and, with idle key eviction enabled, drops the keys that went idle.
+
+        A key is idle once event time is more than the longest alert time window past its newest violation: any later
+        violation empties its window, and the last alert is older than that violation so it cannot block the
+        next alert. Dropping it is then the same as keeping it.
 
         Args:
-            log_entry (LogEntry): A structured log entry containing satellite data.
+            now_us (int): Event time in epoch microseconds, earlier times are ignored.
+        """
+        if self.event_time_us is not None and now_us <= self.event_time_us:
+            return
+        self.event_time_us = now_us
+        if self.idle_key_timer is not None and now_us >= self.idle_key_timer.next_due_us:
+            self._evict_idle_keys(now_us)
 
-        Returns:
-            Optional[Alert]: An Alert object if conditions are met; otherwise, None.
+    def _evict_idle_keys(self, now_us: int):
+        """
+        Drops the keys whose timer expired and that are still idle at now_us.
         """
+        idle_key_timer = self.idle_key_timer
+        if idle_key_timer is None:
+            return
+        violation_windows = self.violation_windows
+        for key in idle_key_timer.expire(now_us):
+            # Stale entries belong to keys rescheduled to a later slot, or already evicted
+            violation_window = violation_windows.get(key)
+            if violation_window is not None and violation_window.latest_ts is not None and now_us - violation_window.latest_ts > self.idle_window_us:
+                del violation_windows[key]
+                self.evicted_key_count += 1
+
+    def _component_code(self, component: str) -> int:
+        """
+        Returns the integer code of a component, assigning the next free code on first use.
+        """
+        code = self.component_codes.get(component)
+        if code is None:
+            code = len(self.component_codes)
+            if code >> COMPONENT_CODE_BITS:
+                raise ValueError(f"Too many distinct components, at most {1 << COMPONENT_CODE_BITS} are supported")
+            self.component_codes[component] = code
+        return code
+
+    def _severity_code(self, severity: str) -> int:
+        """
+        Returns the integer code of a severity, assigning the next free code on first use.
+        """
+        code = self.severity_codes.get(severity)
+        if code is None:
+            code = len(self.severity_codes)
+            if code >> SEVERITY_CODE_BITS:
+                raise ValueError(f"Too many distinct severities, at most {1 << SEVERITY_CODE_BITS} are supported")
+            self.severity_codes[severity] = code
+        return code
+
+    def state_key(self, satellite_id: int, component: str, severity: str) -> int:
+        """
+        Packs a satellite id, a component and a severity into the integer key of their violation window.
 
-        def eval_alert_condition(log_entry: LogEntry):
-            """
-            Evaluates the alert condition for a given log entry.
+        Args:
+            satellite_id (int): Satellite identifier.
+            component (str): Component identifier.
+            severity (str): Severity band of the violations.
 
-            Args:
-                log_entry (LogEntry): The log entry to evaluate.
+        Returns:
+            int: The state key, unique per (satellite_id, component, severity).
+        """
+        return (((satellite_id << SEVERITY_CODE_BITS) | self._severity_code(severity)) << COMPONENT_CODE_BITS) | self._component_code(component)
 
-            Returns:
-                Optional[str]: Severity level if an alert condition is met; othersise, None.
-            """
-            eval_strategy = self.alert_eval_strategy_map[log_entry.component]
-            if not eval_strategy:
-                logger.warning(f"No alert evaluation strategy found for {log_entry.component}")
-                return None
-            return eval_strategy.evaluate(log_entry)
+    def process_log_entry(self, log_entry: LogEntry) -> Optional[Alert]:
+        """
+        Processes a log entry and determines if an alert should be generated.
 
-        severity: Optional[str] = eval_alert_condition(log_entry)
+        Args:
+            log_entry (LogEntry): A structured log entry containing satellite data, timestamped with a datetime
+                or with int epoch microseconds.
+
+        Returns:
+            Optional[Alert]: An Alert object if conditions are met, timestamped like the log entry; otherwise, None.
+        """
+        timestamp = log_entry.timestamp
+        epoch_us_input = isinstance(timestamp, int)
+        ts: Optional[int] = None
+        idle_key_timer = self.idle_key_timer
+        if idle_key_timer is not None:
+            # Every log entry moves event time, violation or not
+            ts = timestamp if epoch_us_input else datetime_to_epoch_us(timestamp)
+            if self.event_time_us is None or ts > self.event_time_us:
+                self.event_time_us = ts
+                if ts >= idle_key_timer.next_due_us:
+                    self._evict_idle_keys(ts)
+
+        # Evaluate the alert condition with the strategy of the component, unknown components are skipped
+        eval_strategy = self.alert_eval_strategy_map.get(log_entry.component)
+        if not eval_strategy:
+            logger.warning(f"No alert evaluation strategy found for {log_entry.component}")
+            return None
+        severity: Optional[str] = eval_strategy.evaluate(log_entry)
 
         if not severity:
             return None
 
-        # Add timestamp to the appropriate statellite-component pair timestamp deque
-        timestamps_dq = self.alert_timestamps[log_entry.satellite_id][log_entry.component]
-        timestamps_dq.append(log_entry.timestamp)
+        if ts is None:
+            ts = timestamp if epoch_us_input else datetime_to_epoch_us(timestamp)
+        first_ts = self._track_violation(log_entry.satellite_id, log_entry.component, severity, ts, eval_strategy)
+        if first_ts is None:
+            return None
 
-        # Remove entries older than the violation check time delta window
-        while timestamps_dq and (log_entry.timestamp - timestamps_dq[0]) > TIME_DELTA:
-            timestamps_dq.popleft()
+        # Generate Alert, with a timestamp of the same kind as the log entry's
+        return Alert(log_entry.satellite_id, severity, log_entry.component, first_ts if epoch_us_input else epoch_us_to_datetime(first_ts))
 
-        # Check number of entries exceed the violation threshold
-        if len(timestamps_dq) >= AlertRuleCfg.ALERT_VIOLATION_COUNT_THRESHOLD:
-            first_ts = timestamps_dq[0]
-            last_alert_ts = self.last_alert_timestamp[log_entry.satellite_id][log_entry.component]
+    def _track_violation(self, satellite_id: int, component: str, severity: str, ts: int, eval_strategy: AlertEvalStrategy) -> Optional[int]:
+        """
+        Adds a violation to the window of its satellite component and severity, and applies the alert rule of the component's strategy.
 
-            if last_alert_ts is None or first_ts > last_alert_ts:
-                # Generate Alert
-                alert = Alert(log_entry.satellite_id, severity, log_entry.component, first_ts)
+        Returns:
+            Optional[int]: The first timestamp in the window if an alert is triggered; otherwise, None.
+        """
+        # Add timestamp to the appropriate statellite-component pair window,
+        # entries older than the violation check time delta window are removed
+        key = self.state_key(satellite_id, component, severity)
+        violation_window = self.violation_windows.get(key)
+        if violation_window is None:
+            violation_window = self.violation_windows[key] = ViolationWindow(eval_strategy.threshold)
+        previous_latest_ts = violation_window.latest_ts
+        violation_window.add(ts, eval_strategy.window_us)
+        idle_key_timer = self.idle_key_timer
+        if idle_key_timer is not None and (previous_latest_ts is None or ts > previous_latest_ts):
+            # ts is the newest timestamp of the window now
+            idle_window_us = self.idle_window_us
+            idle_key_timer.schedule(key, ts + idle_window_us, None if previous_latest_ts is None else previous_latest_ts + idle_window_us)
+
+        # Check number of entries exceed the violation threshold, and the window starts after the last alert
+        return violation_window.check_alert(ts, eval_strategy.threshold)
+
+    def process_log_columns(self, columns: LogColumns) -> List[Alert]:
+        """
+        Processes a chunk of parsed log lines in columnar form, in line order.
+
+        The chunk is evaluated column-wise with each strategy's evaluate_batch, then violation rows go through the
+        same window logic as process_log_entry, on epoch microsecond timestamps. Rows whose component has no
+        evaluation strategy are skipped.
 
-                # Save timestamp that generated Alert, used as starting point to determine next alert
-                self.last_alert_timestamp[log_entry.satellite_id][log_entry.component] = log_entry.timestamp
-                return alert
-        return None
+        Args:
+            columns (LogColumns): A chunk of parsed log lines.
+
+        Returns:
+            List[Alert]: Alerts generated by the chunk, in the order they were triggered.
+        """
+        alerts: List[Alert] = []
+        if len(columns) == 0:
+            return alerts
+
+        # Only violation rows reach the per-row window logic
+        rows, severity_codes, severities = evaluate_log_columns(columns, self.alert_eval_strategy_map)
+        violations = zip(
+            columns.timestamp_us[rows].tolist(),
+            columns.satellite_id[rows].tolist(),
+            columns.component_code[rows].tolist(),
+            severity_codes.tolist(),
+        )
+        component_names = columns.component_names
+        strategies = [self.alert_eval_strategy_map.get(component) for component in component_names]
+        evict_idle_keys = self.idle_key_timer is not None
+        for ts, sat_id, code, severity_code in violations:
+            if evict_idle_keys:
+                self.advance_event_time(ts)
+            severity = severities[severity_code]
+            first_ts = self._track_violation(sat_id, component_names[code], severity, ts, strategies[code])
+            if first_ts is not None:
+                alerts.append(Alert(sat_id, severity, component_names[code], first_ts))
+
+        # Rows past the last violation move event time too
+        if evict_idle_keys:
+            self.advance_event_time(int(columns.timestamp_us.max()))
+        return alerts
@@ -0,0 +1,44 @@
+"""
+Creates alert trackers configured with the component-specific alert evaluation strategies.
+
+Shared by every way of processing telemetry: single files, sharded and parallel processing, and the ingestion service.
+"""
+
+from functools import lru_cache
+from typing import Dict
+
+from my_mission_control.alerter.alert_rule_table import load_alert_rules
+from my_mission_control.alerter.alert_strategy import AlertEvalStrategy, RedHighAlertStrategy, RedLowAlertStrategy
+from my_mission_control.alerter.alert_tracker import AlertTracker
+from my_mission_control.config.settings import AlertRuleCfg, InputLogFileCfg
+
+
+@lru_cache(maxsize=None)
+def _load_alert_rules(rules_file: str) -> Dict[str, AlertEvalStrategy]:
+    """
+    Compiles a rule table once per process, its strategies are stateless and shared by every tracker.
+    """
+    return load_alert_rules(rules_file)
+
+
+def create_alert_eval_strategy_map() -> Dict[str, AlertEvalStrategy]:
+    """
+    Maps each component to its corresponding alert evaluation strategy.
+
+    The rules come from the AlertRuleCfg.ALERT_RULES_FILE rule table when set, otherwise BATT and TSTAT use
+    the built-in red limit strategies.
+    """
+    if AlertRuleCfg.ALERT_RULES_FILE:
+        return dict(_load_alert_rules(AlertRuleCfg.ALERT_RULES_FILE))
+    return {InputLogFileCfg.LOG_LINE_COMPONENT_BATT: RedLowAlertStrategy(), InputLogFileCfg.LOG_LINE_COMPONENT_TSTAT: RedHighAlertStrategy()}
+
+
+def create_alert_tracker(evict_idle_keys: bool = False) -> AlertTracker:
+    """
+    Creates an alert tracker with the component-specific alert evaluation strategies.
+
+    Args:
+        evict_idle_keys (bool): Drop idle satellite component state, for trackers that live indefinitely.
+    """
+    # Initialize the alert tracker with alert evaluation stragegy mapping
+    return AlertTracker(create_alert_eval_strategy_map(), evict_idle_keys=evict_idle_keys)
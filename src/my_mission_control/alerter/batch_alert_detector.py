@@ -0,0 +1,251 @@
+"""
+Vectorized sliding-window alert detection over a whole file of violations.
+
+Offline counterpart of AlertTracker. Instead of updating a deque per violation, all violations of a file are
+grouped by (satellite, component) with a stable lexsort, window counts come from searchsorted(ts, ts - window),
+and the "first_ts > last_alert_ts" re-arm rule is applied by jumping from one alert straight to the next.
+The result is exactly the alerts the streaming tracker emits for the same violations in the same order.
+"""
+
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+from structlog.stdlib import get_logger
+
+from my_mission_control.alerter.alert_strategy import AlertEvalStrategy, evaluate_log_columns
+from my_mission_control.alerter.log_batch_parser import LogColumns
+from my_mission_control.entity.alert import Alert
+
+logger = get_logger(__name__)
+
+MICROSECONDS_PER_MINUTE = 60_000_000
+
+
+def replay_violation_window(timestamp_us: List[int], threshold: int, window_us: int) -> List[Tuple[int, int]]:
+    """
+    Replays the AlertTracker window and re-arm rules over the violations of one (satellite, component) pair.
+
+    Args:
+        timestamp_us (List[int]): Violation timestamps, in arrival order.
+        threshold (int): Number of violations within the window that triggers an alert.
+        window_us (int): Length of the window in microseconds.
+
+    Returns:
+        List[Tuple[int, int]]: (position of the violation that triggered the alert, first timestamp in its window) per alert.
+    """
+    alerts: List[Tuple[int, int]] = []
+    window: Deque[int] = deque()
+    last_alert_ts: Optional[int] = None
+
+    for position, ts in enumerate(timestamp_us):
+        window.append(ts)
+        while window and ts - window[0] > window_us:
+            window.popleft()
+        if len(window) >= threshold and (last_alert_ts is None or window[0] > last_alert_ts):
+            alerts.append((position, window[0]))
+            last_alert_ts = ts
+    return alerts
+
+
+def detect_alerts(satellite_id: np.ndarray, component_code: np.ndarray, timestamp_us: np.ndarray, threshold: int, window_us: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Finds the violations that trigger an alert.
+
+    Args:
+        satellite_id (np.ndarray): Satellite identifier of each violation, in arrival order.
+        component_code (np.ndarray): Integer component code of each violation.
+        timestamp_us (np.ndarray): Timestamp of each violation in epoch microseconds.
+        threshold (int): Number of violations within the window that triggers an alert.
+        window_us (int): Length of the window in microseconds.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Positions of the violations that trigger an alert, in ascending order,
+            and the first timestamp in the window of each alert.
+    """
+    count = len(timestamp_us)
+    if count == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    # Stable sort keeps arrival order within each (satellite, component) group
+    order = np.lexsort((component_code, satellite_id))
+    sat_sorted = satellite_id[order]
+    cmpnt_sorted = component_code[order]
+    ts_sorted = timestamp_us[order].astype(np.int64)
+
+    group_start = np.ones(count, dtype=bool)
+    group_start[1:] = (sat_sorted[1:] != sat_sorted[:-1]) | (cmpnt_sorted[1:] != cmpnt_sorted[:-1])
+    group_id = np.cumsum(group_start) - 1
+
+    # Groups whose timestamps go backwards do not fit the searchsorted model, replay them one by one
+    out_of_order = np.zeros(count, dtype=bool)
+    out_of_order[1:] = ~group_start[1:] & (ts_sorted[1:] < ts_sorted[:-1])
+    unordered_groups = np.unique(group_id[out_of_order]) if out_of_order.any() else np.empty(0, dtype=np.int64)
+    in_order = ~np.isin(group_id, unordered_groups) if unordered_groups.size else np.ones(count, dtype=bool)
+
+    alert_positions: List[np.ndarray] = []
+    alert_first_ts: List[np.ndarray] = []
+
+    rows = np.flatnonzero(in_order)
+    if rows.size:
+        group = group_id[rows]
+        ts = ts_sorted[rows]
+
+        # One int64 key ordering (group, timestamp), so a single searchsorted finds every window start
+        relative_ts = ts - ts.min()
+        stride = int(relative_ts.max()) + window_us + 1
+        if (int(group[-1]) + 1) * stride < 2**62:
+            key = group * stride + relative_ts
+            window_start_key = key - window_us
+        else:
+            # Timestamps span too long for the offsets to fit, rank them on a shared scale instead
+            scale = np.sort(np.concatenate((ts, ts - window_us)))
+            stride = len(scale) + 1
+            key = group * stride + np.searchsorted(scale, ts)
+            window_start_key = group * stride + np.searchsorted(scale, ts - window_us)
+        window_start = np.searchsorted(key, window_start_key, side="left")
+        window_count = np.arange(len(rows)) - window_start + 1
+
+        candidates = np.flatnonzero(window_count >= threshold)
+        if candidates.size:
+            candidate_group = group[candidates]
+            candidate_first_key = key[window_start[candidates]]
+
+            # The first candidate of each group always alerts, every next alert is the first candidate
+            # of the same group whose window starts after the timestamp of the previous alert
+            current = np.flatnonzero(np.r_[True, candidate_group[1:] != candidate_group[:-1]])
+            triggered: List[np.ndarray] = []
+            while current.size:
+                triggered.append(current)
+                following = np.searchsorted(candidate_first_key, key[candidates[current]], side="right")
+                same_group = following < len(candidates)
+                same_group[same_group] = candidate_group[following[same_group]] == candidate_group[current[same_group]]
+                current = following[same_group]
+
+            alerting = candidates[np.concatenate(triggered)]
+            alert_positions.append(order[rows[alerting]])
+            alert_first_ts.append(ts[window_start[alerting]])
+
+    for unordered_group in unordered_groups.tolist():
+        group_rows = np.flatnonzero(group_id == unordered_group)
+        replayed = replay_violation_window(ts_sorted[group_rows].tolist(), threshold, window_us)
+        if replayed:
+            positions, first_ts = zip(*replayed)
+            alert_positions.append(order[group_rows[list(positions)]])
+            alert_first_ts.append(np.array(first_ts, dtype=np.int64))
+
+    if not alert_positions:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    positions = np.concatenate(alert_positions)
+    first_ts = np.concatenate(alert_first_ts)
+    by_position = np.argsort(positions, kind="stable")
+    return positions[by_position], first_ts[by_position]
+
+
+class BatchAlertDetector:
+    """
+    Collects the violations of a whole file chunk by chunk, then detects all alerts at once.
+
+    Produces the same alerts, in the same order, as feeding every log entry to an AlertTracker.
+    """
+
+    def __init__(self, alert_eval_strategy_map: Dict[str, AlertEvalStrategy]):
+        """
+        Initializes the detector with evaluation strategies.
+
+        Args:
+            alert_eval_strategy_map (Dict[str, AlertEvalStrategy]):
+            Mapping of component names to their alert evaluation strategies.
+        """
+        self.alert_eval_strategy_map = alert_eval_strategy_map
+
+        # Component and severity names are interned to integer codes shared by all chunks
+        self.component_codes: Dict[str, int] = {}
+        self.severity_codes: Dict[str, int] = {}
+
+        self._satellite_id: List[np.ndarray] = []
+        self._component_code: List[np.ndarray] = []
+        self._timestamp_us: List[np.ndarray] = []
+        self._severity_code: List[np.ndarray] = []
+
+    def add_columns(self, columns: LogColumns):
+        """
+        Evaluates a chunk of parsed log lines and keeps its violations.
+
+        Args:
+            columns (LogColumns): A chunk of parsed log lines, chunks must be added in file order.
+        """
+        if len(columns) == 0:
+            return
+
+        rows, severity_codes, severities = evaluate_log_columns(columns, self.alert_eval_strategy_map)
+        if len(rows) == 0:
+            return
+
+        chunk_severity_codes = np.array([self.severity_codes.setdefault(severity, len(self.severity_codes)) for severity in severities], dtype=np.int32)
+        chunk_component_codes = np.array([self.component_codes.setdefault(component, len(self.component_codes)) for component in columns.component_names], dtype=np.int32)
+        self._satellite_id.append(columns.satellite_id[rows])
+        self._component_code.append(chunk_component_codes[columns.component_code[rows]])
+        self._timestamp_us.append(columns.timestamp_us[rows])
+        self._severity_code.append(chunk_severity_codes[severity_codes])
+
+    def _detect_per_rule(self, satellite_id: np.ndarray, component_code: np.ndarray, severity_code: np.ndarray, timestamp_us: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Runs detect_alerts once per distinct (threshold, window) alert rule, on the violations of the components sharing it.
+
+        Each severity band of a component has its own windows, as in AlertTracker.
+        """
+        band_code = component_code.astype(np.int64) * len(self.severity_codes) + severity_code
+        rule_components: Dict[Tuple[int, int], List[int]] = {}
+        for component, code in self.component_codes.items():
+            # Components without a strategy have no violations
+            strategy = self.alert_eval_strategy_map.get(component)
+            if strategy is None:
+                continue
+            rule_components.setdefault((strategy.threshold, strategy.window_us), []).append(code)
+
+        if len(rule_components) == 1:
+            ((threshold, window_us),) = rule_components
+            return detect_alerts(satellite_id, band_code, timestamp_us, threshold, window_us)
+
+        rule_positions: List[np.ndarray] = []
+        rule_first_ts: List[np.ndarray] = []
+        for (threshold, window_us), codes in rule_components.items():
+            rows = np.flatnonzero(np.isin(component_code, codes))
+            positions, first_ts = detect_alerts(satellite_id[rows], band_code[rows], timestamp_us[rows], threshold, window_us)
+            rule_positions.append(rows[positions])
+            rule_first_ts.append(first_ts)
+
+        positions = np.concatenate(rule_positions)
+        by_position = np.argsort(positions, kind="stable")
+        return positions[by_position], np.concatenate(rule_first_ts)[by_position]
+
+    def detect(self) -> List[Alert]:
+        """
+        Detects the alerts triggered by all violations added so far.
+
+        Returns:
+            List[Alert]: Alerts in the order the streaming tracker would generate them, timestamped with epoch microseconds.
+        """
+        if not self._timestamp_us:
+            return []
+
+        satellite_id = np.concatenate(self._satellite_id)
+        component_code = np.concatenate(self._component_code)
+        timestamp_us = np.concatenate(self._timestamp_us)
+        severity_code = np.concatenate(self._severity_code)
+
+        positions, first_ts = self._detect_per_rule(satellite_id, component_code, severity_code, timestamp_us)
+
+        component_names = list(self.component_codes)
+        severity_names = list(self.severity_codes)
+        return [
+            Alert(sat_id, severity_names[severity], component_names[code], timestamp)
+            for sat_id, severity, code, timestamp in zip(
+                satellite_id[positions].tolist(),
+                severity_code[positions].tolist(),
+                component_code[positions].tolist(),
+                first_ts.tolist(),
+            )
+        ]
@@ -0,0 +1,79 @@
+"""
+Event-time timer wheel for evicting idle AlertTracker state keys.
+
+A key is scheduled at the deadline after which its violation window can no longer influence an alert: the
+timestamp of its newest violation plus the alert time window. Deadlines are bucketed into slots of a fixed
+width, each slot holding the keys whose deadline falls in it. Rescheduling a key only appends it to a new slot
+when its deadline moves to a later slot, the entries left behind in earlier slots are stale and skipped when
+those slots expire. Slots are expired in order through a heap of slot numbers, so an idle stretch of event time
+costs nothing and each violation costs O(1) amortized.
+"""
+
+import heapq
+import math
+from typing import Dict, Iterator, List, Optional
+
+
+class IdleKeyTimerWheel:
+    """
+    Buckets state keys by the slot of their idle deadline, in epoch microseconds.
+    """
+
+    def __init__(self, slot_us: int):
+        """
+        Initializes an empty wheel.
+
+        Args:
+            slot_us (int): Width of a slot in microseconds, keys are expired at most this late.
+        """
+        if slot_us < 1:
+            raise ValueError(f"Timer wheel slot width must be positive, got {slot_us}")
+        self.slot_us = slot_us
+        self._slots: Dict[int, List[int]] = {}
+        self._slot_heap: List[int] = []
+        # Earliest event time at which expire yields anything
+        self.next_due_us: float = math.inf
+
+    def __len__(self) -> int:
+        """
+        Number of scheduled entries, stale ones included.
+        """
+        return sum(map(len, self._slots.values()))
+
+    def schedule(self, key: int, deadline_us: int, previous_deadline_us: Optional[int] = None):
+        """
+        Schedules a key at its idle deadline.
+
+        Args:
+            key (int): State key.
+            deadline_us (int): Event time after which the key is idle.
+            previous_deadline_us (Optional[int]): Deadline the key is already scheduled at, if any.
+        """
+        slot = deadline_us // self.slot_us
+        if previous_deadline_us is not None and previous_deadline_us // self.slot_us >= slot:
+            return
+        keys = self._slots.get(slot)
+        if keys is None:
+            keys = self._slots[slot] = []
+            heapq.heappush(self._slot_heap, slot)
+            self.next_due_us = min(self.next_due_us, (slot + 1) * self.slot_us)
+        keys.append(key)
+
+    def expire(self, now_us: int) -> Iterator[int]:
+        """
+        Removes and yields the keys of every slot that ends at or before now_us.
+
+        Every key scheduled with a deadline before now_us is yielded, along with stale entries of keys that were
+        rescheduled to a later slot, the caller checks each key against its current deadline.
+
+        Args:
+            now_us (int): Current event time in epoch microseconds.
+
+        Yields:
+            int: Candidate keys for eviction.
+        """
+        due_slot = now_us // self.slot_us
+        slot_heap = self._slot_heap
+        while slot_heap and slot_heap[0] < due_slot:
+            yield from self._slots.pop(heapq.heappop(slot_heap))
+        self.next_due_us = (slot_heap[0] + 1) * self.slot_us if slot_heap else math.inf
@@ -0,0 +1,247 @@
+"""
+Parses chunks of telemetry log file lines into columnar NumPy arrays.
+
+Batch counterpart of log_line_parser: instead of one LogEntry per line, a chunk of lines becomes one LogColumns
+holding a NumPy array per field. Timestamps are decoded for the whole chunk at once into int64 microseconds
+since the Unix epoch, and components are stored as categorical integer codes.
+
+Lines are accepted or rejected as parse_log_line would: a line missing a field, or with any field that fails
+to parse, is dropped from the chunk. Integer fields must also fit in int64.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import compress, repeat
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from structlog.stdlib import get_logger
+
+from my_mission_control.alerter.timestamp_parser import LogTimestampParser
+from my_mission_control.config.settings import InputLogFileCfg
+from my_mission_control.entity.log_entry import LogEntry
+from my_mission_control.utils.epoch_time import datetime_to_epoch_us
+
+logger = get_logger(__name__)
+
+# Fixed-width layout 'YYYYMMDD HH:MM:SS.f' up to 'YYYYMMDD HH:MM:SS.ffffff', see timestamp_parser
+_TS_MIN_LENGTH = 19
+_TS_MAX_LENGTH = 24
+_TS_DIGIT_POSITIONS = [0, 1, 2, 3, 4, 5, 6, 7, 9, 10, 12, 13, 15, 16]
+_TS_SEPARATORS = ((8, ord(" ")), (11, ord(":")), (14, ord(":")), (17, ord(".")))
+_TS_FRACTION_SCALE = np.array([100_000, 10_000, 1_000, 100, 10, 1], dtype=np.int64)
+_DAYS_IN_MONTH = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int64)
+_MICROSECONDS_PER_DAY = 86_400_000_000
+
+
+@dataclass
+class LogColumns:
+    """
+    Columnar representation of a chunk of parsed log lines, one array element per valid line.
+
+    Attributes:
+        timestamp_us: Timestamps as int64 microseconds since the Unix epoch.
+        satellite_id: Satellite identifiers.
+        red_high_limit: Red high limit thresholds.
+        yellow_high_limit: Yellow high limit thresholds.
+        yellow_low_limit: Yellow low limit thresholds.
+        red_low_limit: Red low limit thresholds.
+        raw_value: Raw sensor measurement values.
+        component_code: Index of each line's component into component_names.
+        component_names: Component identifiers, in order of first appearance in the chunk.
+    """
+
+    timestamp_us: np.ndarray
+    satellite_id: np.ndarray
+    red_high_limit: np.ndarray
+    yellow_high_limit: np.ndarray
+    yellow_low_limit: np.ndarray
+    red_low_limit: np.ndarray
+    raw_value: np.ndarray
+    component_code: np.ndarray
+    component_names: Tuple[str, ...]
+
+    def __len__(self) -> int:
+        return len(self.timestamp_us)
+
+    def log_entries(self, rows: Optional[np.ndarray] = None) -> Iterator[LogEntry[int]]:
+        """
+        Yields the rows as log entries timestamped with int epoch microseconds.
+
+        Args:
+            rows (Optional[np.ndarray]): Indices of the rows to yield, all rows by default.
+        """
+        columns = (self.timestamp_us, self.satellite_id, self.red_high_limit, self.yellow_high_limit, self.yellow_low_limit, self.red_low_limit, self.raw_value, self.component_code)
+        if rows is not None:
+            columns = tuple(column[rows] for column in columns)
+        component_names = self.component_names
+        for ts, sat_id, rhl, yhl, yll, rll, val, code in zip(*(column.tolist() for column in columns)):
+            yield LogEntry(ts, sat_id, rhl, yhl, yll, rll, val, component_names[code])
+
+    def timestamps(self) -> List[datetime]:
+        """
+        Converts the timestamp column to datetime objects.
+        """
+        return self.timestamp_us.astype("datetime64[us]").tolist()
+
+
+def _days_from_civil(year: np.ndarray, month: np.ndarray, day: np.ndarray) -> np.ndarray:
+    """
+    Returns the number of days since 1970-01-01 for proleptic Gregorian dates.
+    """
+    year = year - (month <= 2)
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + np.where(month > 2, -3, 9)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146_097 + day_of_era - 719_468
+
+
+def _decode_timestamps(ts_strs: Sequence[str], timestamp_parser: LogTimestampParser) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Decodes timestamp strings to epoch microseconds, vectorized over the fixed-width layout.
+
+    Strings that do not match the layout, or hold out of range fields, are decoded one by one with the
+    timestamp parser so results match parse_log_line.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Epoch microseconds and a mask of successfully decoded timestamps.
+    """
+    count = len(ts_strs)
+    timestamp_us = np.zeros(count, dtype=np.int64)
+    valid = np.zeros(count, dtype=bool)
+    if count == 0:
+        return timestamp_us, valid
+
+    ts_array = np.array(ts_strs, dtype=str)
+    width = ts_array.dtype.itemsize // 4
+    codes = np.zeros((count, _TS_MAX_LENGTH), dtype=np.int64)
+    if width:
+        codes[:, : min(width, _TS_MAX_LENGTH)] = ts_array.view(np.uint32).reshape(count, width)[:, :_TS_MAX_LENGTH]
+    lengths = np.char.str_len(ts_array)
+    digits = codes - ord("0")
+    is_digit = (digits >= 0) & (digits <= 9)
+
+    fixed_width = (lengths >= _TS_MIN_LENGTH) & (lengths <= _TS_MAX_LENGTH) & is_digit[:, _TS_DIGIT_POSITIONS].all(axis=1)
+    for position, separator in _TS_SEPARATORS:
+        fixed_width &= codes[:, position] == separator
+    in_fraction = np.arange(_TS_MIN_LENGTH - 1, _TS_MAX_LENGTH) < lengths[:, None]
+    fixed_width &= (is_digit[:, _TS_MIN_LENGTH - 1 :] | ~in_fraction).all(axis=1)
+
+    digits = np.where(is_digit, digits, 0)
+    year = digits[:, 0] * 1000 + digits[:, 1] * 100 + digits[:, 2] * 10 + digits[:, 3]
+    month = digits[:, 4] * 10 + digits[:, 5]
+    day = digits[:, 6] * 10 + digits[:, 7]
+    hour = digits[:, 9] * 10 + digits[:, 10]
+    minute = digits[:, 12] * 10 + digits[:, 13]
+    second = digits[:, 15] * 10 + digits[:, 16]
+    microsecond = (np.where(in_fraction, digits[:, _TS_MIN_LENGTH - 1 :], 0) * _TS_FRACTION_SCALE).sum(axis=1)
+
+    is_leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    month_index = np.clip(month, 0, 12)
+    days_in_month = _DAYS_IN_MONTH[month_index] + ((month_index == 2) & is_leap)
+    fixed_width &= (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1) & (day <= days_in_month) & (hour < 24) & (minute < 60) & (second < 60)
+
+    seconds_of_day = (hour * 60 + minute) * 60 + second
+    timestamp_us[:] = _days_from_civil(year, month, day) * _MICROSECONDS_PER_DAY + seconds_of_day * 1_000_000 + microsecond
+    valid[:] = fixed_width
+
+    # Irregular input takes the per-line path, which falls back to strptime
+    for row in np.flatnonzero(~fixed_width).tolist():
+        try:
+            timestamp_us[row] = datetime_to_epoch_us(timestamp_parser.parse(ts_strs[row]))
+            valid[row] = True
+        except ValueError as e:
+            logger.error(f"Failed to parse timestamp: '{ts_strs[row]}' - {e}")
+
+    return timestamp_us, valid
+
+
+def _convert_column(values: Sequence[str], convert: Callable[[str], object], dtype: type) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Converts a column of strings to a NumPy array, isolating values that fail to convert.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Converted values and a mask of successfully converted values.
+    """
+    count = len(values)
+    try:
+        return np.fromiter(map(convert, values), dtype=dtype, count=count), np.ones(count, dtype=bool)
+    except (ValueError, OverflowError):
+        pass
+
+    converted = np.zeros(count, dtype=dtype)
+    valid = np.ones(count, dtype=bool)
+    for row, value in enumerate(values):
+        try:
+            converted[row] = convert(value)
+        except (ValueError, OverflowError) as e:
+            logger.error(f"Failed to parse value: '{value}' - {e}")
+            valid[row] = False
+    return converted, valid
+
+
+class LogBatchParser:
+    """
+    Parses chunks of log lines into LogColumns.
+
+    Keeps the timestamp parser date cache across chunks of the same file.
+    """
+
+    def __init__(self):
+        self.timestamp_parser = LogTimestampParser()
+
+    def parse(self, lines: Iterable[str]) -> LogColumns:
+        """
+        Parses a chunk of telemetry log lines into columns, dropping malformed lines.
+
+        Args:
+            lines (Iterable[str]): Raw telemetry log lines.
+
+        Returns:
+            LogColumns: Columns holding one element per valid line, in input order.
+        """
+        delimiter = InputLogFileCfg.LOG_LINE_DELIMITER
+        field_count = InputLogFileCfg.LOG_LINE_EXPECTED_FIELD_COUNT
+
+        stripped_lines = list(map(str.strip, lines))
+        delimiter_counts = list(map(str.count, stripped_lines, repeat(delimiter)))
+        if delimiter_counts.count(field_count - 1) != len(stripped_lines):
+            for line_delimiter_count in delimiter_counts:
+                if line_delimiter_count != field_count - 1:
+                    logger.warning(f"Invalid line, expected {field_count} fields, got {line_delimiter_count + 1}")
+            stripped_lines = list(compress(stripped_lines, (line_delimiter_count == field_count - 1 for line_delimiter_count in delimiter_counts)))
+
+        # Every remaining line has exactly field_count fields, so one split yields the fields row after row
+        fields = delimiter.join(stripped_lines).split(delimiter) if stripped_lines else []
+        ts_strs, sat_ids, rhls, yhls, ylls, rlls, vals, cmpnts = (fields[index::field_count] for index in range(field_count))
+
+        timestamp_us, valid = _decode_timestamps(ts_strs, self.timestamp_parser)
+        int_columns = []
+        for values in (sat_ids, rhls, yhls, ylls, rlls):
+            column, column_valid = _convert_column(values, int, np.int64)
+            int_columns.append(column)
+            valid &= column_valid
+        satellite_id, red_high_limit, yellow_high_limit, yellow_low_limit, red_low_limit = int_columns
+        raw_value, column_valid = _convert_column(vals, float, np.float64)
+        valid &= column_valid
+
+        component_index: Dict[str, int] = {component: code for code, component in enumerate(dict.fromkeys(cmpnts))}
+        component_code = np.fromiter(map(component_index.__getitem__, cmpnts), dtype=np.int32, count=len(cmpnts))
+
+        if not valid.all():
+            timestamp_us, satellite_id, red_high_limit, yellow_high_limit, yellow_low_limit, red_low_limit, raw_value, component_code = (column[valid] for column in (timestamp_us, satellite_id, red_high_limit, yellow_high_limit, yellow_low_limit, red_low_limit, raw_value, component_code))
+        return LogColumns(timestamp_us, satellite_id, red_high_limit, yellow_high_limit, yellow_low_limit, red_low_limit, raw_value, component_code, tuple(component_index))
+
+
+def parse_log_lines_batch(lines: Iterable[str]) -> LogColumns:
+    """
+    Parses a chunk of telemetry log lines into columns, dropping malformed lines.
+
+    Args:
+        lines (Iterable[str]): Raw telemetry log lines.
+
+    Returns:
+        LogColumns: Columns holding one element per valid line, in input order.
+    """
+    return LogBatchParser().parse(lines)
@@ -0,0 +1,163 @@
+"""
+Streaming line source for compressed telemetry archives: gzip, bzip2 and xz.
+
+The format is detected from the magic bytes at the start of the file, whatever its name. The compressed file
+is read through one large read buffer, decompressed in chunks of a bounded size, and the chunks are split into
+lines as bytes, so the decompressed data never reaches the disk and is never held in memory as a whole.
+Multi-member archives, as written by concatenating compressed files, are read to their last member.
+
+Decompression can run in a background thread handing chunks over through a bounded queue. zlib, bz2 and lzma
+release the GIL while decompressing, so the next chunk is decompressed while the current one is parsed.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import queue
+import threading
+from contextlib import closing
+from typing import IO, Callable, Dict, Generator, Iterator, Optional, Tuple
+
+from my_mission_control.alerter.log_file_scanner import SCAN_BLOCK_SIZE, LineSplitter
+from my_mission_control.config.settings import InputLogFileCfg
+
+# Magic bytes at the start of a file, per compression format
+COMPRESSION_MAGIC: Tuple[Tuple[bytes, str], ...] = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+)
+_MAGIC_LENGTH = max(len(magic) for magic, _ in COMPRESSION_MAGIC)
+
+_DECOMPRESSING_READERS: Dict[str, Callable[[IO[bytes]], io.BufferedIOBase]] = {
+    "gzip": lambda compressed: gzip.GzipFile(fileobj=compressed, mode="rb"),
+    "bz2": lambda compressed: bz2.BZ2File(compressed, mode="rb"),
+    "xz": lambda compressed: lzma.LZMAFile(compressed, mode="rb"),
+}
+
+# Seconds a blocked background decompressor waits between checks for a consumer that stopped reading
+_PUT_POLL_SECONDS = 0.1
+
+
+def detect_compression(log_file: str) -> Optional[str]:
+    """
+    Detects the compression format of a file from its magic bytes.
+
+    Args:
+        log_file (str): Path to the telemetry log file.
+
+    Returns:
+        Optional[str]: gzip, bz2 or xz, or None for an uncompressed file.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with open(log_file, "rb") as f:
+        head = f.read(_MAGIC_LENGTH)
+    for magic, compression in COMPRESSION_MAGIC:
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def iter_decompressed_chunks(log_file: str, compression: str, read_size: int = SCAN_BLOCK_SIZE) -> Generator[bytes, None, None]:
+    """
+    Yields the decompressed content of a compressed file in chunks of read_size bytes, the last one shorter.
+
+    Args:
+        log_file (str): Path to the compressed telemetry log file.
+        compression (str): Compression format, as returned by detect_compression.
+        read_size (int): Size of the compressed read buffer and of each decompressed chunk in bytes.
+
+    Raises:
+        ValueError: If the compression format is unknown.
+        EOFError: If the archive is truncated.
+        OSError: If the archive is corrupt, or the file cannot be read.
+    """
+    if compression not in _DECOMPRESSING_READERS:
+        raise ValueError(f"Unknown compression format {compression!r}, expected one of {', '.join(_DECOMPRESSING_READERS)}")
+    with open(log_file, "rb", buffering=read_size) as compressed:
+        with _DECOMPRESSING_READERS[compression](compressed) as decompressed:
+            # read fills the whole chunk, read1 would return one decompression step of a few kilobytes at a time
+            read = decompressed.read
+            while chunk := read(read_size):
+                yield chunk
+
+
+def iter_chunks_in_thread(chunks: Iterator[bytes], queue_size: int = InputLogFileCfg.LOG_DECOMPRESS_QUEUE_SIZE) -> Generator[bytes, None, None]:
+    """
+    Pulls chunks from an iterator in a background thread, yielding them in order as they become available.
+
+    The thread stays at most queue_size chunks ahead, and stops when the consumer closes this generator early.
+    An exception raised by the iterator is raised again here, after the chunks before it.
+
+    Args:
+        chunks (Iterator[bytes]): Chunk source, such as iter_decompressed_chunks.
+        queue_size (int): Largest number of chunks waiting to be consumed.
+    """
+    handoff: "queue.Queue[Tuple[Optional[bytes], Optional[BaseException]]]" = queue.Queue(maxsize=max(1, queue_size))
+    stop = threading.Event()
+
+    def put(item: Tuple[Optional[bytes], Optional[BaseException]]) -> bool:
+        while not stop.is_set():
+            try:
+                handoff.put(item, timeout=_PUT_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for chunk in chunks:
+                if not put((chunk, None)):
+                    return
+        except BaseException as e:
+            put((None, e))
+            return
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+        # End of the chunks
+        put((None, None))
+
+    producer = threading.Thread(target=produce, name="log-decompressor", daemon=True)
+    producer.start()
+    try:
+        while True:
+            chunk, error = handoff.get()
+            if chunk is None:
+                if error is not None:
+                    raise error
+                return
+            yield chunk
+    finally:
+        stop.set()
+        producer.join()
+
+
+def iter_decompressed_log_lines(log_file: str, compression: str, threaded: bool = False, read_size: int = SCAN_BLOCK_SIZE) -> Generator[bytes, None, None]:
+    """
+    Yields the lines of a compressed telemetry log file as bytes, decompressing it as it is read.
+
+    Args:
+        log_file (str): Path to the compressed telemetry log file.
+        compression (str): Compression format, as returned by detect_compression.
+        threaded (bool): Decompress in a background thread, overlapping decompression with parsing.
+        read_size (int): Size of the compressed read buffer and of each decompressed chunk in bytes.
+
+    Yields:
+        bytes: Each line without its newline, the last one even without a newline.
+    """
+    chunks = iter_decompressed_chunks(log_file, compression, read_size)
+    if threaded:
+        chunks = iter_chunks_in_thread(chunks)
+    splitter = LineSplitter()
+    with closing(chunks):
+        for chunk in chunks:
+            yield from splitter.feed(chunk)
+    partial = splitter.flush()
+    if partial:
+        yield partial
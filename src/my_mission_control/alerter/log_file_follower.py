@@ -0,0 +1,143 @@
+"""
+Follows a telemetry log file that is appended to continuously, like tail -F.
+
+The file is read from where the previous read stopped in large chunks, and the chunks are split into lines
+with the partial trailing line carried over until its newline arrives, so no byte is read twice. Rotation is
+detected by the path pointing to a new inode: the old file is drained to its end before the new one is read
+from its start. A file truncated in place is read again from its start. While no data arrives the polling
+interval doubles up to a maximum, so an idle follower costs a stat call per second.
+"""
+
+import os
+import threading
+import time
+from typing import IO, Iterator, Optional
+
+from structlog.stdlib import get_logger
+
+from my_mission_control.alerter.log_file_scanner import SCAN_BLOCK_SIZE, LineSplitter
+from my_mission_control.config.settings import InputLogFileCfg
+
+logger = get_logger(__name__)
+
+
+class LogFileFollower:
+    """
+    Yields the complete lines appended to a log file, across rotations, as bytes without their newline.
+    """
+
+    def __init__(
+        self,
+        log_file: str,
+        read_size: int = SCAN_BLOCK_SIZE,
+        poll_min_seconds: float = InputLogFileCfg.LOG_FOLLOW_POLL_MIN_MS / 1000,
+        poll_max_seconds: float = InputLogFileCfg.LOG_FOLLOW_POLL_MAX_MS / 1000,
+    ):
+        """
+        Initializes a follower, the file is opened on the first read and read from its start.
+
+        Args:
+            log_file (str): Path to the telemetry log file, it may not exist yet.
+            read_size (int): Bytes read per call.
+            poll_min_seconds (float): Polling interval right after data arrived.
+            poll_max_seconds (float): Longest polling interval while the file stays idle.
+        """
+        self.log_file = log_file
+        self.read_size = read_size
+        self.poll_min_seconds = poll_min_seconds
+        self.poll_max_seconds = max(poll_min_seconds, poll_max_seconds)
+        self.rotation_count = 0
+        self._file: Optional[IO[bytes]] = None
+        self._inode: Optional[int] = None
+        self._splitter = LineSplitter()
+
+    def close(self):
+        """
+        Closes the followed file, a later read reopens it from its start.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._inode = None
+            self._splitter = LineSplitter()
+
+    def _open(self) -> bool:
+        """
+        Opens the file at the followed path, returns False if there is none yet.
+        """
+        try:
+            self._file = open(self.log_file, "rb", buffering=0)
+        except FileNotFoundError:
+            return False
+        self._inode = os.fstat(self._file.fileno()).st_ino
+        return True
+
+    def _drain(self) -> Iterator[bytes]:
+        """
+        Yields the complete lines between the read position and the end of the open file, if any.
+        """
+        if self._file is None:
+            return
+        read = self._file.read
+        feed = self._splitter.feed
+        while chunk := read(self.read_size):
+            yield from feed(chunk)
+
+    def iter_available_lines(self) -> Iterator[bytes]:
+        """
+        Yields the complete lines appended since the previous call, then checks the path for rotation or truncation.
+        """
+        if self._file is None and not self._open():
+            return
+        log_file = self._file
+        yield from self._drain()
+
+        try:
+            stat = os.stat(self.log_file)
+        except FileNotFoundError:
+            # Rotated away and not recreated yet, keep the old file until a new one appears
+            return
+        if stat.st_ino != self._inode:
+            # Lines appended to the old file after the drain above are read before switching
+            yield from self._drain()
+            partial = self._splitter.flush()
+            if partial:
+                yield partial
+            logger.info(f"{self.log_file} was rotated, following the new file")
+            self.close()
+            self.rotation_count += 1
+            if self._open():
+                yield from self._drain()
+        elif log_file is not None and stat.st_size < log_file.tell():
+            logger.warning(f"{self.log_file} was truncated, following it from the start")
+            log_file.seek(0)
+            self._splitter = LineSplitter()
+            yield from self._drain()
+
+    def follow(self, stop: Optional[threading.Event] = None) -> Iterator[bytes]:
+        """
+        Yields lines as they are appended, until stop is set, polling adaptively while the file is idle.
+
+        Args:
+            stop (Optional[threading.Event]): Ends following once set, checked between polls. Follows forever if None.
+
+        Yields:
+            bytes: Each complete line, in file order.
+        """
+        delay = self.poll_min_seconds
+        try:
+            while stop is None or not stop.is_set():
+                idle = True
+                for line in self.iter_available_lines():
+                    idle = False
+                    yield line
+                if not idle:
+                    delay = self.poll_min_seconds
+                    continue
+                if stop is None:
+                    time.sleep(delay)
+                else:
+                    stop.wait(delay)
+                delay = min(delay * 2, self.poll_max_seconds)
+        finally:
+            self.close()
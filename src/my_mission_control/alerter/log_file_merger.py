@@ -0,0 +1,65 @@
+"""
+Merges the telemetry logs of several ground stations into one stream in timestamp order.
+
+Each station log is read lazily through a large read buffer, compressed archives are decompressed as they are
+read, and lines are parsed as bytes. The per-file streams of log entries are merged with a k-way heap merge,
+so only one pending entry per file is held in memory.
+Entries with equal timestamps come out in the order the files were given.
+"""
+
+import heapq
+from contextlib import closing
+from operator import attrgetter
+from typing import Iterator, Sequence
+
+from structlog.stdlib import get_logger
+
+from my_mission_control.alerter.log_file_decompressor import detect_compression, iter_decompressed_log_lines
+from my_mission_control.alerter.log_file_scanner import SCAN_BLOCK_SIZE
+from my_mission_control.alerter.log_line_parser import parse_log_line_bytes
+from my_mission_control.entity.log_entry import LogEntry
+
+logger = get_logger(__name__)
+
+
+def iter_log_entries(log_file: str, buffer_size: int = SCAN_BLOCK_SIZE, decompress_in_thread: bool = False) -> Iterator[LogEntry[int]]:
+    """
+    Yields the log entries of a log file, timestamped with int epoch microseconds, skipping malformed lines.
+
+    Warns once if the file is not sorted by timestamp, since merging then cannot produce an ordered stream.
+    A gzip, bzip2 or xz compressed file is decompressed as it is read.
+
+    Args:
+        log_file (str): Path to the telemetry log file.
+        buffer_size (int): Size of the read buffer in bytes.
+        decompress_in_thread (bool): Decompress a compressed file in a background thread.
+    """
+    previous_ts = -1 << 63
+    in_order = True
+    compression = detect_compression(log_file)
+    with open(log_file, "rb", buffering=buffer_size) if compression is None else closing(iter_decompressed_log_lines(log_file, compression, decompress_in_thread, read_size=buffer_size)) as log_lines:
+        for line in log_lines:
+            log_entry = parse_log_line_bytes(line)
+            if log_entry is None:
+                logger.warning(f"Skipping malformed or unparseable line in {log_file}: {line!r}")
+                continue
+            if in_order:
+                if log_entry.timestamp < previous_ts:
+                    logger.warning(f"{log_file} is not sorted by timestamp, merged log entries will be out of order")
+                    in_order = False
+                previous_ts = log_entry.timestamp
+            yield log_entry
+
+
+def merge_log_files(log_files: Sequence[str], decompress_in_thread: bool = False) -> Iterator[LogEntry[int]]:
+    """
+    Lazily merges time-sorted log files into a single stream of log entries in timestamp order.
+
+    Args:
+        log_files (Sequence[str]): Paths to the telemetry log files, each sorted by timestamp.
+        decompress_in_thread (bool): Decompress each compressed file in a background thread of its own.
+
+    Returns:
+        Iterator[LogEntry[int]]: Log entries of all files, timestamped with int epoch microseconds.
+    """
+    return heapq.merge(*(iter_log_entries(log_file, decompress_in_thread=decompress_in_thread) for log_file in log_files), key=attrgetter("timestamp"))
@@ -5,13 +5,25 @@ Each log line is parsed into a structured LogEntry. Alerts are triggered when vi
 defined thresholds within a time window, using component-specific alert evaluation strategies.
 """
 
-from typing import Dict, List, Optional, TextIO
+import os
+import threading
+from contextlib import closing
+from itertools import islice
+from typing import IO, AnyStr, Callable, Generator, Iterable, Iterator, List, Optional, Sequence, Union
 
 from structlog.stdlib import get_logger
 
-from my_mission_control.alerter.alert_strategy import AlertEvalStrategy, RedHighAlertStrategy, RedLowAlertStrategy
 from my_mission_control.alerter.alert_tracker import AlertTracker
-from my_mission_control.alerter.log_line_parser import parse_log_line
+from my_mission_control.alerter.alert_tracker_factory import create_alert_eval_strategy_map, create_alert_tracker
+from my_mission_control.alerter.batch_alert_detector import BatchAlertDetector
+from my_mission_control.alerter.log_batch_parser import LogBatchParser
+from my_mission_control.alerter.log_file_decompressor import detect_compression, iter_decompressed_log_lines
+from my_mission_control.alerter.log_file_follower import LogFileFollower
+from my_mission_control.alerter.log_file_merger import merge_log_files
+from my_mission_control.alerter.log_file_scanner import iter_log_lines_mmap, iter_log_lines_stream
+from my_mission_control.alerter.log_line_parser import LazyLogLineParser, parse_log_line_bytes, parse_log_line_us
+from my_mission_control.alerter.reorder_buffer import ReorderBuffer, reorder_log_entries
+from my_mission_control.alerter.tracker_checkpoint import TrackerCheckpoint, load_checkpoint, save_checkpoint
 from my_mission_control.config.settings import InputLogFileCfg
 from my_mission_control.entity.alert import Alert
 from my_mission_control.entity.log_entry import LogEntry
@@ -19,24 +31,25 @@ from my_mission_control.entity.log_entry import LogEntry
 logger = get_logger(__name__)
 
 
-def _process_log_line(line: str, alert_tracker: AlertTracker) -> Optional[Alert]:
+def process_log_line(line: AnyStr, alert_tracker: AlertTracker, line_parser: Callable[[AnyStr], Optional[LogEntry]] = parse_log_line_us) -> Optional[Alert]:
     """
     Processes a single satellite telemetry log file line and returns an alert if one is detected.
 
-    Each line is parsed into a LogEntry. If the number of violations for a component
+    Each line is parsed into a LogEntry, timestamped with int epoch microseconds by default. If the number of violations for a component
     exceeds the threshold within a time window, an alert is generated using the appropriate strategy.
 
     Args:
-        line (str): A single line from the telemetry log file.
+        line (AnyStr): A single line from the telemetry log file.
         alert_tracker (AlertTracker): Tracker that evaluates log entries against alert thresholds.
+        line_parser (Callable[[AnyStr], Optional[LogEntry]]): Parser for the line, parse_log_line_bytes for bytes lines.
 
     Returns:
         Optional[Alert]: An Alert object if a violation is detected; otherwise, None.
     """
-    log_entry: Optional[LogEntry] = parse_log_line(line)
+    log_entry: Optional[LogEntry] = line_parser(line)
 
     if log_entry is None:
-        logger.warning("Skipping malformed or unparseable line", line)
+        logger.warning(f"Skipping malformed or unparseable line: {line!r}")
         return None
     alert: Optional[Alert] = alert_tracker.process_log_entry(log_entry)
 
@@ -45,7 +58,28 @@ def _process_log_line(line: str, alert_tracker: AlertTracker) -> Optional[Alert]
     return alert
 
 
-def _process_log_lines(log_lines: TextIO) -> List[dict]:
+def _iter_log_lines_alerts(log_lines: Iterable[AnyStr], line_parser: Callable[[AnyStr], Optional[LogEntry]] = parse_log_line_us, evict_idle_keys: bool = False) -> Iterator[Alert]:
+    """
+    Line-by-line processes satellite telemetry log lines and yields each alert as soon as it is triggered.
+
+    Args:
+        log_lines (Iterable[AnyStr]): A file-like object containing telemetry log lines, or any other line source
+            such as iter_log_lines_mmap.
+        line_parser (Callable[[AnyStr], Optional[LogEntry]]): Parser for each line, parse_log_line_bytes for bytes lines.
+        evict_idle_keys (bool): Drop idle satellite component state, for unbounded line sources.
+
+    Yields:
+        Alert: Alerts in the order they are triggered.
+    """
+    alert_tracker = create_alert_tracker(evict_idle_keys)
+
+    for line in log_lines:
+        alert = process_log_line(line, alert_tracker, line_parser)
+        if alert:
+            yield alert
+
+
+def _process_log_lines(log_lines: Iterable[AnyStr], line_parser: Callable[[AnyStr], Optional[LogEntry]] = parse_log_line_us) -> List[dict]:
     """
     Line-by-line processes satellite telemetry log and generates alerts.
 
@@ -53,38 +87,401 @@ def _process_log_lines(log_lines: TextIO) -> List[dict]:
         Alerts are collected and returned as dictionaries with key in camelCase as required for reporting.
 
     Args:
-        log_lines (TextIO): A file-like object containing telemetry log lines.
+        log_lines (Iterable[AnyStr]): A file-like object containing telemetry log lines, or any other line source
+            such as iter_log_lines_mmap.
+        line_parser (Callable[[AnyStr], Optional[LogEntry]]): Parser for each line, parse_log_line_bytes for bytes lines.
 
     Returns:
         List[dict]: A list of dictionaries generated from the log lines.
     """
-    alerts: List[dict] = []
+    return [alert.to_dict() for alert in _iter_log_lines_alerts(log_lines, line_parser)]
+
+
+def _parse_log_lines(log_lines: Iterable[AnyStr], line_parser: Callable[[AnyStr], Optional[LogEntry[int]]] = parse_log_line_us) -> Iterator[LogEntry[int]]:
+    """
+    Parses log lines into log entries, skipping malformed lines.
+    """
+    for line in log_lines:
+        log_entry = line_parser(line)
+        if log_entry is None:
+            logger.warning(f"Skipping malformed or unparseable line: {line!r}")
+            continue
+        yield log_entry
+
+
+def _iter_log_entry_alerts(log_entries: Iterable[LogEntry[int]], allowed_lateness_us: Optional[int] = None, evict_idle_keys: bool = False) -> Iterator[Alert]:
+    """
+    Feeds log entries to an alert tracker and yields each alert as soon as it is triggered.
+
+    Args:
+        log_entries (Iterable[LogEntry[int]]): Log entries timestamped with int epoch microseconds.
+        allowed_lateness_us (Optional[int]): When set, entries go through a reorder buffer first, entries later
+            than this many microseconds are dropped.
+        evict_idle_keys (bool): Drop idle satellite component state, for unbounded entry sources.
+
+    Yields:
+        Alert: Alerts in the order they are triggered.
+    """
+    alert_tracker = create_alert_tracker(evict_idle_keys)
+    reorder_buffer = ReorderBuffer(allowed_lateness_us) if allowed_lateness_us is not None else None
+    if reorder_buffer is not None:
+        log_entries = reorder_log_entries(log_entries, reorder_buffer)
+
+    for log_entry in log_entries:
+        alert = alert_tracker.process_log_entry(log_entry)
+        if alert:
+            yield alert
+
+    if reorder_buffer is not None and reorder_buffer.dropped_late_count:
+        logger.warning(f"Dropped {reorder_buffer.dropped_late_count} log entries arriving more than {allowed_lateness_us} microseconds late")
+
+
+def _process_log_lines_reordered(log_lines: Iterable[AnyStr], allowed_lateness_us: int, line_parser: Callable[[AnyStr], Optional[LogEntry[int]]] = parse_log_line_us) -> List[dict]:
+    """
+    Processes roughly time-ordered satellite telemetry log lines through a reorder buffer and generates alerts.
+
+    Log entries are handed to the alert tracker in timestamp order once the watermark passes them,
+    entries more than allowed_lateness_us behind the newest timestamp seen are dropped.
+
+    Args:
+        log_lines (Iterable[AnyStr]): A file-like object containing telemetry log lines, or any other line source.
+        allowed_lateness_us (int): How far behind the newest timestamp seen a line may arrive, in microseconds.
+        line_parser (Callable[[AnyStr], Optional[LogEntry[int]]]): Parser for each line, parse_log_line_bytes for bytes lines.
+
+    Returns:
+        List[dict]: A list of dictionaries generated from the log lines.
+    """
+    return [alert.to_dict() for alert in _iter_log_entry_alerts(_parse_log_lines(log_lines, line_parser), allowed_lateness_us)]
+
 
-    # Map each component to its corresponding alert evaluation strategy
-    alert_eval_strategy_map: Dict[str, AlertEvalStrategy] = {InputLogFileCfg.LOG_LINE_COMPONENT_BATT: RedLowAlertStrategy(), InputLogFileCfg.LOG_LINE_COMPONENT_TSTAT: RedHighAlertStrategy()}
-    # Initialize the alert tracker with alert evaluation stragegy mapping
-    alert_tracker = AlertTracker(alert_eval_strategy_map)
+def _process_log_lines_lazy(log_lines: Iterable[str]) -> List[dict]:
+    """
+    Processes satellite telemetry log lines with lazy parsing and generates alerts.
+
+    Only the fields each component's strategy needs are decoded to evaluate a line, lines are fully parsed
+    and handed to the alert tracker only when they violate a limit.
+    Produces the same alerts, in the same order, as _process_log_lines.
+
+    Args:
+        log_lines (Iterable[str]): A file-like object containing telemetry log lines, or any other source of str lines.
+
+    Returns:
+        List[dict]: A list of dictionaries generated from the log lines.
+    """
+    alerts: List[dict] = []
+    alert_tracker = create_alert_tracker()
+    lazy_parser = LazyLogLineParser(alert_tracker.alert_eval_strategy_map)
 
     for line in log_lines:
-        alert = _process_log_line(line, alert_tracker)
+        log_entry = lazy_parser.parse_violation(line)
+        if log_entry is None:
+            continue
+        alert = alert_tracker.process_log_entry(log_entry)
         if alert:
             alerts.append(alert.to_dict())
 
     return alerts
 
 
-def process_log_file(log_file: str) -> List[dict]:
+def _process_log_lines_batch(log_lines: Iterable[str], batch_size: int) -> List[dict]:
+    """
+    Processes satellite telemetry log lines in chunks parsed into columnar arrays and generates alerts.
+
+    Produces the same alerts, in the same order, as _process_log_lines.
+
+    Args:
+        log_lines (Iterable[str]): A file-like object containing telemetry log lines, or any other source of str lines.
+        batch_size (int): Number of lines parsed per chunk.
+
+    Returns:
+        List[dict]: A list of dictionaries generated from the log lines.
+    """
+    alerts: List[dict] = []
+    alert_tracker = create_alert_tracker()
+    batch_parser = LogBatchParser()
+
+    while chunk := list(islice(log_lines, batch_size)):
+        for alert in alert_tracker.process_log_columns(batch_parser.parse(chunk)):
+            alerts.append(alert.to_dict())
+
+    return alerts
+
+
+def _process_log_lines_vectorized(log_lines: Iterable[str], batch_size: int) -> List[dict]:
+    """
+    Processes a whole satellite telemetry log with vectorized sliding-window alert detection.
+
+    Collects the violations of every chunk and detects all alerts once the input is exhausted.
+    Produces the same alerts, in the same order, as _process_log_lines.
+
+    Args:
+        log_lines (Iterable[str]): A file-like object containing telemetry log lines, or any other source of str lines.
+        batch_size (int): Number of lines parsed per chunk.
+
+    Returns:
+        List[dict]: A list of dictionaries generated from the log lines.
+    """
+    detector = BatchAlertDetector(create_alert_eval_strategy_map())
+    batch_parser = LogBatchParser()
+
+    while chunk := list(islice(log_lines, batch_size)):
+        detector.add_columns(batch_parser.parse(chunk))
+
+    return [alert.to_dict() for alert in detector.detect()]
+
+
+def _process_text_log_lines(log_lines: Iterable[str], batch_size: Optional[int], vectorized: bool, lazy: bool) -> List[dict]:
+    """
+    Processes str log lines with the processing mode selected for process_log_file.
+    """
+    if vectorized:
+        return _process_log_lines_vectorized(log_lines, batch_size or InputLogFileCfg.LOG_BATCH_SIZE)
+    if batch_size:
+        return _process_log_lines_batch(log_lines, batch_size)
+    if lazy:
+        return _process_log_lines_lazy(log_lines)
+    return _process_log_lines(log_lines)
+
+
+def process_log_file(log_file: str, batch_size: Optional[int] = None, vectorized: bool = False, memory_mapped: bool = False, lazy: bool = False, allowed_lateness_us: Optional[int] = None, decompress_in_thread: bool = False) -> List[dict]:
     """
     Processes a satellite telemetry log file line-by-line and generates alerts.
 
     Opens the file, reads each line, and evaluates it using component-specific alert strategies.
     Alerts are returned as dictionaries for further reporting with required keys.
+    A gzip, bzip2 or xz compressed file, recognized by its magic bytes, is decompressed as it is read.
 
     Args:
         log_file (str): Path to the telemetry log file.
+        batch_size (Optional[int]): When set, lines are parsed in chunks of this size into columnar arrays
+            instead of one LogEntry per line.
+        vectorized (bool): Detect alerts for the whole file at once with vectorized window logic,
+            parsing chunks of batch_size lines (default InputLogFileCfg.LOG_BATCH_SIZE).
+        memory_mapped (bool): Read the file line-by-line as bytes through a memory map, decoding only the
+            fields needed, instead of in text mode. Compressed files are always read as bytes, without a memory map.
+        lazy (bool): Decode only the fields each component's strategy needs, fully parsing violating lines only.
+        allowed_lateness_us (Optional[int]): When set, lines may arrive out of timestamp order by up to this many
+            microseconds, they are reordered before alert tracking and later lines are dropped.
+        decompress_in_thread (bool): Decompress a compressed file in a background thread, overlapping
+            decompression with parsing.
 
     Returns:
         List[dict]: A list of alert dictionaries generated from the log file.
+
+    Raises:
+        ValueError: If memory_mapped or allowed_lateness_us is combined with batch_size, vectorized or lazy.
     """
+    if batch_size or vectorized or lazy:
+        if memory_mapped:
+            raise ValueError("memory_mapped cannot be combined with batch_size, vectorized or lazy")
+        if allowed_lateness_us is not None:
+            raise ValueError("allowed_lateness_us cannot be combined with batch_size, vectorized or lazy")
+
+    compression = detect_compression(log_file)
+    if compression is not None:
+        with closing(iter_decompressed_log_lines(log_file, compression, decompress_in_thread)) as byte_lines:
+            if allowed_lateness_us is not None:
+                return _process_log_lines_reordered(byte_lines, allowed_lateness_us, parse_log_line_bytes)
+            if vectorized or batch_size or lazy:
+                return _process_text_log_lines(map(bytes.decode, byte_lines), batch_size, vectorized, lazy)
+            return _process_log_lines(byte_lines, parse_log_line_bytes)
+
+    if allowed_lateness_us is not None:
+        if memory_mapped:
+            return _process_log_lines_reordered(iter_log_lines_mmap(log_file), allowed_lateness_us, parse_log_line_bytes)
+        with open(log_file, "r") as log_lines:
+            return _process_log_lines_reordered(log_lines, allowed_lateness_us)
+
+    if memory_mapped:
+        return _process_log_lines(iter_log_lines_mmap(log_file), parse_log_line_bytes)
+
     with open(log_file, "r") as log_lines:
-        return _process_log_lines(log_lines)
+        return _process_text_log_lines(log_lines, batch_size, vectorized, lazy)
+
+
+def iter_alerts(log_file: str, memory_mapped: bool = False, allowed_lateness_us: Optional[int] = None, as_dict: bool = True, decompress_in_thread: bool = False) -> Generator[Union[dict, Alert], None, None]:
+    """
+    Processes a satellite telemetry log file line-by-line and yields each alert as soon as it is triggered.
+
+    Streaming counterpart of process_log_file: memory does not grow with the number of alerts, and the first
+    alert is available as soon as the line that triggers it has been read. A compressed file is decompressed
+    as it is read.
+
+    Args:
+        log_file (str): Path to the telemetry log file.
+        memory_mapped (bool): Read the file as bytes through a memory map instead of in text mode.
+        allowed_lateness_us (Optional[int]): When set, lines may arrive out of timestamp order by up to this many
+            microseconds, they are reordered before alert tracking and later lines are dropped.
+        as_dict (bool): Yield alert dictionaries, or the Alert objects themselves for serializing them directly.
+        decompress_in_thread (bool): Decompress a compressed file in a background thread.
+
+    Yields:
+        Union[dict, Alert]: Alert dictionaries with keys in camelCase, in the order process_log_file returns them,
+            or Alert objects.
+    """
+    alerts: Iterator[Alert]
+    compression = detect_compression(log_file)
+    if memory_mapped or compression is not None:
+        log_lines: Generator[bytes, None, None] = iter_log_lines_mmap(log_file) if compression is None else iter_decompressed_log_lines(log_file, compression, decompress_in_thread)
+        with closing(log_lines):
+            if allowed_lateness_us is not None:
+                alerts = _iter_log_entry_alerts(_parse_log_lines(log_lines, parse_log_line_bytes), allowed_lateness_us)
+            else:
+                alerts = _iter_log_lines_alerts(log_lines, parse_log_line_bytes)
+            yield from (map(Alert.to_dict, alerts) if as_dict else alerts)
+        return
+
+    with open(log_file, "r") as text_lines:
+        if allowed_lateness_us is not None:
+            alerts = _iter_log_entry_alerts(_parse_log_lines(text_lines), allowed_lateness_us)
+        else:
+            alerts = _iter_log_lines_alerts(text_lines)
+        yield from (map(Alert.to_dict, alerts) if as_dict else alerts)
+
+
+def iter_merged_alerts(log_files: Sequence[str], allowed_lateness_us: Optional[int] = None, as_dict: bool = True, decompress_in_thread: bool = False) -> Iterator[Union[dict, Alert]]:
+    """
+    Streaming counterpart of process_log_files, yields each alert as soon as it is triggered.
+    """
+    alerts = _iter_log_entry_alerts(merge_log_files(log_files, decompress_in_thread), allowed_lateness_us)
+    yield from (map(Alert.to_dict, alerts) if as_dict else alerts)
+
+
+def iter_stream_alerts(stream: IO[bytes], allowed_lateness_us: Optional[int] = None, as_dict: bool = True) -> Iterator[Union[dict, Alert]]:
+    """
+    Processes telemetry log lines from a binary stream, such as a pipe on stdin, yielding each alert as soon as it is triggered.
+
+    The stream is read in large chunks and split into lines incrementally, and the alert tracker drops idle
+    satellite component state, so memory stays bounded however long the stream runs.
+
+    Args:
+        stream (IO[bytes]): Binary stream of telemetry log lines, such as sys.stdin.buffer.
+        allowed_lateness_us (Optional[int]): When set, lines may arrive out of timestamp order by up to this many
+            microseconds, they are reordered before alert tracking and later lines are dropped.
+        as_dict (bool): Yield alert dictionaries, or the Alert objects themselves for serializing them directly.
+
+    Yields:
+        Union[dict, Alert]: Alert dictionaries with keys in camelCase, or Alert objects.
+    """
+    log_lines = iter_log_lines_stream(stream)
+    alerts: Iterator[Alert]
+    if allowed_lateness_us is not None:
+        alerts = _iter_log_entry_alerts(_parse_log_lines(log_lines, parse_log_line_bytes), allowed_lateness_us, evict_idle_keys=True)
+    else:
+        alerts = _iter_log_lines_alerts(log_lines, parse_log_line_bytes, evict_idle_keys=True)
+    yield from (map(Alert.to_dict, alerts) if as_dict else alerts)
+
+
+def follow_alerts(log_file: str, stop: Optional[threading.Event] = None, as_dict: bool = True) -> Iterator[Union[dict, Alert]]:
+    """
+    Processes a telemetry log file that is being appended to, yielding each alert as soon as it is triggered.
+
+    The existing lines are processed first, then lines are processed as they are appended, across log rotations,
+    with one alert tracker that drops idle satellite component state so memory stays bounded.
+
+    Args:
+        log_file (str): Path to the telemetry log file.
+        stop (Optional[threading.Event]): Ends following once set. Follows forever if None.
+        as_dict (bool): Yield alert dictionaries, or the Alert objects themselves for serializing them directly.
+
+    Yields:
+        Union[dict, Alert]: Alert dictionaries with keys in camelCase, or Alert objects.
+    """
+    alert_tracker = create_alert_tracker(evict_idle_keys=True)
+    for line in LogFileFollower(log_file).follow(stop):
+        alert = process_log_line(line, alert_tracker, parse_log_line_bytes)
+        if alert:
+            yield alert.to_dict() if as_dict else alert
+
+
+def process_log_files(log_files: Sequence[str], allowed_lateness_us: Optional[int] = None, decompress_in_thread: bool = False) -> List[dict]:
+    """
+    Processes the telemetry logs of several ground stations as one stream and generates alerts.
+
+    The files, each sorted by timestamp, are merged lazily in timestamp order into a single alert tracker,
+    so violations reported by different stations count in the same window.
+
+    Args:
+        log_files (Sequence[str]): Paths to the telemetry log files.
+        allowed_lateness_us (Optional[int]): When set, the merged stream is reordered before alert tracking,
+            for files that are only roughly sorted, log entries later than this many microseconds are dropped.
+        decompress_in_thread (bool): Decompress each compressed file in a background thread of its own.
+
+    Returns:
+        List[dict]: A list of alert dictionaries generated from the merged log files.
+    """
+    return [alert.to_dict() for alert in _iter_log_entry_alerts(merge_log_files(log_files, decompress_in_thread), allowed_lateness_us)]
+
+
+def _resume_offset(checkpoint_file: str, log_file: str, inode: int, size: int, alert_tracker: AlertTracker) -> int:
+    """
+    Restores the tracker from a checkpoint of the same log file and returns the byte offset to resume from.
+
+    Starts over from the beginning of the file, with the tracker untouched, when there is no usable checkpoint,
+    or when it was taken on another file, on a replaced file, or past the end of a truncated file.
+    """
+    try:
+        checkpoint = load_checkpoint(checkpoint_file)
+    except FileNotFoundError:
+        logger.info(f"No checkpoint found at {checkpoint_file}, processing {log_file} from the start")
+        return 0
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable checkpoint {checkpoint_file} - {e}")
+        return 0
+
+    if checkpoint.log_file != os.path.abspath(log_file) or checkpoint.inode != inode or checkpoint.offset > size:
+        logger.warning(f"Checkpoint {checkpoint_file} was taken on {checkpoint.log_file} (inode {checkpoint.inode}), processing {log_file} from the start")
+        return 0
+
+    checkpoint.restore(alert_tracker)
+    logger.info(f"Resuming {log_file} at byte {checkpoint.offset}")
+    return checkpoint.offset
+
+
+def process_log_file_checkpointed(log_file: str, checkpoint_file: str, resume: bool = False, interval_lines: int = InputLogFileCfg.LOG_CHECKPOINT_INTERVAL_LINES) -> List[dict]:
+    """
+    Processes a satellite telemetry log file line-by-line, periodically checkpointing the tracker state.
+
+    A checkpoint is written every interval_lines lines and once the file is exhausted, holding the tracker
+    windows and the byte offset of the next line. With resume, the tracker is restored from the checkpoint
+    and processing seeks straight to its offset, so only lines appended since are processed and only their
+    alerts are returned. A last line without a newline may still be being written, the checkpoint is left at its start
+    so a resume reads it again. A run without resume processes it like any other line, a resumed run leaves it to the next.
+
+    Args:
+        log_file (str): Path to the telemetry log file.
+        checkpoint_file (str): Path of the checkpoint file, written atomically.
+        resume (bool): Resume from checkpoint_file when it holds a checkpoint of the same log file.
+        interval_lines (int): Lines processed between two checkpoints.
+
+    Returns:
+        List[dict]: A list of alert dictionaries generated from the processed lines.
+    """
+    alerts: List[dict] = []
+    alert_tracker = create_alert_tracker()
+
+    with open(log_file, "rb") as log_lines:
+        stat = os.fstat(log_lines.fileno())
+        offset = _resume_offset(checkpoint_file, log_file, stat.st_ino, stat.st_size, alert_tracker) if resume else 0
+        log_lines.seek(offset)
+
+        partial_line = b""
+        for line_count, line in enumerate(log_lines, 1):
+            if not line.endswith(b"\n"):
+                # A last line without a newline may still be being written, the checkpoint stays at its start so it is processed on resume once complete
+                partial_line = line
+                break
+            offset += len(line)
+            alert = process_log_line(line, alert_tracker, parse_log_line_bytes)
+            if alert:
+                alerts.append(alert.to_dict())
+            if line_count % interval_lines == 0:
+                save_checkpoint(checkpoint_file, TrackerCheckpoint.capture(alert_tracker, log_file, stat.st_ino, offset))
+
+    save_checkpoint(checkpoint_file, TrackerCheckpoint.capture(alert_tracker, log_file, stat.st_ino, offset))
+    if partial_line and not resume:
+        # A run over the whole file processes its last line like process_log_file does, after the checkpoint so a resume reads it afresh
+        alert = process_log_line(partial_line, alert_tracker, parse_log_line_bytes)
+        if alert:
+            alerts.append(alert.to_dict())
+    return alerts
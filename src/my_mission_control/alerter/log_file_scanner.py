@@ -0,0 +1,136 @@
+"""
+Memory-mapped, bytes-level line source for telemetry log files, and a chunked one for pipes.
+
+Text mode decodes every byte of a file to str before a line is even looked at. The scanner maps the file
+into memory instead and walks it in blocks: bytes.find locates the first line boundary past each block size,
+and the block is split into lines in one call. Paired with parse_log_line_bytes, only the timestamp and
+component fields are ever decoded.
+"""
+
+import mmap
+import os
+from typing import IO, Generator, Iterator, List, Optional, Tuple
+
+NEWLINE = b"\n"
+# Bytes scanned per block, extended to the next line boundary
+SCAN_BLOCK_SIZE = 1 << 20
+
+
+def iter_log_lines_mmap(log_file: str, block_size: int = SCAN_BLOCK_SIZE, start: int = 0, end: Optional[int] = None) -> Generator[bytes, None, None]:
+    """
+    Yields the lines of a log file, or of a byte range of it, as bytes, read through a read-only memory map.
+
+    Lines keep any trailing carriage return, the line parsers strip it along with other whitespace.
+
+    Args:
+        log_file (str): Path to the telemetry log file.
+        block_size (int): Approximate number of bytes split into lines at a time.
+        start (int): Offset of the first byte to scan, expected at the start of a line.
+        end (Optional[int]): Offset just past the last byte to scan, expected just past a newline
+            or at the end of the file. Defaults to the end of the file.
+
+    Yields:
+        bytes: Each line of the file without its newline.
+    """
+    with open(log_file, "rb") as f:
+        # An empty file cannot be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm) if end is None else min(end, len(mm))
+            if start >= size:
+                return
+            # A final newline ends the last line, it does not start an empty one
+            data_end = size - 1 if mm[size - 1] == NEWLINE[0] else size
+            while start < size:
+                line_end = mm.find(NEWLINE, start + block_size, data_end) if start + block_size < data_end else -1
+                if line_end == -1:
+                    line_end = data_end
+                yield from mm[start:line_end].split(NEWLINE)
+                start = line_end + 1
+
+
+def split_log_file(log_file: str, parts: int) -> List[Tuple[int, int]]:
+    """
+    Splits a log file into byte ranges of roughly equal size, each starting at the beginning of a line.
+
+    Args:
+        log_file (str): Path to the telemetry log file.
+        parts (int): Number of ranges wanted, fewer are returned for small files.
+
+    Returns:
+        List[Tuple[int, int]]: (start, end) offsets of consecutive non-empty ranges covering the whole file.
+    """
+    with open(log_file, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        boundaries = [0]
+        for part in range(1, parts):
+            offset = size * part // parts
+            if offset <= boundaries[-1]:
+                continue
+            # Move the boundary past the end of the line it falls in
+            f.seek(offset - 1)
+            f.readline()
+            offset = f.tell()
+            if boundaries[-1] < offset < size:
+                boundaries.append(offset)
+        boundaries.append(size)
+    return [(range_start, range_end) for range_start, range_end in zip(boundaries, boundaries[1:]) if range_start < range_end]
+
+
+class LineSplitter:
+    """
+    Splits a stream of byte chunks into lines, carrying a partial trailing line over to the next chunk.
+
+    Used for sources read in fixed-size chunks, which cut lines anywhere: appended files and pipes.
+    """
+
+    def __init__(self):
+        self._partial = b""
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of bytes of the partial line waiting for its newline.
+        """
+        return len(self._partial)
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """
+        Adds a chunk and returns the lines it completes, without their newline.
+        """
+        lines = chunk.split(NEWLINE)
+        if self._partial:
+            lines[0] = self._partial + lines[0]
+        self._partial = lines.pop()
+        return lines
+
+    def flush(self) -> Optional[bytes]:
+        """
+        Returns the partial line, at the end of the stream, or None if the stream ended with a newline.
+        """
+        partial, self._partial = self._partial, b""
+        return partial or None
+
+
+def iter_log_lines_stream(stream: IO[bytes], read_size: int = SCAN_BLOCK_SIZE) -> Iterator[bytes]:
+    """
+    Yields the lines of a binary stream, such as a pipe on stdin, as bytes, read in chunks of up to read_size.
+
+    Each read returns whatever the stream has available, so a line is yielded as soon as it is complete rather
+    than once a whole chunk has filled, and memory is bounded by the chunk size plus the longest line.
+
+    Args:
+        stream (IO[bytes]): Binary stream, such as sys.stdin.buffer.
+        read_size (int): Largest number of bytes read at a time.
+
+    Yields:
+        bytes: Each line of the stream without its newline, the last one even without a newline.
+    """
+    read = getattr(stream, "read1", stream.read)
+    splitter = LineSplitter()
+    while chunk := read(read_size):
+        yield from splitter.feed(chunk)
+    partial = splitter.flush()
+    if partial:
+        yield partial
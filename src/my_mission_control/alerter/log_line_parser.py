@@ -2,18 +2,27 @@
 Parses telemetry log file lines into structured LogEntry objects.
 """
 
+from dataclasses import fields
 from datetime import datetime
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from structlog.stdlib import get_logger
 
+from my_mission_control.alerter.alert_strategy import AlertEvalStrategy
+from my_mission_control.alerter.timestamp_parser import parse_log_timestamp, parse_log_timestamp_us
 from my_mission_control.config.settings import InputLogFileCfg
-from my_mission_control.entity.log_entry import LogEntry
+from my_mission_control.entity.log_entry import LogEntry, TimestampT
 
 logger = get_logger(__name__)
 
+LOG_LINE_DELIMITER_BYTES = InputLogFileCfg.LOG_LINE_DELIMITER.encode()
 
-def parse_log_line(line) -> Optional[LogEntry]:
+# Component names seen in bytes lines, so each distinct component is decoded once
+_COMPONENT_CACHE_MAX_SIZE = 1024
+_component_names: Dict[bytes, str] = {}
+
+
+def parse_log_line(line) -> Optional[LogEntry[datetime]]:
     """
     Parse a telemetry log line into a LogEntry object.
     Returns None if the line is malformed or parsing fails.
@@ -23,10 +32,132 @@ def parse_log_line(line) -> Optional[LogEntry]:
         logger.warning(f"Invalid line, expected {InputLogFileCfg.LOG_LINE_EXPECTED_FIELD_COUNT} fields, got {len(parts)}")
         return None
 
+    return _log_entry_from_parts(parts, line, parse_log_timestamp)
+
+
+def parse_log_line_us(line) -> Optional[LogEntry[int]]:
+    """
+    Parse a telemetry log line into a LogEntry object timestamped with int microseconds since the Unix epoch.
+    Returns None if the line is malformed or parsing fails.
+    """
+    parts = line.strip().split(InputLogFileCfg.LOG_LINE_DELIMITER)
+    if len(parts) != InputLogFileCfg.LOG_LINE_EXPECTED_FIELD_COUNT:
+        logger.warning(f"Invalid line, expected {InputLogFileCfg.LOG_LINE_EXPECTED_FIELD_COUNT} fields, got {len(parts)}")
+        return None
+
+    return _log_entry_from_parts(parts, line, parse_log_timestamp_us)
+
+
+def _log_entry_from_parts(parts: List[str], line: str, parse_timestamp: Callable[[str], TimestampT]) -> Optional[LogEntry[TimestampT]]:
+    """
+    Converts the fields of a split log line into a LogEntry object, decoding the timestamp with parse_timestamp.
+    Returns None if a field fails to parse.
+    """
     try:
         ts_str, sat_id, rhl, yhl, yll, rll, val, cmpnt = parts
-        ts = datetime.strptime(ts_str, InputLogFileCfg.LOG_LINE_TIMESTAMP_FORMAT)
+        ts = parse_timestamp(ts_str)
         return LogEntry(ts, int(sat_id), int(rhl), int(yhl), int(yll), int(rll), float(val), cmpnt)
     except Exception as e:
         logger.error(f"Failed to parse line: '{line}' - {e}")
         return None
+
+
+def parse_log_line_bytes(line: bytes) -> Optional[LogEntry[int]]:
+    """
+    Parse a telemetry log line given as bytes into a LogEntry object timestamped with int microseconds since the Unix epoch.
+
+    Numeric fields are converted straight from bytes, only the timestamp and component are decoded.
+    Returns None if the line is malformed or parsing fails, like parse_log_line.
+    """
+    parts = line.strip().split(LOG_LINE_DELIMITER_BYTES)
+    if len(parts) != InputLogFileCfg.LOG_LINE_EXPECTED_FIELD_COUNT:
+        logger.warning(f"Invalid line, expected {InputLogFileCfg.LOG_LINE_EXPECTED_FIELD_COUNT} fields, got {len(parts)}")
+        return None
+
+    try:
+        ts_bytes, sat_id, rhl, yhl, yll, rll, val, cmpnt_bytes = parts
+        ts = parse_log_timestamp_us(ts_bytes.decode("ascii"))
+        cmpnt = _component_names.get(cmpnt_bytes)
+        if cmpnt is None:
+            cmpnt = cmpnt_bytes.decode()
+            if len(_component_names) < _COMPONENT_CACHE_MAX_SIZE:
+                _component_names[cmpnt_bytes] = cmpnt
+        return LogEntry(ts, int(sat_id), int(rhl), int(yhl), int(yll), int(rll), float(val), cmpnt)
+    except Exception as e:
+        logger.error(f"Failed to parse line: '{line.decode(errors='replace')}' - {e}")
+        return None
+
+
+# Converter of each LogEntry field, by field name, fields appear in log lines in LogEntry order
+_FIELD_CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    "timestamp": parse_log_timestamp_us,
+    "satellite_id": int,
+    "red_high_limit": int,
+    "yellow_high_limit": int,
+    "yellow_low_limit": int,
+    "red_low_limit": int,
+    "raw_value": float,
+    "component": str,
+}
+_FIELD_INDEX: Dict[str, int] = {field.name: index for index, field in enumerate(fields(LogEntry))}
+
+
+class LazyLogLineParser:
+    """
+    Parses telemetry log lines in two phases, fully decoding only the lines that violate a limit.
+
+    Phase one converts only the fields the component's strategy declares in required_fields and evaluates the
+    strategy on a partial LogEntry. Only when it reports a violation is the line decoded into a full LogEntry,
+    including its timestamp, as int epoch microseconds, and satellite id. Nominal lines are never fully validated, so a nominal line with
+    a malformed timestamp is skipped silently instead of being logged.
+    """
+
+    def __init__(self, alert_eval_strategy_map: Dict[str, AlertEvalStrategy]):
+        """
+        Initializes the parser with evaluation strategies.
+
+        Args:
+            alert_eval_strategy_map (Dict[str, AlertEvalStrategy]):
+            Mapping of component names to their alert evaluation strategies.
+        """
+        # Per component, its strategy and the (name, index, converter) of each field it reads
+        self._plans: Dict[str, Tuple[AlertEvalStrategy, List[Tuple[str, int, Callable[[str], Any]]]]] = {
+            component: (strategy, [(name, _FIELD_INDEX[name], _FIELD_CONVERTERS[name]) for name in strategy.required_fields if name != "component"]) for component, strategy in alert_eval_strategy_map.items() if strategy
+        }
+
+    def parse_violation(self, line: str) -> Optional[LogEntry[int]]:
+        """
+        Parses a telemetry log line if it violates its component's limit.
+
+        Args:
+            line (str): A single line from the telemetry log file.
+
+        Returns:
+            Optional[LogEntry[int]]: The fully parsed LogEntry of a violating line; None for nominal,
+                malformed or unsupported lines.
+        """
+        parts = line.strip().split(InputLogFileCfg.LOG_LINE_DELIMITER)
+        if len(parts) != InputLogFileCfg.LOG_LINE_EXPECTED_FIELD_COUNT:
+            logger.warning(f"Invalid line, expected {InputLogFileCfg.LOG_LINE_EXPECTED_FIELD_COUNT} fields, got {len(parts)}")
+            return None
+
+        component = parts[-1]
+        plan = self._plans.get(component)
+        if plan is None:
+            logger.warning(f"No alert evaluation strategy found for {component}")
+            return None
+        strategy, required_fields = plan
+
+        # A partial LogEntry holding only the declared fields
+        probe = LogEntry.__new__(LogEntry)
+        try:
+            for name, index, convert in required_fields:
+                setattr(probe, name, convert(parts[index]))
+        except Exception as e:
+            logger.error(f"Failed to parse line: '{line}' - {e}")
+            return None
+        probe.component = component
+
+        if not strategy.evaluate(probe):
+            return None
+        return _log_entry_from_parts(parts, line, parse_log_timestamp_us)
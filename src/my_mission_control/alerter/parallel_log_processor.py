@@ -0,0 +1,108 @@
+"""
+Processes a single large telemetry log file on several cores.
+
+The file is split into newline-aligned byte ranges, and each range is parsed and evaluated in its own process.
+A violation window can span range boundaries, so workers do not detect alerts: they return the violations of
+their range grouped per (satellite, component, severity). The merge step concatenates each group in range order and
+replays the AlertTracker window and re-arm rules, so the alerts are identical to a sequential run.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+from structlog.stdlib import get_logger
+
+from my_mission_control.alerter.alert_tracker_factory import create_alert_eval_strategy_map
+from my_mission_control.alerter.batch_alert_detector import replay_violation_window
+from my_mission_control.alerter.log_file_scanner import iter_log_lines_mmap, split_log_file
+from my_mission_control.alerter.log_line_parser import parse_log_line_bytes
+from my_mission_control.entity.alert import Alert
+
+logger = get_logger(__name__)
+
+# Violations of one (satellite, component, severity) band in line order, as (line number in range, epoch microseconds)
+RangeViolations = Dict[Tuple[int, str, str], List[Tuple[int, int]]]
+
+
+def _collect_range_violations(log_file: str, start: int, end: int) -> RangeViolations:
+    """
+    Parses and evaluates the lines of one byte range, runs in a worker process.
+
+    Args:
+        log_file (str): Path to the telemetry log file.
+        start (int): Offset of the first byte of the range.
+        end (int): Offset just past the last byte of the range.
+
+    Returns:
+        RangeViolations: Violations of the range grouped per (satellite, component, severity).
+    """
+    alert_eval_strategy_map = create_alert_eval_strategy_map()
+    violations: RangeViolations = {}
+
+    for line_number, line in enumerate(iter_log_lines_mmap(log_file, start=start, end=end)):
+        log_entry = parse_log_line_bytes(line)
+        if log_entry is None:
+            logger.warning(f"Skipping malformed or unparseable line: {line!r}")
+            continue
+
+        eval_strategy = alert_eval_strategy_map.get(log_entry.component)
+        if not eval_strategy:
+            logger.warning(f"No alert evaluation strategy found for {log_entry.component}")
+            continue
+
+        severity = eval_strategy.evaluate(log_entry)
+        if severity:
+            violations.setdefault((log_entry.satellite_id, log_entry.component, severity), []).append((line_number, log_entry.timestamp))
+
+    return violations
+
+
+def merge_range_violations(range_violations: List[RangeViolations]) -> List[Alert]:
+    """
+    Replays the window and re-arm rules over the violations of all ranges.
+
+    Args:
+        range_violations (List[RangeViolations]): Violations of each range, in file order.
+
+    Returns:
+        List[Alert]: Alerts in the order a sequential run generates them.
+    """
+    alert_eval_strategy_map = create_alert_eval_strategy_map()
+
+    # Concatenate each (satellite, component, severity) group across ranges, keeping (range index, line number) as order key
+    groups: Dict[Tuple[int, str, str], List[Tuple[Tuple[int, int], int]]] = {}
+    for range_index, violations in enumerate(range_violations):
+        for key, group_violations in violations.items():
+            groups.setdefault(key, []).extend(((range_index, line_number), ts) for line_number, ts in group_violations)
+
+    ordered_alerts: List[Tuple[Tuple[int, int], Alert]] = []
+    for (sat_id, component, severity), group_violations in groups.items():
+        # Only components with a strategy have violations
+        eval_strategy = alert_eval_strategy_map[component]
+        for position, first_ts in replay_violation_window([ts for _, ts in group_violations], eval_strategy.threshold, eval_strategy.window_us):
+            ordered_alerts.append((group_violations[position][0], Alert(sat_id, severity, component, first_ts)))
+
+    ordered_alerts.sort(key=lambda ordered_alert: ordered_alert[0])
+    return [alert for _, alert in ordered_alerts]
+
+
+def process_log_file_parallel(log_file: str, workers: int) -> List[dict]:
+    """
+    Processes a satellite telemetry log file with several worker processes and generates alerts.
+
+    Produces the same alerts, in the same order, as process_log_file.
+
+    Args:
+        log_file (str): Path to the telemetry log file.
+        workers (int): Number of worker processes, the file is split into as many byte ranges.
+
+    Returns:
+        List[dict]: A list of alert dictionaries generated from the log file.
+    """
+    byte_ranges = split_log_file(log_file, workers)
+
+    with ProcessPoolExecutor(max_workers=max(1, min(workers, len(byte_ranges)))) as executor:
+        futures = [executor.submit(_collect_range_violations, log_file, start, end) for start, end in byte_ranges]
+        range_violations = [future.result() for future in futures]
+
+    return [alert.to_dict() for alert in merge_range_violations(range_violations)]
@@ -0,0 +1,101 @@
+"""
+Event-time reorder stage for roughly ordered telemetry feeds.
+
+AlertTracker expects log entries in timestamp order. ReorderBuffer sits in front of it and holds entries in a
+heap until the watermark, the newest timestamp seen minus the allowed lateness, passes them, then releases
+them in timestamp order. Entries arriving with a timestamp already behind the watermark would be released out
+of order, so they are dropped and counted instead. The heap only ever holds entries within the allowed
+lateness of the newest one, so memory is bounded by the lateness times the input rate.
+"""
+
+import heapq
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from my_mission_control.entity.log_entry import LogEntry
+
+
+class ReorderBuffer:
+    """
+    Releases log entries, timestamped with int epoch microseconds, in timestamp order as the watermark advances.
+
+    Entries with equal timestamps are released in arrival order.
+    """
+
+    def __init__(self, allowed_lateness_us: int):
+        """
+        Initializes an empty buffer.
+
+        Args:
+            allowed_lateness_us (int): How far behind the newest timestamp seen an entry may arrive, in microseconds.
+        """
+        if allowed_lateness_us < 0:
+            raise ValueError(f"Allowed lateness must not be negative, got {allowed_lateness_us}")
+        self.allowed_lateness_us = allowed_lateness_us
+        self._heap: List[Tuple[int, int, LogEntry[int]]] = []
+        self._sequence = 0
+        self.watermark_us: Optional[int] = None
+        self.dropped_late_count = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, log_entry: LogEntry[int]) -> Sequence[LogEntry[int]]:
+        """
+        Buffers a log entry and releases the entries the watermark has passed.
+
+        Args:
+            log_entry (LogEntry[int]): Log entry timestamped with int epoch microseconds.
+
+        Returns:
+            Sequence[LogEntry[int]]: Released entries in timestamp order, empty if none. A late entry is dropped
+                and not released.
+        """
+        ts = log_entry.timestamp
+        watermark_us = self.watermark_us
+        if watermark_us is not None and ts < watermark_us:
+            self.dropped_late_count += 1
+            return ()
+
+        heap = self._heap
+        heapq.heappush(heap, (ts, self._sequence, log_entry))
+        self._sequence += 1
+
+        if watermark_us is None or ts - self.allowed_lateness_us > watermark_us:
+            watermark_us = self.watermark_us = ts - self.allowed_lateness_us
+        if heap[0][0] > watermark_us:
+            return ()
+
+        released: List[LogEntry[int]] = []
+        while heap and heap[0][0] <= watermark_us:
+            released.append(heapq.heappop(heap)[2])
+        return released
+
+    def flush(self) -> List[LogEntry[int]]:
+        """
+        Releases every buffered entry in timestamp order, at the end of the input.
+
+        Returns:
+            List[LogEntry[int]]: The remaining entries in timestamp order.
+        """
+        heap = self._heap
+        released = [heapq.heappop(heap)[2] for _ in range(len(heap))]
+        if released:
+            # Buffered entries are all ahead of the watermark, entries older than the newest released are now late
+            self.watermark_us = released[-1].timestamp
+        return released
+
+
+def reorder_log_entries(log_entries: Iterable[LogEntry[int]], reorder_buffer: ReorderBuffer) -> Iterator[LogEntry[int]]:
+    """
+    Passes a stream of log entries through a reorder buffer, flushing it at the end of the stream.
+
+    Args:
+        log_entries (Iterable[LogEntry[int]]): Log entries timestamped with int epoch microseconds, roughly in order.
+        reorder_buffer (ReorderBuffer): Buffer holding the entries until the watermark passes them.
+
+    Yields:
+        LogEntry: Entries in timestamp order, without the entries dropped as late.
+    """
+    for log_entry in log_entries:
+        yield from reorder_buffer.push(log_entry)
+    yield from reorder_buffer.flush()
@@ -0,0 +1,174 @@
+"""
+Processes a telemetry log file with the fleet sharded across worker processes by satellite.
+
+AlertTracker state is keyed by (satellite, component) and never crosses satellites, so every satellite can be
+owned by exactly one worker. The reader scans only the satellite field of each line, routes the line to worker
+hash(satellite_id) % N in batches, and each worker evaluates its lines with a private AlertTracker. Alerts are
+tagged with the number of the line that triggered them and merged back in that order, which is timestamp order
+for time-ordered logs and always the order of a sequential run.
+"""
+
+import heapq
+import multiprocessing
+import queue
+from typing import List, Optional, Tuple
+
+from structlog.stdlib import get_logger
+
+from my_mission_control.alerter.alert_tracker_factory import create_alert_tracker
+from my_mission_control.alerter.log_file_processor_v2 import process_log_line
+from my_mission_control.alerter.log_file_scanner import iter_log_lines_mmap
+from my_mission_control.alerter.log_line_parser import LOG_LINE_DELIMITER_BYTES, parse_log_line_bytes
+from my_mission_control.config.settings import InputLogFileCfg
+
+logger = get_logger(__name__)
+
+# Seconds to wait for worker results before checking that the workers are still alive
+_RESULT_POLL_SECONDS = 1.0
+
+ShardBatch = List[Tuple[int, bytes]]
+ShardAlerts = List[Tuple[int, dict]]
+
+
+def route_log_line(line: bytes, shard_count: int) -> int:
+    """
+    Picks the shard of a log line from its satellite field, without parsing the rest of the line.
+
+    Lines whose satellite field is missing or not an integer go to shard 0, where they are rejected as malformed.
+
+    Args:
+        line (bytes): A raw telemetry log line.
+        shard_count (int): Number of shards.
+
+    Returns:
+        int: Shard index in [0, shard_count).
+    """
+    start = line.find(LOG_LINE_DELIMITER_BYTES) + 1
+    end = line.find(LOG_LINE_DELIMITER_BYTES, start)
+    if start == 0 or end == -1:
+        return 0
+    try:
+        return hash(int(line[start:end])) % shard_count
+    except ValueError:
+        return 0
+
+
+def _shard_worker(shard_index: int, batches: multiprocessing.Queue, results: multiprocessing.Queue):
+    """
+    Evaluates the lines routed to one shard with a private AlertTracker, runs in a worker process.
+
+    Args:
+        shard_index (int): Index of the shard, sent back with the results.
+        batches (multiprocessing.Queue): Batches of (line number, line), terminated by None.
+        results (multiprocessing.Queue): Receives (shard index, alerts tagged with their line number).
+    """
+    alert_tracker = create_alert_tracker()
+    alerts: ShardAlerts = []
+
+    while (batch := batches.get()) is not None:
+        for line_number, line in batch:
+            alert = process_log_line(line, alert_tracker, parse_log_line_bytes)
+            if alert:
+                alerts.append((line_number, alert.to_dict()))
+
+    results.put((shard_index, alerts))
+
+
+def _raise_if_exited(shard_index: int, worker: multiprocessing.Process):
+    """
+    Fails if a shard worker exited before sending its alerts.
+    """
+    if not worker.is_alive():
+        raise RuntimeError(f"Shard worker {shard_index} exited with code {worker.exitcode} before sending its alerts")
+
+
+def _put_batch(shard_queue: multiprocessing.Queue, batch: Optional[ShardBatch], shard_index: int, worker: multiprocessing.Process):
+    """
+    Queues a batch for a shard worker, failing rather than blocking forever if the worker exits while its queue is full.
+    """
+    while True:
+        try:
+            shard_queue.put(batch, timeout=_RESULT_POLL_SECONDS)
+            return
+        except queue.Full:
+            _raise_if_exited(shard_index, worker)
+
+
+def _collect_shard_alerts(results: multiprocessing.Queue, workers: List[multiprocessing.Process]) -> List[ShardAlerts]:
+    """
+    Waits for the alerts of every shard, failing if a worker exits without sending them.
+    """
+    shard_alerts: List[Optional[ShardAlerts]] = [None] * len(workers)
+    pending = len(workers)
+    while pending:
+        try:
+            shard_index, alerts = results.get(timeout=_RESULT_POLL_SECONDS)
+        except queue.Empty:
+            exited = [shard_index for shard_index, worker in enumerate(workers) if shard_alerts[shard_index] is None and not worker.is_alive()]
+            if not exited:
+                continue
+            # A worker may have sent its alerts and exited since the get timed out, an exited worker has flushed them to the queue
+            try:
+                while True:
+                    shard_index, alerts = results.get_nowait()
+                    shard_alerts[shard_index] = alerts
+                    pending -= 1
+            except queue.Empty:
+                pass
+            for shard_index in exited:
+                if shard_alerts[shard_index] is None:
+                    _raise_if_exited(shard_index, workers[shard_index])
+            continue
+        shard_alerts[shard_index] = alerts
+        pending -= 1
+    return [alerts for alerts in shard_alerts if alerts is not None]
+
+
+def process_log_file_sharded(log_file: str, workers: int) -> List[dict]:
+    """
+    Processes a satellite telemetry log file with satellites sharded across worker processes and generates alerts.
+
+    Produces the same alerts, in the same order, as process_log_file.
+
+    Args:
+        log_file (str): Path to the telemetry log file.
+        workers (int): Number of worker processes, each owning the satellites that hash to it.
+
+    Returns:
+        List[dict]: A list of alert dictionaries generated from the log file.
+    """
+    shard_count = max(1, workers)
+    results: multiprocessing.Queue = multiprocessing.Queue()
+    shard_queues: List[multiprocessing.Queue] = [multiprocessing.Queue(maxsize=InputLogFileCfg.LOG_SHARD_QUEUE_SIZE) for _ in range(shard_count)]
+    shard_workers = [multiprocessing.Process(target=_shard_worker, args=(shard_index, shard_queues[shard_index], results), daemon=True) for shard_index in range(shard_count)]
+    for worker in shard_workers:
+        worker.start()
+
+    try:
+        pending: List[ShardBatch] = [[] for _ in range(shard_count)]
+        for line_number, line in enumerate(iter_log_lines_mmap(log_file)):
+            shard_index = route_log_line(line, shard_count)
+            batch = pending[shard_index]
+            batch.append((line_number, line))
+            if len(batch) >= InputLogFileCfg.LOG_SHARD_BATCH_SIZE:
+                _put_batch(shard_queues[shard_index], batch, shard_index, shard_workers[shard_index])
+                pending[shard_index] = []
+
+        for shard_index, batch in enumerate(pending):
+            if batch:
+                _put_batch(shard_queues[shard_index], batch, shard_index, shard_workers[shard_index])
+            _put_batch(shard_queues[shard_index], None, shard_index, shard_workers[shard_index])
+
+        shard_alerts = _collect_shard_alerts(results, shard_workers)
+    except BaseException:
+        # The other workers would wait for batches that never come
+        for worker in shard_workers:
+            worker.terminate()
+        raise
+    finally:
+        for worker in shard_workers:
+            worker.join(timeout=_RESULT_POLL_SECONDS)
+            if worker.is_alive():
+                worker.terminate()
+
+    return [alert for _, alert in heapq.merge(*shard_alerts, key=lambda tagged_alert: tagged_alert[0])]
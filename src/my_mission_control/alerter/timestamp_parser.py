@@ -0,0 +1,153 @@
+"""
+Fast decoder for telemetry log line timestamps.
+
+Log lines carry timestamps in the fixed-width '%Y%m%d %H:%M:%S.%f' layout, e.g. '20180101 23:01:09.521'.
+Slicing the fields at fixed offsets is much cheaper than datetime.strptime, and since consecutive lines
+almost always share the same 'YYYYMMDD' date prefix, the decoded date is cached between calls.
+Anything that does not match the fixed layout is handed to datetime.strptime, so results are identical.
+"""
+
+from datetime import datetime
+from typing import Optional, Tuple
+
+from my_mission_control.config.settings import InputLogFileCfg
+from my_mission_control.utils.epoch_time import datetime_to_epoch_us
+
+FIXED_WIDTH_TIMESTAMP_FORMAT = "%Y%m%d %H:%M:%S.%f"
+
+# Fixed offsets of the '%Y%m%d %H:%M:%S.%f' layout: 'YYYYMMDD HH:MM:SS.f' up to 'YYYYMMDD HH:MM:SS.ffffff'
+_DATE_END = 8
+_FRACTION_START = 18
+_MIN_LENGTH = _FRACTION_START + 1
+_MAX_LENGTH = _FRACTION_START + 6
+# Microseconds per unit of a fraction with 1 to 6 digits, indexed by digit count
+_FRACTION_SCALE = (0, 100_000, 10_000, 1_000, 100, 10, 1)
+
+
+class LogTimestampParser:
+    """
+    Parses log line timestamps, caching the most recently decoded date prefix.
+
+    Only the '%Y%m%d %H:%M:%S.%f' layout is decoded by slicing; irregular input falls back to strptime.
+    """
+
+    def __init__(self, timestamp_format: str = InputLogFileCfg.LOG_LINE_TIMESTAMP_FORMAT):
+        """
+        Initializes the parser.
+
+        Args:
+            timestamp_format (str): strptime format used for input that does not match the fixed-width layout.
+        """
+        self.timestamp_format = timestamp_format
+        self._fixed_width = timestamp_format == FIXED_WIDTH_TIMESTAMP_FORMAT
+        # (date prefix, year, month, day, microseconds from the epoch to midnight) of the last decoded date,
+        # replaced as a whole so it is safe to share
+        self._date_cache: Tuple[str, int, int, int, int] = ("", 0, 0, 0, 0)
+
+    def _cache_date(self, date_prefix: str) -> Optional[Tuple[str, int, int, int, int]]:
+        """
+        Decodes a 'YYYYMMDD' date prefix into the date cache.
+
+        Returns:
+            Optional[Tuple[str, int, int, int, int]]: The new cache entry, or None if the prefix is not a valid date,
+                the cache is left unchanged.
+        """
+        if not (date_prefix.isascii() and date_prefix.isdigit()):
+            return None
+        year, month, day = int(date_prefix[:4]), int(date_prefix[4:6]), int(date_prefix[6:8])
+        try:
+            midnight_us = datetime_to_epoch_us(datetime(year, month, day))
+        except ValueError:
+            return None
+        self._date_cache = (date_prefix, year, month, day, midnight_us)
+        return self._date_cache
+
+    def parse(self, ts_str: str) -> datetime:
+        """
+        Parses a log line timestamp.
+
+        Args:
+            ts_str (str): Timestamp field of a log line.
+
+        Returns:
+            datetime: The decoded timestamp.
+
+        Raises:
+            ValueError: If the timestamp does not match the configured format.
+        """
+        if self._fixed_width and _MIN_LENGTH <= len(ts_str) <= _MAX_LENGTH and ts_str[8] == " " and ts_str[11] == ":" and ts_str[14] == ":" and ts_str[17] == ".":
+            time_digits = ts_str[9:11] + ts_str[12:14] + ts_str[15:17] + ts_str[_FRACTION_START:]
+            date_cache: Optional[Tuple[str, int, int, int, int]] = self._date_cache
+            if ts_str[:_DATE_END] != date_cache[0]:
+                date_cache = self._cache_date(ts_str[:_DATE_END])
+            if date_cache is not None and time_digits.isascii() and time_digits.isdigit():
+                _, year, month, day, _ = date_cache
+                fraction = ts_str[_FRACTION_START:]
+                try:
+                    return datetime(year, month, day, int(ts_str[9:11]), int(ts_str[12:14]), int(ts_str[15:17]), int(fraction) * _FRACTION_SCALE[len(fraction)])
+                except ValueError:
+                    # Out of range fields, let strptime produce the canonical error
+                    pass
+
+        return datetime.strptime(ts_str, self.timestamp_format)
+
+    def parse_epoch_us(self, ts_str: str) -> int:
+        """
+        Parses a log line timestamp to integer microseconds since the Unix epoch, without building a datetime.
+
+        Args:
+            ts_str (str): Timestamp field of a log line.
+
+        Returns:
+            int: The decoded timestamp, taken as UTC, in microseconds since the Unix epoch.
+
+        Raises:
+            ValueError: If the timestamp does not match the configured format.
+        """
+        if self._fixed_width and _MIN_LENGTH <= len(ts_str) <= _MAX_LENGTH and ts_str[8] == " " and ts_str[11] == ":" and ts_str[14] == ":" and ts_str[17] == ".":
+            time_digits = ts_str[9:11] + ts_str[12:14] + ts_str[15:17] + ts_str[_FRACTION_START:]
+            date_cache: Optional[Tuple[str, int, int, int, int]] = self._date_cache
+            if ts_str[:_DATE_END] != date_cache[0]:
+                date_cache = self._cache_date(ts_str[:_DATE_END])
+            if date_cache is not None and time_digits.isascii() and time_digits.isdigit():
+                hour, minute, second = int(ts_str[9:11]), int(ts_str[12:14]), int(ts_str[15:17])
+                if hour < 24 and minute < 60 and second < 60:
+                    fraction = ts_str[_FRACTION_START:]
+                    return date_cache[4] + hour * 3_600_000_000 + minute * 60_000_000 + second * 1_000_000 + int(fraction) * _FRACTION_SCALE[len(fraction)]
+
+        return datetime_to_epoch_us(datetime.strptime(ts_str, self.timestamp_format))
+
+
+_default_parser = LogTimestampParser()
+
+
+def parse_log_timestamp(ts_str: str) -> datetime:
+    """
+    Parses a log line timestamp using the shared module-level parser.
+
+    Args:
+        ts_str (str): Timestamp field of a log line.
+
+    Returns:
+        datetime: The decoded timestamp.
+
+    Raises:
+        ValueError: If the timestamp does not match the log line timestamp format.
+    """
+    return _default_parser.parse(ts_str)
+
+
+def parse_log_timestamp_us(ts_str: str) -> int:
+    """
+    Parses a log line timestamp to epoch microseconds using the shared module-level parser.
+
+    Args:
+        ts_str (str): Timestamp field of a log line.
+
+    Returns:
+        int: The decoded timestamp, taken as UTC, in microseconds since the Unix epoch.
+
+    Raises:
+        ValueError: If the timestamp does not match the log line timestamp format.
+    """
+    return _default_parser.parse_epoch_us(ts_str)
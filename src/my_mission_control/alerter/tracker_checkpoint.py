@@ -0,0 +1,217 @@
+"""
+Compact binary checkpoints of AlertTracker state and the input position it corresponds to.
+
+A checkpoint holds the absolute path, inode and byte offset of the input log file, the tracker event time,
+its component and severity codes, and every violation window: the timestamps in the window, the last alert timestamp and
+the newest timestamp. All integers are little-endian, timestamps are int64 epoch microseconds:
+
+    header      magic b"MMCP", version u16, inode u64, offset u64, event time flag u8 + i64
+    path        length u32, UTF-8 bytes
+    components  count u32, then length u16 + UTF-8 bytes per component, in code order
+    severities  count u32, then length u16 + UTF-8 bytes per severity, in code order
+    windows     count u32, then per window: state key i64, flags u8, last alert i64, latest i64,
+                timestamp count u32, timestamps i64 each, oldest first
+
+Checkpoints are written to a temporary file next to the target, synced, then renamed over it, so a crash
+leaves either the previous checkpoint or the new one.
+"""
+
+import os
+import struct
+import tempfile
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from my_mission_control.alerter.alert_tracker import COMPONENT_CODE_BITS, AlertTracker
+from my_mission_control.alerter.violation_window import ViolationWindow
+from my_mission_control.config.settings import AlertRuleCfg
+
+CHECKPOINT_MAGIC = b"MMCP"
+CHECKPOINT_VERSION = 2
+
+_HEADER = struct.Struct("<4sHQQBq")
+_LENGTH = struct.Struct("<I")
+_COMPONENT_LENGTH = struct.Struct("<H")
+_WINDOW = struct.Struct("<qBqqI")
+
+_HAS_LAST_ALERT = 1
+_HAS_LATEST = 2
+
+
+@dataclass
+class TrackerCheckpoint:
+    """
+    Tracker state and the input log file position it was taken at.
+
+    Attributes:
+        log_file: Absolute path of the input log file.
+        inode: Inode of the input log file, to detect a replaced file.
+        offset: Byte offset of the first line not yet processed.
+        event_time_us: Tracker event time, newest log entry timestamp seen.
+        component_codes: Component names interned by the tracker, with their codes.
+        severity_codes: Severities interned by the tracker, with their codes.
+        violation_windows: Violation windows by state key.
+    """
+
+    log_file: str
+    inode: int
+    offset: int
+    event_time_us: Optional[int] = None
+    component_codes: Dict[str, int] = field(default_factory=dict)
+    severity_codes: Dict[str, int] = field(default_factory=dict)
+    violation_windows: Dict[int, ViolationWindow] = field(default_factory=dict)
+
+    @classmethod
+    def capture(cls, alert_tracker: AlertTracker, log_file: str, inode: int, offset: int) -> "TrackerCheckpoint":
+        """
+        Takes a checkpoint of a tracker that has processed log_file up to offset.
+
+        The checkpoint shares the tracker's windows, it must be saved before the tracker processes more entries.
+        """
+        return cls(os.path.abspath(log_file), inode, offset, alert_tracker.event_time_us, alert_tracker.component_codes, alert_tracker.severity_codes, alert_tracker.violation_windows)
+
+    def restore(self, alert_tracker: AlertTracker):
+        """
+        Replaces the state of a tracker with the checkpointed state.
+
+        Windows are rebuilt with the alert threshold of their component's strategy in the tracker as ring capacity.
+
+        Args:
+            alert_tracker (AlertTracker): Tracker to restore, its evaluation strategies and eviction setting are kept.
+        """
+        alert_tracker.component_codes = dict(self.component_codes)
+        alert_tracker.severity_codes = dict(self.severity_codes)
+        strategies = {code: alert_tracker.alert_eval_strategy_map.get(component) for component, code in self.component_codes.items()}
+        component_code_mask = (1 << COMPONENT_CODE_BITS) - 1
+        alert_tracker.violation_windows = {}
+        for key, violation_window in self.violation_windows.items():
+            strategy = strategies.get(key & component_code_mask)
+            capacity = strategy.threshold if strategy else AlertRuleCfg.ALERT_VIOLATION_COUNT_THRESHOLD
+            alert_tracker.violation_windows[key] = ViolationWindow.restore(list(violation_window), violation_window.last_alert_ts, violation_window.latest_ts, capacity)
+        alert_tracker.event_time_us = self.event_time_us
+        if alert_tracker.idle_key_timer is not None:
+            for key, violation_window in alert_tracker.violation_windows.items():
+                if violation_window.latest_ts is not None:
+                    alert_tracker.idle_key_timer.schedule(key, violation_window.latest_ts + alert_tracker.idle_window_us)
+
+    def to_bytes(self) -> bytes:
+        """
+        Encodes the checkpoint in the binary checkpoint format.
+        """
+        parts = [_HEADER.pack(CHECKPOINT_MAGIC, CHECKPOINT_VERSION, self.inode, self.offset, self.event_time_us is not None, self.event_time_us or 0)]
+        path = self.log_file.encode()
+        parts.append(_LENGTH.pack(len(path)))
+        parts.append(path)
+
+        for codes in (self.component_codes, self.severity_codes):
+            parts.append(_LENGTH.pack(len(codes)))
+            for name in sorted(codes, key=codes.__getitem__):
+                encoded = name.encode()
+                parts.append(_COMPONENT_LENGTH.pack(len(encoded)))
+                parts.append(encoded)
+
+        parts.append(_LENGTH.pack(len(self.violation_windows)))
+        for key, violation_window in self.violation_windows.items():
+            last_alert_ts, latest_ts = violation_window.last_alert_ts, violation_window.latest_ts
+            flags = (_HAS_LAST_ALERT if last_alert_ts is not None else 0) | (_HAS_LATEST if latest_ts is not None else 0)
+            parts.append(_WINDOW.pack(key, flags, last_alert_ts or 0, latest_ts or 0, len(violation_window)))
+            parts.append(array("q", violation_window).tobytes())
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "TrackerCheckpoint":
+        """
+        Decodes a checkpoint in the binary checkpoint format.
+
+        Raises:
+            ValueError: If data is not a checkpoint of a supported version, or is truncated.
+        """
+        try:
+            magic, version, inode, offset, has_event_time, event_time_us = _HEADER.unpack_from(data)
+            if magic != CHECKPOINT_MAGIC or version != CHECKPOINT_VERSION:
+                raise ValueError(f"Not a tracker checkpoint of version {CHECKPOINT_VERSION}")
+            position = _HEADER.size
+
+            (length,) = _LENGTH.unpack_from(data, position)
+            position += _LENGTH.size
+            log_file = bytes(data[position : position + length]).decode()
+            position += length
+
+            component_codes, position = _unpack_codes(data, position)
+            severity_codes, position = _unpack_codes(data, position)
+
+            violation_windows: Dict[int, ViolationWindow] = {}
+            (count,) = _LENGTH.unpack_from(data, position)
+            position += _LENGTH.size
+            for _ in range(count):
+                key, flags, last_alert_ts, latest_ts, length = _WINDOW.unpack_from(data, position)
+                position += _WINDOW.size
+                timestamps = array("q")
+                timestamps.frombytes(data[position : position + 8 * length])
+                if len(timestamps) != length:
+                    raise ValueError("Truncated tracker checkpoint")
+                position += 8 * length
+                violation_windows[key] = ViolationWindow.restore(
+                    timestamps,
+                    last_alert_ts if flags & _HAS_LAST_ALERT else None,
+                    latest_ts if flags & _HAS_LATEST else None,
+                )
+        except (struct.error, UnicodeDecodeError) as e:
+            raise ValueError(f"Corrupt tracker checkpoint - {e}") from e
+
+        return cls(log_file, inode, offset, event_time_us if has_event_time else None, component_codes, severity_codes, violation_windows)
+
+
+def _unpack_codes(data: bytes, position: int) -> Tuple[Dict[str, int], int]:
+    """
+    Decodes a table of interned names at position, returns the names with their codes and the position past it.
+    """
+    codes: Dict[str, int] = {}
+    (count,) = _LENGTH.unpack_from(data, position)
+    position += _LENGTH.size
+    for code in range(count):
+        (length,) = _COMPONENT_LENGTH.unpack_from(data, position)
+        position += _COMPONENT_LENGTH.size
+        codes[bytes(data[position : position + length]).decode()] = code
+        position += length
+    return codes, position
+
+
+def save_checkpoint(checkpoint_file: str, checkpoint: TrackerCheckpoint):
+    """
+    Writes a checkpoint atomically, replacing any previous checkpoint at the same path.
+
+    Args:
+        checkpoint_file (str): Path of the checkpoint file.
+        checkpoint (TrackerCheckpoint): Checkpoint to write.
+    """
+    directory = os.path.dirname(os.path.abspath(checkpoint_file))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(checkpoint_file), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(checkpoint.to_bytes())
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp_path, checkpoint_file)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def load_checkpoint(checkpoint_file: str) -> TrackerCheckpoint:
+    """
+    Reads a checkpoint written by save_checkpoint.
+
+    Args:
+        checkpoint_file (str): Path of the checkpoint file.
+
+    Returns:
+        TrackerCheckpoint: The decoded checkpoint.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not a valid checkpoint.
+    """
+    with open(checkpoint_file, "rb") as checkpoint:
+        return TrackerCheckpoint.from_bytes(checkpoint.read())
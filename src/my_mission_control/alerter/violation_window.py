@@ -0,0 +1,149 @@
+"""
+Sliding-window violation state of one (satellite, component) pair.
+
+Replaces a deque of datetimes with a ring buffer of int64 epoch microseconds plus a count. The ring starts
+with room for ALERT_VIOLATION_COUNT_THRESHOLD timestamps, which is all an alert decision needs while the pair
+is armed: with timestamps in order, the window never holds more than the threshold without alerting. After an alert the pair is
+disarmed until its window no longer holds the alerting violation, and the violations arriving meanwhile
+decide the first timestamp of the next alert, so the ring grows to hold them and shrinks back afterwards.
+Alert output is identical to the deque implementation.
+"""
+
+from array import array
+from typing import Iterator, Optional, Sequence
+
+from my_mission_control.config.settings import AlertRuleCfg
+
+# Ring shrinks back when at most a quarter of it is used
+_SHRINK_RATIO = 4
+
+
+class ViolationWindow:
+    """
+    Violation timestamps within the alert time window, oldest first, and the timestamp of the last alert.
+
+    The whole alert state of one (satellite, component) pair, kept in AlertTracker's flat state table.
+
+    The ring is not capped, as any violation in the window may become the first timestamp of the next alert.
+    In the worst case, during a storm right after an alert, it holds every violation of the pair within one alert
+    time window, in a ring up to twice that size as it grows by doubling: 8 to 16 bytes per violation, so 2.4 to
+    4.8 MB for a pair reporting a violation every millisecond over a 5 minute window. It shrinks back to the
+    threshold once the storm leaves the window.
+    """
+
+    __slots__ = ("_ring", "_head", "_count", "_min_capacity", "last_alert_ts", "latest_ts")
+
+    def __init__(self, capacity: int = AlertRuleCfg.ALERT_VIOLATION_COUNT_THRESHOLD):
+        """
+        Initializes an empty window.
+
+        Args:
+            capacity (int): Initial and minimum ring capacity, the alert violation count threshold.
+        """
+        self._min_capacity = max(1, capacity)
+        self._ring = array("q", bytes(8 * self._min_capacity))
+        self._head = 0
+        self._count = 0
+        # Timestamp of the violation that triggered the last alert
+        self.last_alert_ts: Optional[int] = None
+        # Newest timestamp ever added, the window is empty for any violation more than a window after it
+        self.latest_ts: Optional[int] = None
+
+    @classmethod
+    def restore(cls, timestamps: Sequence[int], last_alert_ts: Optional[int], latest_ts: Optional[int], capacity: int = AlertRuleCfg.ALERT_VIOLATION_COUNT_THRESHOLD) -> "ViolationWindow":
+        """
+        Rebuilds a window from saved state, as produced by iterating a window and reading its alert timestamps.
+
+        Args:
+            timestamps (Sequence[int]): Timestamps in the window, oldest first.
+            last_alert_ts (Optional[int]): Timestamp of the violation that triggered the last alert.
+            latest_ts (Optional[int]): Newest timestamp ever added.
+            capacity (int): Minimum ring capacity, the alert violation count threshold of the pair's strategy.
+
+        Returns:
+            ViolationWindow: A window in the same state.
+        """
+        window = cls(capacity)
+        window._ring = array("q", timestamps)
+        window._count = len(window._ring)
+        if window._count < window._min_capacity:
+            window._ring.frombytes(bytes(8 * (window._min_capacity - window._count)))
+        window.last_alert_ts = last_alert_ts
+        window.latest_ts = latest_ts
+        return window
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[int]:
+        capacity = len(self._ring)
+        return (self._ring[(self._head + offset) % capacity] for offset in range(self._count))
+
+    @property
+    def capacity(self) -> int:
+        return len(self._ring)
+
+    @property
+    def first_ts(self) -> int:
+        """
+        Oldest timestamp in the window, the window must not be empty.
+        """
+        return self._ring[self._head]
+
+    def add(self, ts: int, window_us: int):
+        """
+        Appends a violation timestamp and drops the oldest ones while they are more than window_us before it.
+
+        Args:
+            ts (int): Violation timestamp in epoch microseconds.
+            window_us (int): Length of the alert time window in microseconds.
+        """
+        # Dropping expired timestamps before appending keeps the ring small, the new timestamp is never expired
+        ring = self._ring
+        capacity = len(ring)
+        head = self._head
+        while self._count and ts - ring[head] > window_us:
+            head = (head + 1) % capacity
+            self._count -= 1
+        self._head = head
+
+        if self._count == capacity:
+            self._resize(capacity * 2)
+        elif capacity > self._min_capacity and (self._count + 1) * _SHRINK_RATIO <= capacity:
+            self._resize(max(self._min_capacity, (self._count + 1) * 2))
+        ring = self._ring
+        ring[(self._head + self._count) % len(ring)] = ts
+        self._count += 1
+        if self.latest_ts is None or ts > self.latest_ts:
+            self.latest_ts = ts
+
+    def check_alert(self, ts: int, threshold: int) -> Optional[int]:
+        """
+        Applies the alert rule after adding the violation at ts.
+
+        Alerts when the window holds at least threshold violations and its oldest one is newer than
+        the violation that triggered the previous alert.
+
+        Args:
+            ts (int): Timestamp of the violation just added, in epoch microseconds.
+            threshold (int): Number of violations within the window that triggers an alert.
+
+        Returns:
+            Optional[int]: The first timestamp in the window if an alert is triggered; otherwise, None.
+        """
+        if self._count < threshold:
+            return None
+        first_ts = self._ring[self._head]
+        if self.last_alert_ts is not None and first_ts <= self.last_alert_ts:
+            return None
+        self.last_alert_ts = ts
+        return first_ts
+
+    def _resize(self, capacity: int):
+        """
+        Moves the timestamps to a ring of the given capacity, oldest first.
+        """
+        ring = array("q", self)
+        ring.frombytes(bytes(8 * (capacity - self._count)))
+        self._ring = ring
+        self._head = 0
@@ -0,0 +1,170 @@
+"""
+Fan-out of triggered alerts to live subscribers, such as operator dashboards.
+
+Each subscriber has a bounded queue of its own. Publishing serializes every alert once, only when the mission
+has subscribers, and appends the same bytes to each subscriber queue without waiting, so publishing never blocks
+ingestion whatever the subscribers do. Subscribers take all their queued alerts at once, to send them in one write. A subscriber whose queue cannot take the alerts published has fallen
+behind: it is dropped, its pending alerts are discarded and its stream ends, and the client is expected to
+reconnect. Memory is bounded by the queue size times the number of subscribers.
+
+The broadcaster and its subscriptions belong to one event loop, publish is called from that loop.
+"""
+
+import asyncio
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence, Set
+
+from structlog.stdlib import get_logger
+
+from my_mission_control.config.settings import ApiCfg
+from my_mission_control.entity.alert import ALERT_SERIALIZER, Alert
+
+logger = get_logger(__name__)
+
+
+class AlertSubscription:
+    """
+    Alerts of one mission waiting to be sent to one subscriber, each as a compact JSON line.
+
+    Alerts wait in a deque, and the single consumer of the subscription waits on a future completed when
+    alerts arrive, so queuing an alert costs a deque append and at most one wake-up per publish.
+    """
+
+    def __init__(self, mission_id: str, queue_size: int):
+        """
+        Initializes an open subscription with an empty queue.
+
+        Args:
+            mission_id (str): Mission whose alerts are delivered.
+            queue_size (int): Largest number of alerts waiting to be sent.
+        """
+        self.mission_id = mission_id
+        self.queue_size = max(1, queue_size)
+        self.closed = False
+        self.dropped = False
+        self._pending: Deque[bytes] = deque()
+        self._waiter: Optional[asyncio.Future] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def _wake(self):
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def offer(self, messages: Sequence[bytes]) -> bool:
+        """
+        Queues messages without waiting, all of them or, when they do not fit, none.
+
+        Returns:
+            bool: False if the queue cannot take the messages.
+        """
+        if len(self._pending) + len(messages) > self.queue_size:
+            return False
+        self._pending.extend(messages)
+        self._wake()
+        return True
+
+    def close(self, discard_pending: bool = False):
+        """
+        Ends the subscription, get_batch returns an empty batch once the alerts still queued have been taken.
+
+        Args:
+            discard_pending (bool): Discard the queued alerts instead, get_batch returns an empty batch right away.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        if discard_pending:
+            self._pending.clear()
+        self._wake()
+
+    async def get_batch(self) -> List[bytes]:
+        """
+        Waits for alerts and takes all those queued, as JSON lines with their newline, in publishing order.
+
+        Returns:
+            List[bytes]: The alerts queued, or an empty list once the subscription has ended.
+        """
+        while not self._pending:
+            if self.closed:
+                return []
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        batch = list(self._pending)
+        self._pending.clear()
+        return batch
+
+
+class AlertBroadcaster:
+    """
+    Publishes the alerts triggered for each mission to the subscribers of the mission.
+    """
+
+    def __init__(self, queue_size: int = ApiCfg.API_SUBSCRIBER_QUEUE_SIZE):
+        """
+        Initializes a broadcaster without subscribers.
+
+        Args:
+            queue_size (int): Largest number of alerts waiting for each subscriber before it is dropped.
+        """
+        self.queue_size = queue_size
+        self.dropped_subscriber_count = 0
+        self._subscriptions: Dict[str, Set[AlertSubscription]] = {}
+
+    def subscriber_count(self, mission_id: Optional[str] = None) -> int:
+        """
+        Number of subscribers of a mission, or of all missions.
+        """
+        if mission_id is not None:
+            return len(self._subscriptions.get(mission_id, ()))
+        return sum(map(len, self._subscriptions.values()))
+
+    def subscribe(self, mission_id: str) -> AlertSubscription:
+        """
+        Subscribes to the alerts published for a mission from now on.
+        """
+        subscription = AlertSubscription(mission_id, self.queue_size)
+        self._subscriptions.setdefault(mission_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: AlertSubscription):
+        """
+        Ends a subscription and stops publishing to it, unsubscribing twice is harmless.
+        """
+        subscription.close()
+        subscriptions = self._subscriptions.get(subscription.mission_id)
+        if subscriptions is not None:
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.mission_id]
+
+    def publish(self, mission_id: str, alerts: Sequence[Alert]) -> int:
+        """
+        Queues alerts for every subscriber of a mission, dropping the subscribers that cannot take them.
+
+        Args:
+            mission_id (str): Mission that triggered the alerts.
+            alerts (Sequence[Alert]): Alerts in the order they were triggered.
+
+        Returns:
+            int: Number of subscribers the alerts were queued for.
+        """
+        subscriptions = self._subscriptions.get(mission_id)
+        if not subscriptions or not alerts:
+            return 0
+
+        messages = [ALERT_SERIALIZER.to_ndjson_bytes(alert) for alert in alerts]
+        slow_subscriptions = [subscription for subscription in subscriptions if not subscription.offer(messages)]
+        for subscription in slow_subscriptions:
+            subscription.dropped = True
+            subscription.close(discard_pending=True)
+            self.unsubscribe(subscription)
+        if slow_subscriptions:
+            self.dropped_subscriber_count += len(slow_subscriptions)
+            logger.warning(f"Dropped {len(slow_subscriptions)} slow alert subscribers of mission {mission_id}")
+        # Dropped subscribers were removed from the set
+        return len(subscriptions)
@@ -0,0 +1,103 @@
+"""
+Live alert subscription routes, pushing each alert of a mission as it is triggered.
+
+Server-sent events carry one alert per data event, the alerts queued for a subscriber written at once, with a
+keep-alive comment while the mission is quiet.
+WebSocket subscribers get one alert per text message. Either way a subscriber that falls behind is dropped
+by the broadcaster: the event stream ends with a dropped event, the WebSocket closes with code 1013 (try again
+later), and the client reconnects.
+"""
+
+import asyncio
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Path, Request, WebSocket, WebSocketDisconnect
+from fastapi.requests import HTTPConnection
+from fastapi.responses import StreamingResponse
+
+from my_mission_control.api.alert_broadcaster import AlertBroadcaster, AlertSubscription
+from my_mission_control.api.telemetry_routes import MISSION_ID_PATTERN
+from my_mission_control.config.settings import ApiCfg
+
+EVENT_STREAM_MEDIA_TYPE = "text/event-stream"
+# WebSocket close code of a subscriber dropped for falling behind
+WS_CLOSE_TRY_AGAIN_LATER = 1013
+
+router = APIRouter(tags=["alerts"])
+
+
+def get_alert_broadcaster(connection: HTTPConnection) -> AlertBroadcaster:
+    """
+    Returns the alert broadcaster of the application handling the request or WebSocket.
+    """
+    return connection.app.state.alert_broadcaster
+
+
+async def iter_alert_events(subscription: AlertSubscription, broadcaster: AlertBroadcaster, keepalive_seconds: float) -> AsyncIterator[bytes]:
+    """
+    Yields the server-sent events of a subscription until it ends, unsubscribing once the stream is closed.
+    """
+    try:
+        # Sends the response headers right away
+        yield b": subscribed\n\n"
+        while True:
+            try:
+                async with asyncio.timeout(keepalive_seconds):
+                    batch = await subscription.get_batch()
+            except TimeoutError:
+                yield b": keepalive\n\n"
+                continue
+            if not batch:
+                if subscription.dropped:
+                    yield b"event: dropped\ndata: slow consumer\n\n"
+                return
+            # Each JSON line ends with the newline of its data field, the blank line ends the event
+            yield b"".join([b"data: " + message + b"\n" for message in batch])
+    finally:
+        broadcaster.unsubscribe(subscription)
+
+
+@router.get("/missions/{mission_id}/alerts/stream", response_class=StreamingResponse, responses={200: {"content": {EVENT_STREAM_MEDIA_TYPE: {}}, "description": "Alerts of the mission as server-sent events"}})
+async def stream_alerts(request: Request, mission_id: str = Path(pattern=MISSION_ID_PATTERN)) -> StreamingResponse:
+    """
+    Pushes the alerts of a mission as server-sent events as they are triggered.
+    """
+    broadcaster = get_alert_broadcaster(request)
+    subscription = broadcaster.subscribe(mission_id)
+    return StreamingResponse(
+        iter_alert_events(subscription, broadcaster, ApiCfg.API_SSE_KEEPALIVE_SECONDS),
+        media_type=EVENT_STREAM_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _close_on_disconnect(websocket: WebSocket, subscription: AlertSubscription):
+    """
+    Ends the subscription once the client disconnects, messages sent by the client are ignored.
+    """
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
+    subscription.close(discard_pending=True)
+
+
+@router.websocket("/missions/{mission_id}/alerts/ws")
+async def websocket_alerts(websocket: WebSocket, mission_id: str = Path(pattern=MISSION_ID_PATTERN)):
+    """
+    Pushes the alerts of a mission over a WebSocket as they are triggered, one JSON alert per text message.
+    """
+    broadcaster = get_alert_broadcaster(websocket)
+    await websocket.accept()
+    subscription = broadcaster.subscribe(mission_id)
+    disconnect_watcher = asyncio.create_task(_close_on_disconnect(websocket, subscription))
+    try:
+        while batch := await subscription.get_batch():
+            for message in batch:
+                # One JSON alert per message, without the newline ending its NDJSON line
+                await websocket.send_text(message[:-1].decode())
+        if subscription.dropped:
+            await websocket.close(code=WS_CLOSE_TRY_AGAIN_LATER, reason="slow consumer")
+    except WebSocketDisconnect:
+        pass
+    finally:
+        disconnect_watcher.cancel()
+        broadcaster.unsubscribe(subscription)
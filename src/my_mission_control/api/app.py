@@ -0,0 +1,36 @@
+"""
+FastAPI application of the telemetry ingestion service.
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import FastAPI
+
+from my_mission_control.api.alert_broadcaster import AlertBroadcaster
+from my_mission_control.api.alert_routes import router as alert_router
+from my_mission_control.api.ingestion_executor import IngestionExecutor
+from my_mission_control.api.telemetry_routes import router as telemetry_router
+from my_mission_control.utils.pyproject_util import get_pyproject_metadata
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Stops the ingestion workers when the application shuts down.
+    """
+    yield
+    app.state.ingestion_executor.close()
+
+
+def create_app() -> FastAPI:
+    """
+    Creates the application, with no mission tracked and no alert subscriber yet.
+    """
+    project_name, project_version = get_pyproject_metadata()
+    app = FastAPI(title=project_name or "my-mission-control", version=project_version or "0.0.0", lifespan=lifespan)
+    app.state.ingestion_executor = IngestionExecutor()
+    app.state.alert_broadcaster = AlertBroadcaster()
+    app.include_router(telemetry_router)
+    app.include_router(alert_router)
+    return app
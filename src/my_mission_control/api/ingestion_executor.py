@@ -0,0 +1,199 @@
+"""
+Parses uploaded telemetry lines and feeds them to the mission trackers off the event loop.
+
+Parsing and alert tracking are CPU-bound, run on the event loop they hold up every other request for as long
+as a chunk takes. The executor sends the lines of a chunk to a pool of workers instead, each a single thread or
+process that owns the satellites hashing to it, like the shards of sharded_log_processor. AlertTracker state
+never crosses satellites, so each worker keeps trackers of its own for every mission, and since a worker runs
+its batches one at a time in the order they were sent, the lines of a satellite reach its tracker in the order
+they arrived. Alerts are tagged with the position of their line in the chunk and merged back in that order.
+
+The executor admits missions: once max_missions are tracked, a new mission evicts the mission with no upload
+for the longest time if it has been idle for mission_idle_seconds, dropping its trackers in every worker, and
+is refused otherwise.
+"""
+
+import asyncio
+import heapq
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from operator import itemgetter
+from typing import Iterable, List, Tuple
+
+from structlog.stdlib import get_logger
+
+from my_mission_control.alerter.alert_tracker import AlertTracker
+from my_mission_control.alerter.log_line_parser import parse_log_line_bytes
+from my_mission_control.alerter.sharded_log_processor import route_log_line
+from my_mission_control.api.telemetry_ingestion import MissionTrackers, TooManyMissionsError
+from my_mission_control.config.settings import ApiCfg
+from my_mission_control.entity.alert import Alert
+
+logger = get_logger(__name__)
+
+EXECUTOR_KINDS = ("thread", "process")
+
+IndexedLines = List[Tuple[int, bytes]]
+IndexedAlerts = List[Tuple[int, Alert]]
+
+# Trackers of the worker running the current thread, each worker thread or process has its own
+_worker_state = threading.local()
+
+
+def process_indexed_lines(alert_tracker: AlertTracker, indexed_lines: Iterable[Tuple[int, bytes]]) -> Tuple[IndexedAlerts, int]:
+    """
+    Parses lines and hands them to an alert tracker, skipping malformed lines.
+
+    Args:
+        alert_tracker (AlertTracker): Tracker of the mission the lines belong to.
+        indexed_lines (Iterable[Tuple[int, bytes]]): Lines tagged with their position in the chunk.
+
+    Returns:
+        Tuple[IndexedAlerts, int]: Alerts tagged with the position of the line that triggered them, and the number of malformed lines.
+    """
+    alerts: IndexedAlerts = []
+    malformed_line_count = 0
+    process_log_entry = alert_tracker.process_log_entry
+    for index, line in indexed_lines:
+        log_entry = parse_log_line_bytes(line)
+        if log_entry is None:
+            malformed_line_count += 1
+            logger.warning(f"Skipping malformed or unparseable line: {line!r}")
+            continue
+        alert = process_log_entry(log_entry)
+        if alert:
+            alerts.append((index, alert))
+    return alerts, malformed_line_count
+
+
+def _process_shard_lines(mission_id: str, indexed_lines: IndexedLines) -> Tuple[IndexedAlerts, int]:
+    """
+    Processes the lines of a chunk routed to one worker with the worker's tracker of the mission, runs in the worker.
+    """
+    mission_trackers = getattr(_worker_state, "mission_trackers", None)
+    if mission_trackers is None:
+        # Missions are admitted by the executor before their lines reach a worker
+        mission_trackers = _worker_state.mission_trackers = MissionTrackers(max_missions=sys.maxsize)
+    return process_indexed_lines(mission_trackers.get(mission_id), indexed_lines)
+
+
+def _drop_mission(mission_id: str):
+    """
+    Drops the worker's tracker of an evicted mission, runs in the worker.
+    """
+    mission_trackers = getattr(_worker_state, "mission_trackers", None)
+    if mission_trackers is not None:
+        mission_trackers.drop(mission_id)
+
+
+class IngestionExecutor:
+    """
+    Processes the lines of uploaded chunks on worker threads or processes, with satellites sharded across workers.
+    """
+
+    def __init__(self, workers: int = ApiCfg.API_INGEST_WORKERS, kind: str = ApiCfg.API_INGEST_EXECUTOR, max_missions: int = ApiCfg.API_MAX_MISSIONS, mission_idle_seconds: float = ApiCfg.API_MISSION_IDLE_SECONDS):
+        """
+        Initializes the executor, worker processes are started on the first chunk they get.
+
+        Args:
+            workers (int): Number of workers, 0 to process chunks on the event loop.
+            kind (str): "thread" or "process" workers.
+            max_missions (int): Most missions tracked at once.
+            mission_idle_seconds (float): Seconds without an upload after which a mission may be evicted for a new one.
+
+        Raises:
+            ValueError: If the kind of worker is unknown.
+        """
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f"Unknown ingestion executor {kind!r}, expected one of {', '.join(EXECUTOR_KINDS)}")
+        self.kind = kind
+        self.max_missions = max_missions
+        self.mission_idle_seconds = mission_idle_seconds
+        # Monotonic time of the last upload of each mission, least recently active first
+        self._mission_last_seen: OrderedDict[str, float] = OrderedDict()
+        # Trackers of the event loop, used when there are no workers
+        self.mission_trackers = MissionTrackers(max_missions=max_missions)
+        # One single-worker executor per shard, so the batches of a shard run one at a time in the order sent
+        self._workers: List[Executor] = [ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"ingest-{index}") if kind == "thread" else ProcessPoolExecutor(max_workers=1) for index in range(max(0, workers))]
+
+    @property
+    def worker_count(self) -> int:
+        return len(self._workers)
+
+    def admit(self, mission_id: str):
+        """
+        Accepts uploads for a mission, a new one while fewer than max_missions missions are tracked or one of them is idle.
+
+        Raises:
+            TooManyMissionsError: If the mission is new and max_missions missions are already tracked, none of them idle.
+        """
+        now = time.monotonic()
+        mission_last_seen = self._mission_last_seen
+        if mission_id in mission_last_seen:
+            mission_last_seen[mission_id] = now
+            mission_last_seen.move_to_end(mission_id)
+            return
+        if len(mission_last_seen) >= self.max_missions and not self._evict_idle_mission(now):
+            raise TooManyMissionsError(f"Already tracking {self.max_missions} missions, refusing mission {mission_id}")
+        mission_last_seen[mission_id] = now
+
+    def _evict_idle_mission(self, now: float) -> bool:
+        """
+        Drops the least recently active mission if it has been idle for mission_idle_seconds.
+
+        Returns:
+            bool: Whether a mission was evicted.
+        """
+        if not self._mission_last_seen:
+            return False
+        mission_id, last_seen = next(iter(self._mission_last_seen.items()))
+        if now - last_seen < self.mission_idle_seconds:
+            return False
+        del self._mission_last_seen[mission_id]
+        self.mission_trackers.drop(mission_id)
+        # Queued behind the batches already sent, so they still reach the mission's trackers
+        for worker in self._workers:
+            worker.submit(_drop_mission, mission_id)
+        logger.info(f"Evicted mission {mission_id}, idle for {now - last_seen:.0f} seconds")
+        return True
+
+    async def process(self, mission_id: str, lines: List[bytes]) -> Tuple[List[Alert], int]:
+        """
+        Parses the lines of a chunk and feeds them to the trackers of a mission.
+
+        Args:
+            mission_id (str): Mission the lines belong to.
+            lines (List[bytes]): Complete lines of the chunk, in the order they arrived.
+
+        Returns:
+            Tuple[List[Alert], int]: Alerts triggered by the lines in the order of a sequential run, and the number of malformed lines.
+
+        Raises:
+            TooManyMissionsError: If the mission is new and max_missions missions are already tracked, none of them idle.
+        """
+        self.admit(mission_id)
+        if not lines:
+            return [], 0
+        if not self._workers:
+            alerts, malformed_line_count = process_indexed_lines(self.mission_trackers.get(mission_id), enumerate(lines))
+            return [alert for _, alert in alerts], malformed_line_count
+
+        shard_count = len(self._workers)
+        shard_lines: List[IndexedLines] = [[] for _ in range(shard_count)]
+        for index, line in enumerate(lines):
+            shard_lines[route_log_line(line, shard_count)].append((index, line))
+
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*(loop.run_in_executor(worker, _process_shard_lines, mission_id, indexed_lines) for worker, indexed_lines in zip(self._workers, shard_lines) if indexed_lines))
+        alerts = [alert for _, alert in heapq.merge(*(shard_alerts for shard_alerts, _ in results), key=itemgetter(0))]
+        return alerts, sum(malformed_line_count for _, malformed_line_count in results)
+
+    def close(self):
+        """
+        Waits for the batches sent to the workers and stops them.
+        """
+        for worker in self._workers:
+            worker.shutdown(wait=True)
@@ -0,0 +1,219 @@
+"""
+Incremental ingestion of telemetry uploads into the alert tracker of a mission.
+
+An upload arrives as a sequence of body chunks cut anywhere. A plain upload is a stream of pipe-delimited log
+lines, a multipart/form-data upload holds a log file in each part and its chunks go through a streaming
+multipart parser first. Either way the chunks are split into lines with the partial trailing line carried over,
+and the complete lines of a chunk are handed to the ingestion executor, which parses them and feeds the
+trackers, before the next chunk is read. Only the partial line of an upload is held in memory, never the upload
+as a whole. The size of an upload is capped, as the alerts it triggers are returned in a single response.
+"""
+
+from typing import Callable, Dict, List
+
+from python_multipart.multipart import MultipartParser
+from structlog.stdlib import get_logger
+
+from my_mission_control.alerter.alert_tracker import AlertTracker
+from my_mission_control.alerter.alert_tracker_factory import create_alert_tracker
+from my_mission_control.alerter.log_file_scanner import LineSplitter
+from my_mission_control.config.settings import ApiCfg
+
+logger = get_logger(__name__)
+
+
+class LineTooLongError(ValueError):
+    """
+    Raised when an upload holds a line longer than the longest line accepted.
+    """
+
+
+class UploadTooLargeError(ValueError):
+    """
+    Raised when an upload is larger than the largest upload accepted.
+    """
+
+
+class TooManyMissionsError(Exception):
+    """
+    Raised when an upload is for a new mission while as many missions as accepted are already tracked.
+    """
+
+
+class MissionTrackers:
+    """
+    Holds the alert tracker of each mission, created on the first upload for the mission.
+
+    Uploads for one mission, from any number of ground stations, feed the same tracker, so violations they
+    report count in the same windows. Trackers drop idle satellite component state and live until their mission
+    is dropped, the number of missions is capped.
+    """
+
+    def __init__(self, create_alert_tracker: Callable[[], AlertTracker] = lambda: create_alert_tracker(evict_idle_keys=True), max_missions: int = ApiCfg.API_MAX_MISSIONS):
+        """
+        Initializes an empty registry.
+
+        Args:
+            create_alert_tracker (Callable[[], AlertTracker]): Creates the tracker of a new mission.
+            max_missions (int): Most missions tracked at once.
+        """
+        self._create_alert_tracker = create_alert_tracker
+        self.max_missions = max_missions
+        self._alert_trackers: Dict[str, AlertTracker] = {}
+
+    def __len__(self) -> int:
+        return len(self._alert_trackers)
+
+    def __contains__(self, mission_id: str) -> bool:
+        return mission_id in self._alert_trackers
+
+    def get(self, mission_id: str) -> AlertTracker:
+        """
+        Returns the alert tracker of a mission, creating it for a new mission.
+
+        Raises:
+            TooManyMissionsError: If the mission is new and max_missions missions are already tracked.
+        """
+        alert_tracker = self._alert_trackers.get(mission_id)
+        if alert_tracker is None:
+            if len(self._alert_trackers) >= self.max_missions:
+                raise TooManyMissionsError(f"Already tracking {self.max_missions} missions, refusing mission {mission_id}")
+            alert_tracker = self._alert_trackers[mission_id] = self._create_alert_tracker()
+            logger.info(f"Tracking alerts of mission {mission_id}")
+        return alert_tracker
+
+    def drop(self, mission_id: str):
+        """
+        Drops the alert tracker of a mission, a later upload for the mission starts with a new tracker.
+        """
+        self._alert_trackers.pop(mission_id, None)
+
+
+class TelemetryUpload:
+    """
+    Cuts an upload of pipe-delimited log lines, fed chunk by chunk, into complete lines.
+    """
+
+    def __init__(self, max_line_bytes: int = ApiCfg.API_MAX_LINE_BYTES, max_upload_bytes: int = ApiCfg.API_MAX_UPLOAD_BYTES):
+        """
+        Initializes an upload.
+
+        Args:
+            max_line_bytes (int): Longest line accepted.
+            max_upload_bytes (int): Largest upload body accepted.
+        """
+        self.max_line_bytes = max_line_bytes
+        self.max_upload_bytes = max_upload_bytes
+        self.line_count = 0
+        self.byte_count = 0
+        self._splitter = LineSplitter()
+
+    def _count_bytes(self, chunk: bytes):
+        """
+        Adds a body chunk to the size of the upload.
+
+        Raises:
+            UploadTooLargeError: If the upload is now larger than the largest upload accepted.
+        """
+        self.byte_count += len(chunk)
+        if self.byte_count > self.max_upload_bytes:
+            raise UploadTooLargeError(f"Telemetry upload larger than {self.max_upload_bytes} bytes")
+
+    def _feed_lines(self, data: bytes) -> List[bytes]:
+        """
+        Returns the lines completed by data.
+
+        Raises:
+            LineTooLongError: If a completed line, or the partial line carried over, is longer than the longest line accepted.
+        """
+        lines = self._splitter.feed(data)
+        if self._splitter.pending > self.max_line_bytes or (lines and max(map(len, lines)) > self.max_line_bytes):
+            raise LineTooLongError(f"Telemetry line longer than {self.max_line_bytes} bytes")
+        self.line_count += len(lines)
+        return lines
+
+    def _flush_lines(self) -> List[bytes]:
+        """
+        Returns the partial line left at the end of the data, if any.
+        """
+        partial = self._splitter.flush()
+        if not partial:
+            return []
+        self.line_count += 1
+        return [partial]
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """
+        Takes a body chunk.
+
+        Args:
+            chunk (bytes): Next chunk of the upload body.
+
+        Returns:
+            List[bytes]: Lines the chunk completes, without their newline.
+
+        Raises:
+            ValueError: If the upload is invalid, LineTooLongError if it holds a line that is too long,
+                UploadTooLargeError if it is too large.
+        """
+        self._count_bytes(chunk)
+        return self._feed_lines(chunk)
+
+    def finish(self) -> List[bytes]:
+        """
+        Takes the end of the upload, once the whole body has been fed.
+
+        Returns:
+            List[bytes]: The last line, when it has no newline.
+
+        Raises:
+            ValueError: If the upload ended unexpectedly.
+        """
+        return self._flush_lines()
+
+
+class MultipartTelemetryUpload(TelemetryUpload):
+    """
+    Cuts a multipart/form-data upload, with a log file in each part, fed chunk by chunk, into complete lines.
+    """
+
+    def __init__(self, boundary: bytes, max_line_bytes: int = ApiCfg.API_MAX_LINE_BYTES, max_upload_bytes: int = ApiCfg.API_MAX_UPLOAD_BYTES):
+        """
+        Initializes an upload.
+
+        Args:
+            boundary (bytes): Boundary parameter of the multipart/form-data content type.
+            max_line_bytes (int): Longest line accepted.
+            max_upload_bytes (int): Largest upload body accepted.
+        """
+        super().__init__(max_line_bytes, max_upload_bytes)
+        self.part_count = 0
+        self._ended = False
+        self._lines: List[bytes] = []
+        self._parser = MultipartParser(boundary, {"on_part_data": self._on_part_data, "on_part_end": self._on_part_end, "on_end": self._on_end})
+
+    def _on_part_data(self, data: bytes, start: int, end: int):
+        self._lines.extend(self._feed_lines(data[start:end]))
+
+    def _on_part_end(self):
+        # Each part is a file of its own, its last line needs no newline
+        self.part_count += 1
+        self._lines.extend(self._flush_lines())
+
+    def _on_end(self):
+        self._ended = True
+
+    def _take_lines(self) -> List[bytes]:
+        lines, self._lines = self._lines, []
+        return lines
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        self._count_bytes(chunk)
+        self._parser.write(chunk)
+        return self._take_lines()
+
+    def finish(self) -> List[bytes]:
+        self._parser.finalize()
+        if not self._ended:
+            raise ValueError("Multipart upload ended before its closing boundary")
+        return self._take_lines()
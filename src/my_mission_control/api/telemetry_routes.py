@@ -0,0 +1,105 @@
+"""
+HTTP routes ingesting telemetry uploads from ground stations.
+
+A ground station POSTs log lines for a mission, as a plain or chunked body of pipe-delimited lines, or as log
+files in a multipart/form-data body. The body is processed chunk by chunk as it arrives, the lines of each chunk
+by the ingestion executor off the event loop, and the alerts the upload triggered are returned as NDJSON, one
+compact JSON alert per line, in the order they were triggered.
+The alerts of each chunk are also published to the live subscribers of the mission as soon as they are triggered.
+"""
+
+from typing import AsyncIterator, List
+
+from fastapi import APIRouter, HTTPException, Path, Request, Response
+from python_multipart.multipart import parse_options_header
+from structlog.stdlib import get_logger
+
+from my_mission_control.api.alert_broadcaster import AlertBroadcaster
+from my_mission_control.api.ingestion_executor import IngestionExecutor
+from my_mission_control.api.telemetry_ingestion import LineTooLongError, MultipartTelemetryUpload, TelemetryUpload, TooManyMissionsError, UploadTooLargeError
+from my_mission_control.config.settings import ApiCfg
+from my_mission_control.entity.alert import ALERT_SERIALIZER, Alert
+
+logger = get_logger(__name__)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+MISSION_ID_PATTERN = r"^[A-Za-z0-9_.-]{1,64}$"
+
+router = APIRouter(tags=["telemetry"])
+
+
+def get_ingestion_executor(request: Request) -> IngestionExecutor:
+    """
+    Returns the ingestion executor of the application handling the request.
+    """
+    return request.app.state.ingestion_executor
+
+
+def create_upload(request: Request) -> TelemetryUpload:
+    """
+    Creates the upload matching the content type of the request.
+
+    Raises:
+        HTTPException: 400 for a multipart/form-data body without a boundary, 413 for a declared Content-Length
+            larger than the largest upload accepted.
+    """
+    content_length = request.headers.get("content-length")
+    if content_length is not None and content_length.isdigit() and int(content_length) > ApiCfg.API_MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail=f"Telemetry upload larger than {ApiCfg.API_MAX_UPLOAD_BYTES} bytes")
+    content_type, options = parse_options_header(request.headers.get("content-type"))
+    if content_type == b"multipart/form-data":
+        boundary = options.get(b"boundary")
+        if not boundary:
+            raise HTTPException(status_code=400, detail="multipart/form-data upload without a boundary")
+        return MultipartTelemetryUpload(boundary)
+    return TelemetryUpload()
+
+
+async def iter_upload_lines(request: Request, upload: TelemetryUpload) -> AsyncIterator[List[bytes]]:
+    """
+    Yields the lines completed by each chunk of the request body, then the last line of the upload.
+    """
+    async for chunk in request.stream():
+        yield upload.feed(chunk)
+    yield upload.finish()
+
+
+@router.post(
+    "/missions/{mission_id}/telemetry",
+    response_class=Response,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}, "description": "Alerts triggered by the upload, one JSON alert per line"}},
+)
+async def ingest_telemetry(request: Request, mission_id: str = Path(pattern=MISSION_ID_PATTERN)) -> Response:
+    """
+    Processes telemetry log lines uploaded for a mission and returns the alerts they triggered as NDJSON.
+
+    The X-Telemetry-Lines and X-Telemetry-Malformed-Lines response headers count the lines processed
+    and the malformed lines skipped. An upload for a new mission is refused with 429 once as many missions
+    as accepted are tracked and none has been idle long enough to be evicted, and an upload larger than API_MAX_UPLOAD_BYTES with 413.
+    """
+    upload = create_upload(request)
+    executor = get_ingestion_executor(request)
+    try:
+        executor.admit(mission_id)
+    except TooManyMissionsError as e:
+        raise HTTPException(status_code=429, detail=str(e)) from e
+    broadcaster: AlertBroadcaster = request.app.state.alert_broadcaster
+    alerts: List[Alert] = []
+    malformed_line_count = 0
+    try:
+        async for lines in iter_upload_lines(request, upload):
+            chunk_alerts, chunk_malformed_line_count = await executor.process(mission_id, lines)
+            malformed_line_count += chunk_malformed_line_count
+            broadcaster.publish(mission_id, chunk_alerts)
+            alerts.extend(chunk_alerts)
+    except (LineTooLongError, UploadTooLargeError) as e:
+        raise HTTPException(status_code=413, detail=str(e)) from e
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid telemetry upload - {e}") from e
+
+    logger.info(f"Processed {upload.line_count} lines for mission {mission_id}, {len(alerts)} alerts")
+    return Response(
+        content=b"".join(map(ALERT_SERIALIZER.to_ndjson_bytes, alerts)),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={"X-Telemetry-Lines": str(upload.line_count), "X-Telemetry-Malformed-Lines": str(malformed_line_count)},
+    )
@@ -6,6 +6,8 @@ from my_mission_control.utils.utility import get_env_var_int
 class AlertOutputCfg:
     SEVERITY_RED_HIGH = os.getenv("SEVERITY_RED_HIGH", "RED HIGH")
     SEVERITY_RED_LOW = os.getenv("SEVERITY_RED_LOW", "RED LOW")
+    SEVERITY_YELLOW_HIGH = os.getenv("SEVERITY_YELLOW_HIGH", "YELLOW HIGH")
+    SEVERITY_YELLOW_LOW = os.getenv("SEVERITY_YELLOW_LOW", "YELLOW LOW")
     TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
 
 
@@ -20,7 +22,48 @@ class InputLogFileCfg:
     LOG_LINE_COMPONENT_TSTAT = "TSTAT"
     LOG_LINE_COMPONENT_BATT = "BATT"
 
+    # Number of lines parsed per chunk when processing in batch mode
+    LOG_BATCH_SIZE: int = get_env_var_int("LOG_BATCH_SIZE", 65536)
+
+    # Lines sent to a shard worker per message, and messages queued per worker before the reader blocks
+    LOG_SHARD_BATCH_SIZE: int = get_env_var_int("LOG_SHARD_BATCH_SIZE", 4096)
+    LOG_SHARD_QUEUE_SIZE: int = get_env_var_int("LOG_SHARD_QUEUE_SIZE", 8)
+
+    # Lines processed between two tracker checkpoints when checkpointing is enabled
+    LOG_CHECKPOINT_INTERVAL_LINES: int = get_env_var_int("LOG_CHECKPOINT_INTERVAL_LINES", 1_000_000)
+
+    # Polling interval of a followed log file, doubled from the minimum up to the maximum while it stays idle
+    LOG_FOLLOW_POLL_MIN_MS: int = get_env_var_int("LOG_FOLLOW_POLL_MIN_MS", 10)
+    LOG_FOLLOW_POLL_MAX_MS: int = get_env_var_int("LOG_FOLLOW_POLL_MAX_MS", 1000)
+
+    # Decompressed chunks a background decompression thread may read ahead of the parser
+    LOG_DECOMPRESS_QUEUE_SIZE: int = get_env_var_int("LOG_DECOMPRESS_QUEUE_SIZE", 4)
+
 
 class AlertRuleCfg:
     ALERT_VIOLATION_COUNT_THRESHOLD: int = get_env_var_int("ALERT_VIOLATION_COUNT_THRESHOLD", 3)
     ALERT_VIOLATION_TIME_WINDOW_MINUTES: int = get_env_var_int("ALERT_VIOLATION_TIME_WINDOW_MINUTES", 5)
+
+    # TOML rule table replacing the built-in BATT and TSTAT rules when set
+    ALERT_RULES_FILE = os.getenv("ALERT_RULES_FILE")
+
+
+class ApiCfg:
+    # Longest telemetry line accepted in an upload, so an upload without newlines cannot grow the partial line without bound
+    API_MAX_LINE_BYTES: int = get_env_var_int("API_MAX_LINE_BYTES", 65536)
+    # Largest upload accepted, the alerts of an upload are returned in one response so its size bounds their memory
+    API_MAX_UPLOAD_BYTES: int = get_env_var_int("API_MAX_UPLOAD_BYTES", 64 * 1024 * 1024)
+    # Missions tracked at once, an upload for a further mission evicts the least recently active mission if it has been idle for
+    # API_MISSION_IDLE_SECONDS, and is refused otherwise, so clients cannot grow the trackers without bound
+    API_MAX_MISSIONS: int = get_env_var_int("API_MAX_MISSIONS", 1000)
+    API_MISSION_IDLE_SECONDS: int = get_env_var_int("API_MISSION_IDLE_SECONDS", 3600)
+
+    # Alerts waiting to be pushed to a live subscriber, one that falls further behind is dropped
+    API_SUBSCRIBER_QUEUE_SIZE: int = get_env_var_int("API_SUBSCRIBER_QUEUE_SIZE", 1024)
+    # Seconds between keep-alive comments on an idle server-sent events stream
+    API_SSE_KEEPALIVE_SECONDS: int = get_env_var_int("API_SSE_KEEPALIVE_SECONDS", 15)
+
+    # Workers parsing uploaded lines off the event loop, each owning the satellites that hash to it, 0 to parse on the event loop
+    API_INGEST_WORKERS: int = get_env_var_int("API_INGEST_WORKERS", 2)
+    # "thread" for worker threads sharing the process, "process" for worker processes parsing in parallel
+    API_INGEST_EXECUTOR = os.getenv("API_INGEST_EXECUTOR", "thread")
@@ -3,41 +3,173 @@ Dataclass for representing alerts
 """
 
 import json
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Any, Dict
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from structlog.stdlib import get_logger
 
 from my_mission_control.config.settings import AlertOutputCfg
+from my_mission_control.utils.epoch_time import epoch_us_to_datetime
 from my_mission_control.utils.utility import snake_to_camel
 
 logger = get_logger(__name__)
 
+MICROSECONDS_PER_DAY = 86_400_000_000
+# Alert timestamps in this format are assembled from a cached date prefix and the time of day
+_FAST_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+_FAST_DATE_FORMAT = "%Y-%m-%dT"
+# Upper bound on distinct severity and component names kept JSON-encoded
+_MAX_CACHED_STRINGS = 1024
+
 
 @dataclass
 class Alert:
     """
     Specifies attributes to be included in an alert
+
+    The timestamp is a datetime, or int microseconds since the Unix epoch (UTC) when the alert comes from
+    log entries with epoch timestamps; it is converted to a datetime only when the alert is reported.
     """
 
     satellite_id: int
     severity: str
     component: str
-    timestamp: datetime
+    timestamp: Union[datetime, int]
 
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert alert as per reporting requirements
         """
-        raw_dict = asdict(self)
-        raw_dict["timestamp"] = self.timestamp.strftime(AlertOutputCfg.TIMESTAMP_FORMAT)
-
-        camel_dict = {snake_to_camel(k): v for k, v in raw_dict.items()}
-        return camel_dict
+        return ALERT_SERIALIZER.to_dict(self)
 
     def to_json(self) -> str:
         """
         Serializes alert to a JSON string
         """
-        return json.dumps(self.to_dict())
+        return ALERT_SERIALIZER.to_json(self)
+
+
+class AlertSerializer:
+    """
+    Serializes alerts for reporting, with the work that does not depend on the alert done once.
+
+    The camelCase key of every Alert field and the JSON templates are computed when the serializer is created.
+    Timestamps reuse the formatted date of the previous alert while alerts fall on the same day, and severity
+    and component names are JSON-encoded once. Output matches dataclasses.asdict with snake_to_camel keys and
+    json.dumps, and can be produced directly as bytes for JSON and NDJSON writers.
+    """
+
+    def __init__(self, timestamp_format: str = AlertOutputCfg.TIMESTAMP_FORMAT):
+        """
+        Initializes the serializer.
+
+        Args:
+            timestamp_format (str): strftime format of the reported timestamp.
+        """
+        self.timestamp_format = timestamp_format
+        self._fast_timestamp = timestamp_format == _FAST_TIMESTAMP_FORMAT
+
+        alert_fields = fields(Alert)
+        self.keys: Tuple[str, ...] = tuple(snake_to_camel(alert_field.name) for alert_field in alert_fields)
+        self._values: Callable[[Alert], Tuple[Any, ...]] = attrgetter(*(alert_field.name for alert_field in alert_fields))  # type: ignore[assignment]
+        self._timestamp_index = [alert_field.name for alert_field in alert_fields].index("timestamp")
+
+        json_keys = [json.dumps(key) for key in self.keys]
+        # str.format templates, literal braces doubled
+        self._json_template = "{{" + ", ".join(f"{json_key}: {{}}" for json_key in json_keys) + "}}"
+        self._ndjson_template = "{{" + ",".join(f"{json_key}:{{}}" for json_key in json_keys) + "}}"
+        # Alert object inside a JSON array indented by 4, as json.dumps(alerts, indent=4) lays it out
+        self._indented_template = "    {{\n" + ",\n".join(f"        {json_key}: {{}}" for json_key in json_keys) + "\n    }}"
+
+        # (epoch day, formatted date) of the last int timestamp, and (date, formatted date) of the last datetime
+        self._epoch_day_prefix: Tuple[Optional[int], str] = (None, "")
+        self._date_prefix: Tuple[Optional[Tuple[int, int, int]], str] = (None, "")
+        self._json_strings: Dict[str, str] = {}
+
+    def format_timestamp(self, timestamp: Union[datetime, int]) -> str:
+        """
+        Formats an alert timestamp, a datetime or int epoch microseconds, with the reporting format.
+        """
+        if isinstance(timestamp, int):
+            if not self._fast_timestamp:
+                return epoch_us_to_datetime(timestamp).strftime(self.timestamp_format)
+            day, time_of_day = divmod(timestamp, MICROSECONDS_PER_DAY)
+            cached_day, prefix = self._epoch_day_prefix
+            if day != cached_day:
+                prefix = epoch_us_to_datetime(day * MICROSECONDS_PER_DAY).strftime(_FAST_DATE_FORMAT)
+                self._epoch_day_prefix = (day, prefix)
+            seconds, microsecond = divmod(time_of_day, 1_000_000)
+            minutes, second = divmod(seconds, 60)
+            hour, minute = divmod(minutes, 60)
+            return f"{prefix}{hour:02d}:{minute:02d}:{second:02d}.{microsecond:06d}Z"
+
+        if not self._fast_timestamp:
+            return timestamp.strftime(self.timestamp_format)
+        date = (timestamp.year, timestamp.month, timestamp.day)
+        cached_date, prefix = self._date_prefix
+        if date != cached_date:
+            prefix = timestamp.strftime(_FAST_DATE_FORMAT)
+            self._date_prefix = (date, prefix)
+        return f"{prefix}{timestamp.hour:02d}:{timestamp.minute:02d}:{timestamp.second:02d}.{timestamp.microsecond:06d}Z"
+
+    def _report_values(self, alert: Alert) -> List[Any]:
+        """
+        Field values of an alert, with the timestamp formatted for reporting.
+        """
+        values = list(self._values(alert))
+        values[self._timestamp_index] = self.format_timestamp(values[self._timestamp_index])
+        return values
+
+    def _json_values(self, alert: Alert) -> List[str]:
+        """
+        Field values of an alert, each encoded as JSON.
+        """
+        json_values: List[str] = []
+        json_strings = self._json_strings
+        timestamp_index = self._timestamp_index
+        for index, value in enumerate(self._values(alert)):
+            if index == timestamp_index:
+                timestamp = self.format_timestamp(value)
+                # The fixed reporting format holds no character JSON needs to escape
+                json_values.append(f'"{timestamp}"' if self._fast_timestamp else json.dumps(timestamp))
+            elif type(value) is str:
+                encoded = json_strings.get(value)
+                if encoded is None:
+                    encoded = json.dumps(value)
+                    if len(json_strings) < _MAX_CACHED_STRINGS:
+                        json_strings[value] = encoded
+                json_values.append(encoded)
+            elif type(value) is int:
+                json_values.append(str(value))
+            else:
+                json_values.append(json.dumps(value))
+        return json_values
+
+    def to_dict(self, alert: Alert) -> Dict[str, Any]:
+        """
+        Converts an alert to a dictionary with camelCase keys and a formatted timestamp.
+        """
+        return dict(zip(self.keys, self._report_values(alert)))
+
+    def to_json(self, alert: Alert) -> str:
+        """
+        Serializes an alert to a JSON string, as json.dumps(alert.to_dict()) would.
+        """
+        return self._json_template.format(*self._json_values(alert))
+
+    def to_ndjson_bytes(self, alert: Alert) -> bytes:
+        """
+        Serializes an alert to one compact JSON line, newline included.
+        """
+        return (self._ndjson_template.format(*self._json_values(alert)) + "\n").encode()
+
+    def to_indented_json_bytes(self, alert: Alert) -> bytes:
+        """
+        Serializes an alert as an element of a JSON array indented by 4, without separator.
+        """
+        return self._indented_template.format(*self._json_values(alert)).encode()
+
+
+ALERT_SERIALIZER = AlertSerializer()
@@ -4,16 +4,22 @@ Dataclass for representing a parsed log entry with satellite telemetry values.
 
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Generic, TypeVar, Union
+
+# Kind of timestamp of a log entry, a datetime or int microseconds since the Unix epoch (UTC)
+TimestampT = TypeVar("TimestampT", bound=Union[datetime, int])
 
 
 @dataclass
-class LogEntry:
+class LogEntry(Generic[TimestampT]):
     """
     Represents a parsed log entry containing telemetry data for a satellite component,
     alert thresholds, and timestamp.
 
+    A parser produces entries with one kind of timestamp, LogEntry[datetime] or LogEntry[int].
+
     Attributes:
-        timestamp: Timestamp of the log entry.
+        timestamp: Timestamp of the log entry, a datetime or int microseconds since the Unix epoch (UTC).
         satellite_id: Satellite identifier.
         red_high_limit: Red high limit threshold.
         yellow_high_limit: Yellow high limit threshold.
@@ -23,7 +29,7 @@ class LogEntry:
         component: Component identifier.
     """
 
-    timestamp: datetime
+    timestamp: TimestampT
     satellite_id: int
     red_high_limit: int
     yellow_high_limit: int
@@ -0,0 +1,19 @@
+"""
+ASGI entrypoint of the telemetry ingestion service.
+
+Usage:
+    uvicorn my_mission_control.entrypoints.asgi:app
+"""
+
+from my_mission_control.api.app import create_app
+from my_mission_control.utils.log_util import setup_logging
+from my_mission_control.utils.pyproject_util import get_pyproject_metadata
+
+PROJECT_NAME, PROJECT_VERSION = get_pyproject_metadata()
+
+if PROJECT_NAME and PROJECT_VERSION:
+    setup_logging(service=PROJECT_NAME, version=PROJECT_VERSION)
+else:
+    setup_logging(service="unknown-service", version="0.0.0")
+
+app = create_app()
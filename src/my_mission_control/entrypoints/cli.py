@@ -1,24 +1,139 @@
 import argparse
-import json
+import glob
+import os
+import sys
+from typing import Iterable, List, Union
 
-from my_mission_control.parser.log_parser_v2 import process_log_file
+from my_mission_control.alerter.alert_rule_table import load_alert_rules
+from my_mission_control.alerter.log_file_decompressor import detect_compression
+from my_mission_control.alerter.log_file_processor_v2 import follow_alerts, iter_alerts, iter_merged_alerts, iter_stream_alerts, process_log_file_checkpointed
+from my_mission_control.alerter.parallel_log_processor import process_log_file_parallel
+from my_mission_control.alerter.sharded_log_processor import process_log_file_sharded
+from my_mission_control.config.settings import AlertRuleCfg
+from my_mission_control.entity.alert import Alert
+from my_mission_control.utils.alert_writer import write_alerts_json, write_alerts_ndjson
 from my_mission_control.utils.log_util import setup_logging
 from my_mission_control.utils.pyproject_util import get_pyproject_metadata
 
 PROJECT_NAME, PROJECT_VERSION = get_pyproject_metadata()
 
+# Log file argument that reads the log lines from standard input
+STDIN = "-"
+
+
+def expand_log_file_patterns(patterns: List[str]) -> List[str]:
+    """
+    Expands glob patterns to the sorted paths they match, patterns matching nothing are kept as given.
+    """
+    log_files: List[str] = []
+    for pattern in patterns:
+        log_files.extend(sorted(glob.glob(pattern)) or [pattern])
+    return log_files
+
+
+def is_compressed(log_file: str) -> bool:
+    """
+    Tells whether a log file is a compressed archive, a file that cannot be read is left for processing to report.
+    """
+    try:
+        return detect_compression(log_file) is not None
+    except OSError:
+        return False
+
 
 def main():
     parser = argparse.ArgumentParser(description="Process a log file and generate alerts.")
-    parser.add_argument("logfile", nargs="?", default="data/sample.log", help="Path ot the log file to process (default: data/sample.log)")
+    parser.add_argument(
+        "logfile",
+        nargs="*",
+        default=["data/sample.log"],
+        help="Paths or glob patterns of the log files to process, gzip, bzip2 and xz archives are decompressed as they are read, several files are merged by timestamp, - reads standard input (default: data/sample.log)",
+    )
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes used to process the log file (default: 1)")
+    parser.add_argument("--sharded", action="store_true", help="With --workers, route lines to workers by satellite instead of splitting the file into byte ranges")
+    parser.add_argument("--checkpoint", metavar="FILE", help="Periodically save the alert tracker state and input offset to FILE")
+    parser.add_argument("--resume", action="store_true", help="With --checkpoint, restore the saved state and continue from the saved offset")
+    parser.add_argument("--allowed-lateness", type=float, metavar="SECONDS", help="Reorder lines arriving out of timestamp order by up to SECONDS, dropping later ones")
+    parser.add_argument("--follow", action="store_true", help="Keep following the log file as it is appended to and rotated, emitting alerts as NDJSON as they fire")
+    parser.add_argument("--decompress-thread", action="store_true", help="Decompress compressed log files in a background thread, overlapping decompression with parsing")
+    parser.add_argument("--rules", metavar="FILE", help="Load the alert rules of every component from the TOML rule table FILE")
+    parser.add_argument(
+        "--format",
+        choices=("json", "ndjson"),
+        help="Output an indented JSON array, or one compact JSON alert per line (default: json, ndjson with --follow or -)",
+    )
     args = parser.parse_args()
+    log_files = expand_log_file_patterns(args.logfile)
+
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.sharded and args.workers < 2:
+        parser.error("--sharded requires --workers greater than 1")
+    if args.resume and not args.checkpoint:
+        parser.error("--resume requires --checkpoint")
+    if args.checkpoint and args.workers > 1:
+        parser.error("--checkpoint cannot be combined with --workers")
+    if args.allowed_lateness is not None:
+        if args.allowed_lateness < 0:
+            parser.error("--allowed-lateness must not be negative")
+        if args.checkpoint or args.workers > 1:
+            parser.error("--allowed-lateness cannot be combined with --checkpoint or --workers")
+    if len(log_files) > 1 and (args.checkpoint or args.workers > 1):
+        parser.error("--checkpoint and --workers take a single log file")
+    read_stdin = STDIN in log_files
+    if read_stdin and (len(log_files) > 1 or args.checkpoint or args.workers > 1 or args.follow):
+        parser.error("- reads standard input alone and cannot be combined with --checkpoint, --workers or --follow")
+    if args.follow:
+        if len(log_files) > 1 or args.checkpoint or args.workers > 1 or args.allowed_lateness is not None:
+            parser.error("--follow takes a single log file and cannot be combined with --checkpoint, --workers or --allowed-lateness")
+        if args.format == "json":
+            parser.error("--follow outputs alerts as they fire, use --format ndjson")
+    if (args.checkpoint or args.workers > 1 or args.follow) and not read_stdin and any(map(is_compressed, log_files)):
+        parser.error("compressed log files cannot be combined with --checkpoint, --workers or --follow")
+    if args.decompress_thread and (read_stdin or args.checkpoint or args.workers > 1 or args.follow):
+        parser.error("--decompress-thread cannot be combined with -, --checkpoint, --workers or --follow")
+    live_input = args.follow or read_stdin
+    output_format = args.format or ("ndjson" if live_input else "json")
 
-    alerts = process_log_file(args.logfile)
+    if args.rules:
+        try:
+            load_alert_rules(args.rules)
+        except (OSError, ValueError) as e:
+            parser.error(f"--rules {e}")
+        # Worker processes read the rule table path from the environment
+        AlertRuleCfg.ALERT_RULES_FILE = os.environ["ALERT_RULES_FILE"] = args.rules
 
-    json_alerts = json.dumps(alerts, indent=4)
+    allowed_lateness_us = round(args.allowed_lateness * 1_000_000) if args.allowed_lateness is not None else None
+    alerts: Iterable[Union[Alert, dict]]
+    if read_stdin:
+        alerts = iter_stream_alerts(sys.stdin.buffer, allowed_lateness_us, as_dict=False)
+    elif args.follow:
+        alerts = follow_alerts(log_files[0], as_dict=False)
+    elif len(log_files) > 1:
+        alerts = iter_merged_alerts(log_files, allowed_lateness_us, as_dict=False, decompress_in_thread=args.decompress_thread)
+    elif args.checkpoint:
+        alerts = process_log_file_checkpointed(log_files[0], args.checkpoint, args.resume)
+    elif args.workers > 1 and args.sharded:
+        alerts = process_log_file_sharded(log_files[0], args.workers)
+    elif args.workers > 1:
+        alerts = process_log_file_parallel(log_files[0], args.workers)
+    else:
+        alerts = iter_alerts(log_files[0], allowed_lateness_us=allowed_lateness_us, as_dict=False, decompress_in_thread=args.decompress_thread)
 
-    # Output in JSON format
-    print(json_alerts)
+    # Output in JSON or NDJSON format, serialized straight to the buffered binary stdout. NDJSON lines go out
+    # as alerts are triggered, the JSON document only once all alerts are in, after any log messages
+    if output_format == "ndjson":
+        sys.stdout.flush()
+        try:
+            write_alerts_ndjson(alerts, sys.stdout.buffer, flush_each=live_input)
+        except KeyboardInterrupt:
+            # Following or reading a pipe ends on interrupt, the alerts written so far are complete lines
+            if not live_input:
+                raise
+    else:
+        alerts = list(alerts)
+        sys.stdout.flush()
+        write_alerts_json(alerts, sys.stdout.buffer)
 
 
 if __name__ == "__main__":
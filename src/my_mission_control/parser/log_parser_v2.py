@@ -5,6 +5,8 @@ from typing import Deque, Dict, List, Optional
 
 from structlog.stdlib import get_logger
 
+from my_mission_control.alerter.timestamp_parser import LogTimestampParser
+
 TIME_FORMAT_INPUT = "%Y%m%d %H:%M:%S.%f"
 TIME_FORMAT_OUTPUT = "%Y-%m-%dT%H:%M:%S.%fZ"
 DELIMITER = "|"
@@ -22,6 +24,8 @@ SEVERITY_RED_LOW = "RED LOW"
 
 logger = get_logger(__name__)
 
+timestamp_parser = LogTimestampParser(TIME_FORMAT_INPUT)
+
 
 @dataclass
 class LogEntry:
@@ -47,7 +51,7 @@ def parse_log_line(line) -> Optional[LogEntry]:
 
     try:
         ts_str, sat_id, rhl, yhl, yll, rll, val, cmpnt = parts
-        ts = datetime.strptime(ts_str, TIME_FORMAT_INPUT)
+        ts = timestamp_parser.parse(ts_str)
         return LogEntry(ts, int(sat_id), int(rhl), int(yhl), int(yll), int(rll), float(val), cmpnt)
     except Exception as e:
         logger.error(f"Failed to parse line: '{line}' - {e}")
@@ -0,0 +1,74 @@
+"""
+Writes alerts to a binary output stream as they are produced.
+
+NDJSON output holds one compact JSON object per line, so a consumer can act on an alert as soon as its line
+arrives and the writer never holds more than one alert plus the stream's buffer. JSON output is the indented
+array json.dumps(alerts, indent=4) prints, written alert by alert.
+
+Alert objects are encoded straight to bytes by the precompiled AlertSerializer, alert dictionaries go
+through json.
+"""
+
+import json
+from typing import BinaryIO, Iterable, Union
+
+from my_mission_control.entity.alert import ALERT_SERIALIZER, Alert, AlertSerializer
+
+NDJSON_SEPARATORS = (",", ":")
+JSON_INDENT = 4
+
+
+def write_alerts_ndjson(alerts: Iterable[Union[Alert, dict]], stream: BinaryIO, serializer: AlertSerializer = ALERT_SERIALIZER, flush_each: bool = False) -> int:
+    """
+    Writes each alert as one JSON line, consuming the alerts lazily, then flushes the stream.
+
+    Args:
+        alerts (Iterable[Union[Alert, dict]]): Alerts or alert dictionaries, for example from iter_alerts.
+        stream (BinaryIO): Buffered binary stream, such as sys.stdout.buffer.
+        serializer (AlertSerializer): Serializer for Alert objects.
+        flush_each (bool): Flush after every line, for alerts produced at the pace of a live source.
+
+    Returns:
+        int: Number of alerts written.
+    """
+    count = 0
+    write = stream.write
+    to_ndjson_bytes = serializer.to_ndjson_bytes
+    for alert in alerts:
+        if isinstance(alert, Alert):
+            write(to_ndjson_bytes(alert))
+        else:
+            write(json.dumps(alert, separators=NDJSON_SEPARATORS).encode() + b"\n")
+        if flush_each:
+            stream.flush()
+        count += 1
+    stream.flush()
+    return count
+
+
+def write_alerts_json(alerts: Iterable[Union[Alert, dict]], stream: BinaryIO, serializer: AlertSerializer = ALERT_SERIALIZER) -> int:
+    """
+    Writes the alerts as an indented JSON array followed by a newline, byte for byte what
+    print(json.dumps(alerts, indent=4)) outputs, consuming the alerts lazily, then flushes the stream.
+
+    Args:
+        alerts (Iterable[Union[Alert, dict]]): Alerts or alert dictionaries.
+        stream (BinaryIO): Buffered binary stream, such as sys.stdout.buffer.
+        serializer (AlertSerializer): Serializer for Alert objects.
+
+    Returns:
+        int: Number of alerts written.
+    """
+    count = 0
+    write = stream.write
+    to_indented_json_bytes = serializer.to_indented_json_bytes
+    for alert in alerts:
+        write(b",\n" if count else b"[\n")
+        if isinstance(alert, Alert):
+            write(to_indented_json_bytes(alert))
+        else:
+            write(b"\n".join(b"    " + line for line in json.dumps(alert, indent=JSON_INDENT).encode().split(b"\n")))
+        count += 1
+    write(b"\n]\n" if count else b"[]\n")
+    stream.flush()
+    return count
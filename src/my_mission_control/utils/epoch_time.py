@@ -0,0 +1,22 @@
+"""
+Conversions between naive UTC datetimes and integer microseconds since the Unix epoch.
+"""
+
+from datetime import datetime, timedelta
+
+EPOCH = datetime(1970, 1, 1)
+ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def datetime_to_epoch_us(timestamp: datetime) -> int:
+    """
+    Converts a naive datetime, taken as UTC, to integer microseconds since the Unix epoch.
+    """
+    return (timestamp - EPOCH) // ONE_MICROSECOND
+
+
+def epoch_us_to_datetime(timestamp_us: int) -> datetime:
+    """
+    Converts integer microseconds since the Unix epoch to a naive datetime, taken as UTC.
+    """
+    return EPOCH + timedelta(microseconds=timestamp_us)
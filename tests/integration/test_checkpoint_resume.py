@@ -0,0 +1,147 @@
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+
+from my_mission_control.alerter.log_file_processor_v2 import process_log_file, process_log_file_checkpointed
+from my_mission_control.alerter.tracker_checkpoint import load_checkpoint
+from my_mission_control.entrypoints.cli import main
+from tests.utils.log_helper import make_log_line
+
+
+def make_lines(count: int):
+    base_time = datetime(2018, 1, 1, 23, 0, 0)
+    lines = []
+    for i in range(count):
+        ts = base_time + timedelta(seconds=i * 11)
+        if i % 2:
+            lines.append(make_log_line(ts, 1000 + i % 3, 17, 15, 9, 8, 7.5 if i % 5 else 8.5, "BATT"))
+        else:
+            lines.append(make_log_line(ts, 1000 + i % 4, 101, 98, 25, 20, 101.5 if i % 7 else 99.0, "TSTAT"))
+    return lines
+
+
+@pytest.fixture
+def work_dir():
+    with tempfile.TemporaryDirectory() as directory:
+        yield directory
+
+
+def write_lines(path: str, lines, mode: str = "w"):
+    with open(path, mode) as log_file:
+        log_file.write("".join(line + "\n" for line in lines))
+
+
+def test_checkpointed_processing_matches_process_log_file(work_dir):
+    log_file = os.path.join(work_dir, "telemetry.log")
+    checkpoint_file = os.path.join(work_dir, "telemetry.ckpt")
+    write_lines(log_file, make_lines(1000))
+
+    alerts = process_log_file_checkpointed(log_file, checkpoint_file, interval_lines=128)
+
+    assert len(alerts) > 0
+    assert alerts == process_log_file(log_file)
+    assert load_checkpoint(checkpoint_file).offset == os.path.getsize(log_file)
+
+
+def test_resume_processes_only_appended_lines(work_dir):
+    log_file = os.path.join(work_dir, "telemetry.log")
+    checkpoint_file = os.path.join(work_dir, "telemetry.ckpt")
+    lines = make_lines(1000)
+    write_lines(log_file, lines[:600])
+    first_alerts = process_log_file_checkpointed(log_file, checkpoint_file)
+
+    write_lines(log_file, lines[600:], mode="a")
+    resumed_alerts = process_log_file_checkpointed(log_file, checkpoint_file, resume=True)
+
+    assert len(resumed_alerts) > 0
+    assert first_alerts + resumed_alerts == process_log_file(log_file)
+    assert process_log_file_checkpointed(log_file, checkpoint_file, resume=True) == []
+
+
+def test_resume_processes_line_completed_after_checkpoint(work_dir):
+    log_file = os.path.join(work_dir, "telemetry.log")
+    checkpoint_file = os.path.join(work_dir, "telemetry.ckpt")
+    lines = make_lines(1000)
+    write_lines(log_file, lines[:599])
+    # The writer is still appending the last line
+    last_line = lines[599] + "\n"
+    with open(log_file, "a") as partial_file:
+        partial_file.write(last_line[:20])
+    first_alerts = process_log_file_checkpointed(log_file, checkpoint_file)
+    assert load_checkpoint(checkpoint_file).offset == os.path.getsize(log_file) - 20
+
+    with open(log_file, "a") as partial_file:
+        partial_file.write(last_line[20:])
+    write_lines(log_file, lines[600:], mode="a")
+    resumed_alerts = process_log_file_checkpointed(log_file, checkpoint_file, resume=True)
+
+    assert first_alerts + resumed_alerts == process_log_file(log_file)
+
+
+def test_last_line_without_newline_is_processed(work_dir):
+    log_file = os.path.join(work_dir, "telemetry.log")
+    checkpoint_file = os.path.join(work_dir, "telemetry.ckpt")
+    lines = make_lines(54)
+    with open(log_file, "w") as nonl_file:
+        nonl_file.write("\n".join(lines))
+
+    alerts = process_log_file_checkpointed(log_file, checkpoint_file)
+
+    # The last line triggers the last alert
+    assert alerts == process_log_file(log_file)
+    assert len(alerts) > len(process_log_file_checkpointed(log_file, checkpoint_file + ".resumed", resume=True)) > 0
+    assert load_checkpoint(checkpoint_file).offset == os.path.getsize(log_file) - len(lines[-1])
+
+
+def test_resume_on_replaced_file_starts_over(work_dir):
+    log_file = os.path.join(work_dir, "telemetry.log")
+    checkpoint_file = os.path.join(work_dir, "telemetry.ckpt")
+    lines = make_lines(1000)
+    write_lines(log_file, lines[:600])
+    process_log_file_checkpointed(log_file, checkpoint_file)
+
+    # A new file at the same path, shorter than the checkpointed offset
+    os.remove(log_file)
+    write_lines(log_file, lines[:300])
+
+    assert process_log_file_checkpointed(log_file, checkpoint_file, resume=True) == process_log_file(log_file)
+
+
+def test_resume_without_checkpoint_starts_over(work_dir):
+    log_file = os.path.join(work_dir, "telemetry.log")
+    write_lines(log_file, make_lines(200))
+
+    assert process_log_file_checkpointed(log_file, os.path.join(work_dir, "missing.ckpt"), resume=True) == process_log_file(log_file)
+
+
+def test_cli_resume(work_dir, capsys, monkeypatch):
+    log_file = os.path.join(work_dir, "telemetry.log")
+    checkpoint_file = os.path.join(work_dir, "telemetry.ckpt")
+    lines = make_lines(1000)
+    write_lines(log_file, lines[:600])
+
+    monkeypatch.setattr(sys, "argv", ["dummy_cli_script_name", log_file, "--checkpoint", checkpoint_file])
+    main()
+    first_output = capsys.readouterr().out
+
+    write_lines(log_file, lines[600:], mode="a")
+    monkeypatch.setattr(sys, "argv", ["dummy_cli_script_name", log_file, "--checkpoint", checkpoint_file, "--resume"])
+    main()
+    resumed_output = capsys.readouterr().out
+
+    def read_json_output(output: str):
+        # Skip log messages printed before the JSON document
+        lines = output.splitlines()
+        return json.loads("\n".join(lines[next(index for index, line in enumerate(lines) if line.startswith("[")) :]))
+
+    assert read_json_output(first_output) + read_json_output(resumed_output) == process_log_file(log_file)
+
+
+def test_cli_resume_requires_checkpoint(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["dummy_cli_script_name", "data/sample.log", "--resume"])
+    with pytest.raises(SystemExit):
+        main()
@@ -0,0 +1,105 @@
+import bz2
+import gzip
+import json
+import lzma
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+
+from my_mission_control.alerter.log_file_processor_v2 import iter_alerts, process_log_file, process_log_files
+from my_mission_control.entrypoints.cli import main
+from tests.utils.log_helper import make_log_line
+
+COMPRESSORS = {"gzip": gzip.compress, "bz2": bz2.compress, "xz": lzma.compress}
+
+
+@pytest.fixture
+def log_file():
+    base_time = datetime(2018, 1, 1, 23, 0, 0)
+    lines = []
+    for i in range(2000):
+        ts = base_time + timedelta(seconds=i * 7)
+        if i % 2:
+            lines.append(make_log_line(ts, 1000 + i % 3, 17, 15, 9, 8, 7.5 if i % 5 else 8.5, "BATT"))
+        else:
+            lines.append(make_log_line(ts, 1000 + i % 4, 101, 98, 25, 20, 101.5 if i % 7 else 99.0, "TSTAT"))
+    lines.append("20180101 23:01:09.521|1000|17|15|9|8|7.8")  # malformed
+
+    with tempfile.NamedTemporaryFile(mode="w+", delete=False) as tmp:
+        tmp.write("\n".join(lines))
+        path = tmp.name
+    yield path
+    os.remove(path)  # cleanup
+
+
+@pytest.fixture(params=list(COMPRESSORS))
+def compressed_log_file(request, log_file):
+    with open(log_file, "rb") as f:
+        data = COMPRESSORS[request.param](f.read())
+    # No archive suffix, the format is recognized by its magic bytes
+    with tempfile.NamedTemporaryFile(delete=False) as tmp:
+        tmp.write(data)
+        path = tmp.name
+    yield path
+    os.remove(path)  # cleanup
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"decompress_in_thread": True},
+        {"memory_mapped": True},
+        {"lazy": True},
+        {"batch_size": 100},
+        {"vectorized": True, "batch_size": 100},
+        {"allowed_lateness_us": 60_000_000},
+    ],
+)
+def test_process_compressed_log_file_matches_plain(log_file, compressed_log_file, options):
+    expected_alerts = process_log_file(log_file)
+
+    assert len(expected_alerts) > 0
+    assert process_log_file(compressed_log_file, **options) == expected_alerts
+
+
+@pytest.mark.parametrize("decompress_in_thread", [False, True])
+@pytest.mark.parametrize("allowed_lateness_us", [None, 60_000_000])
+def test_iter_alerts_of_compressed_log_file(log_file, compressed_log_file, decompress_in_thread, allowed_lateness_us):
+    alerts = iter_alerts(compressed_log_file, allowed_lateness_us=allowed_lateness_us, decompress_in_thread=decompress_in_thread)
+
+    assert list(alerts) == process_log_file(log_file)
+
+
+@pytest.mark.parametrize("decompress_in_thread", [False, True])
+def test_merge_compressed_and_plain_log_files(log_file, compressed_log_file, decompress_in_thread):
+    assert process_log_files([compressed_log_file, log_file], decompress_in_thread=decompress_in_thread) == process_log_files([log_file, log_file])
+
+
+@pytest.mark.parametrize("extra_args", [[], ["--decompress-thread"]])
+def test_cli_compressed_log_file(log_file, compressed_log_file, extra_args, capsysbinary, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["dummy_cli_script_name", compressed_log_file, "--format", "ndjson", *extra_args])
+    main()
+
+    lines = capsysbinary.readouterr().out.splitlines()
+    alerts = [json.loads(line) for line in lines if line.startswith(b"{")]
+    assert alerts == process_log_file(log_file)
+
+
+@pytest.mark.parametrize("extra_args", [["--workers", "2"], ["--checkpoint", "unused.ckpt"], ["--follow"]])
+def test_cli_rejects_compressed_log_file_with_offsets(compressed_log_file, extra_args, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["dummy_cli_script_name", compressed_log_file, *extra_args])
+
+    with pytest.raises(SystemExit):
+        main()
+
+
+@pytest.mark.parametrize("stdin, extra_args", [(True, []), (False, ["--workers", "2"]), (False, ["--follow", "--format", "ndjson"])])
+def test_cli_rejects_decompress_thread_without_decompression(log_file, stdin, extra_args, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["dummy_cli_script_name", "-" if stdin else log_file, *extra_args, "--decompress-thread"])
+
+    with pytest.raises(SystemExit):
+        main()
@@ -0,0 +1,171 @@
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from my_mission_control.alerter.log_file_processor_v2 import _iter_log_lines_alerts
+from my_mission_control.alerter.log_line_parser import parse_log_line_bytes
+from my_mission_control.api.alert_broadcaster import AlertBroadcaster
+from my_mission_control.api.alert_routes import WS_CLOSE_TRY_AGAIN_LATER
+from my_mission_control.api.app import create_app
+from tests.utils.log_helper import make_log_line
+
+
+def make_upload(count: int = 400) -> bytes:
+    base_time = datetime(2018, 1, 1, 23, 0, 0)
+    lines = []
+    for i in range(count):
+        ts = base_time + timedelta(seconds=i * 7)
+        if i % 2:
+            lines.append(make_log_line(ts, 1000 + i % 3, 17, 15, 9, 8, 7.5 if i % 5 else 8.5, "BATT"))
+        else:
+            lines.append(make_log_line(ts, 1000 + i % 4, 101, 98, 25, 20, 101.5 if i % 7 else 99.0, "TSTAT"))
+    return "\n".join(lines).encode()
+
+
+def expected_alerts(data: bytes):
+    return [alert.to_dict() for alert in _iter_log_lines_alerts(data.splitlines(), parse_log_line_bytes)]
+
+
+def wait_for_subscribers(app, mission_id: str, count: int = 1):
+    deadline = time.monotonic() + 5
+    while app.state.alert_broadcaster.subscriber_count(mission_id) < count:
+        assert time.monotonic() < deadline, "subscriber never registered"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def app():
+    return create_app()
+
+
+def test_websocket_receives_alerts_of_uploads(app):
+    data = make_upload()
+    with TestClient(app) as client:
+        with client.websocket_connect("/missions/apollo/alerts/ws") as websocket:
+            wait_for_subscribers(app, "apollo")
+            client.post("/missions/gemini/telemetry", content=data)
+            response = client.post("/missions/apollo/telemetry", content=data)
+
+            alert_count = len(response.content.splitlines())
+            pushed = [websocket.receive_json() for _ in range(alert_count)]
+
+        assert alert_count > 0
+        assert pushed == expected_alerts(data)
+
+    assert app.state.alert_broadcaster.subscriber_count() == 0
+
+
+def test_websocket_frames_are_compact_json_alerts(app):
+    data = make_upload(40)
+    with TestClient(app) as client:
+        with client.websocket_connect("/missions/apollo/alerts/ws") as websocket:
+            wait_for_subscribers(app, "apollo")
+            response = client.post("/missions/apollo/telemetry", content=data)
+
+            frames = [websocket.receive_text() for _ in response.content.splitlines()]
+
+    assert len(frames) > 0
+    assert frames == [json.dumps(alert, separators=(",", ":")) for alert in expected_alerts(data)]
+
+
+def test_websocket_slow_consumer_is_closed(app):
+    app.state.alert_broadcaster = AlertBroadcaster(queue_size=5)
+    with TestClient(app) as client:
+        with client.websocket_connect("/missions/apollo/alerts/ws") as websocket:
+            wait_for_subscribers(app, "apollo")
+            client.post("/missions/apollo/telemetry", content=make_upload())
+
+            with pytest.raises(WebSocketDisconnect) as disconnect:
+                while True:
+                    websocket.receive_json()
+
+    assert disconnect.value.code == WS_CLOSE_TRY_AGAIN_LATER
+    assert app.state.alert_broadcaster.dropped_subscriber_count == 1
+
+
+async def stream_events(app, path: str, until):
+    """
+    Requests a server-sent events stream through the ASGI interface, disconnecting once until(body) holds.
+    """
+    body = bytearray()
+    disconnect = asyncio.Event()
+
+    async def receive():
+        await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200
+        elif message["type"] == "http.response.body":
+            body.extend(message.get("body", b""))
+            if until(bytes(body)):
+                disconnect.set()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": ("test", 1),
+        "server": ("test", 80),
+    }
+    return asyncio.create_task(app(scope, receive, send)), body
+
+
+def parse_events(body: bytes):
+    events = []
+    for event in body.split(b"\n\n"):
+        fields = dict(line.split(b": ", 1) for line in event.splitlines() if not line.startswith(b":"))
+        if fields:
+            events.append(fields)
+    return events
+
+
+def test_server_sent_events_receive_alerts_of_uploads(app):
+    data = make_upload()
+    alerts = expected_alerts(data)
+
+    async def scenario():
+        stream, body = await stream_events(app, "/missions/apollo/alerts/stream", lambda body: body.count(b"data: ") >= len(alerts))
+        while app.state.alert_broadcaster.subscriber_count("apollo") < 1:
+            await asyncio.sleep(0.01)
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            await client.post("/missions/apollo/telemetry", content=data)
+        await asyncio.wait_for(stream, 5)
+        return bytes(body)
+
+    body = asyncio.run(scenario())
+
+    assert body.startswith(b": subscribed\n\n")
+    assert [json.loads(event[b"data"]) for event in parse_events(body)] == alerts
+    assert app.state.alert_broadcaster.subscriber_count() == 0
+
+
+def test_server_sent_events_slow_consumer_gets_dropped_event(app):
+    app.state.alert_broadcaster = AlertBroadcaster(queue_size=5)
+
+    async def scenario():
+        stream, body = await stream_events(app, "/missions/apollo/alerts/stream", lambda body: False)
+        while app.state.alert_broadcaster.subscriber_count("apollo") < 1:
+            await asyncio.sleep(0.01)
+        # Published in one go, before the subscriber gets a chance to send anything
+        app.state.alert_broadcaster.publish("apollo", list(_iter_log_lines_alerts(make_upload().splitlines(), parse_log_line_bytes)))
+        await asyncio.wait_for(stream, 5)
+        return bytes(body)
+
+    body = asyncio.run(scenario())
+
+    assert parse_events(body) == [{b"event": b"dropped", b"data": b"slow consumer"}]
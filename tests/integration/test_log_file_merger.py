@@ -0,0 +1,82 @@
+import os
+import random
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+
+from my_mission_control.alerter.log_file_merger import merge_log_files
+from my_mission_control.alerter.log_file_processor_v2 import process_log_file, process_log_files
+from my_mission_control.entrypoints.cli import main
+from tests.integration.test_parallel_log_processor import read_json_output
+from tests.utils.log_helper import make_log_line
+
+STATIONS = 3
+
+
+@pytest.fixture
+def station_log_files():
+    rng = random.Random(0)
+    base_time = datetime(2018, 1, 1, 23, 0, 0)
+    lines = []
+    for i in range(2000):
+        ts = base_time + timedelta(seconds=i * 5)
+        if i % 2:
+            lines.append(make_log_line(ts, 1000 + i % 3, 17, 15, 9, 8, rng.choice((7.5, 8.5)), "BATT"))
+        else:
+            lines.append(make_log_line(ts, 1000 + i % 4, 101, 98, 25, 20, rng.choice((99.0, 101.5)), "TSTAT"))
+
+    # Every station receives a share of the fleet's lines, in timestamp order
+    with tempfile.TemporaryDirectory() as directory:
+        combined_file = os.path.join(directory, "combined.log")
+        with open(combined_file, "w") as combined:
+            combined.write("\n".join(lines))
+        station_files = [os.path.join(directory, f"station-{station}.log") for station in range(STATIONS)]
+        station_lines = [[] for _ in range(STATIONS)]
+        for line in lines:
+            station_lines[rng.randrange(STATIONS)].append(line)
+        station_lines[0].append("20180101 23:01:09.521|1000|17|15|9|8|7.8")  # malformed
+        for station_file, station_line in zip(station_files, station_lines):
+            with open(station_file, "w") as station:
+                station.write("\n".join(station_line))
+        yield combined_file, station_files
+
+
+def test_merged_stream_is_in_timestamp_order(station_log_files):
+    combined_file, station_files = station_log_files
+    timestamps = [log_entry.timestamp for log_entry in merge_log_files(station_files)]
+
+    assert len(timestamps) == 2000
+    assert timestamps == sorted(timestamps)
+
+
+def test_merged_stations_match_combined_log(station_log_files):
+    combined_file, station_files = station_log_files
+    expected_alerts = process_log_file(combined_file)
+
+    assert len(expected_alerts) > 0
+    assert process_log_files(station_files) == expected_alerts
+
+
+def test_violations_from_different_stations_share_a_window():
+    base_time = datetime(2018, 1, 1, 23, 0, 0)
+    with tempfile.TemporaryDirectory() as directory:
+        station_files = []
+        for station in range(STATIONS):
+            station_files.append(os.path.join(directory, f"station-{station}.log"))
+            with open(station_files[-1], "w") as station_file:
+                station_file.write(make_log_line(base_time + timedelta(seconds=station * 10), 1000, 17, 15, 9, 8, 7.5, "BATT"))
+
+        assert all(process_log_file(station_file) == [] for station_file in station_files)
+        assert process_log_files(station_files) == [{"satelliteId": 1000, "severity": "RED LOW", "component": "BATT", "timestamp": "2018-01-01T23:00:00.000000Z"}]
+
+
+def test_cli_merges_paths_and_globs(station_log_files, capsys, monkeypatch):
+    combined_file, station_files = station_log_files
+    expected_alerts = process_log_file(combined_file)
+
+    monkeypatch.setattr(sys, "argv", ["dummy_cli_script_name", station_files[0], os.path.join(os.path.dirname(combined_file), "station-[12].log")])
+    main()
+
+    assert read_json_output(capsys.readouterr().out) == expected_alerts
@@ -0,0 +1,90 @@
+import json
+import os
+import random
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+
+from my_mission_control.alerter.log_file_processor_v2 import process_log_file
+from my_mission_control.alerter.log_file_scanner import iter_log_lines_mmap, split_log_file
+from my_mission_control.alerter.parallel_log_processor import _collect_range_violations, merge_range_violations, process_log_file_parallel
+from my_mission_control.entrypoints.cli import main
+from tests.utils.log_helper import make_log_line
+
+
+@pytest.fixture
+def log_file():
+    rng = random.Random(0)
+    ts = datetime(2018, 1, 1, 23, 0, 0)
+    lines = []
+    for _ in range(3000):
+        ts += timedelta(milliseconds=rng.randint(0, 20_000))
+        sat_id = rng.randint(1000, 1004)
+        if rng.random() < 0.5:
+            lines.append(make_log_line(ts, sat_id, 17, 15, 9, 8, round(rng.uniform(7.0, 9.0), 1), "BATT"))
+        else:
+            lines.append(make_log_line(ts, sat_id, 101, 98, 25, 20, round(rng.uniform(99.0, 103.0), 1), "TSTAT"))
+        if rng.random() < 0.01:
+            lines.append("20180101 23:01:09.521|1000|17|15|9|8|7.8")  # malformed
+        if rng.random() < 0.01:
+            lines.append(make_log_line(ts, sat_id, 17, 15, 9, 8, 1.0, "GYRO"))  # no strategy
+
+    with tempfile.NamedTemporaryFile(mode="w+", delete=False) as tmp:
+        tmp.write("\n".join(lines))
+        path = tmp.name
+    yield path
+    os.remove(path)  # cleanup
+
+
+@pytest.mark.parametrize("parts", [1, 2, 3, 7, 64])
+def test_split_log_file_ranges_cover_all_lines(log_file, parts):
+    byte_ranges = split_log_file(log_file, parts)
+
+    assert byte_ranges[0][0] == 0
+    assert byte_ranges[-1][1] == os.path.getsize(log_file)
+    assert all(end == next_start for (_, end), (next_start, _) in zip(byte_ranges, byte_ranges[1:]))
+    assert [line for start, end in byte_ranges for line in iter_log_lines_mmap(log_file, start=start, end=end)] == list(iter_log_lines_mmap(log_file))
+
+
+def test_split_log_file_small_file():
+    with tempfile.NamedTemporaryFile(mode="w+", delete=False) as tmp:
+        tmp.write("20180101 23:01:09.521|1000|17|15|9|8|7.8|BATT\n")
+        path = tmp.name
+    try:
+        assert split_log_file(path, 8) == [(0, os.path.getsize(path))]
+    finally:
+        os.remove(path)  # cleanup
+
+
+@pytest.mark.parametrize("parts", [1, 3, 16])
+def test_merged_ranges_match_process_log_file(log_file, parts):
+    expected_alerts = process_log_file(log_file)
+
+    range_violations = [_collect_range_violations(log_file, start, end) for start, end in split_log_file(log_file, parts)]
+
+    assert len(expected_alerts) > 0
+    assert [alert.to_dict() for alert in merge_range_violations(range_violations)] == expected_alerts
+
+
+def test_process_log_file_parallel(log_file):
+    assert process_log_file_parallel(log_file, 3) == process_log_file(log_file)
+
+
+def read_json_output(output: str):
+    # Skip log messages printed before the JSON document
+    lines = output.splitlines()
+    return json.loads("\n".join(lines[lines.index("[") :]))
+
+
+def test_cli_workers(log_file, capsys, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["dummy_cli_script_name", log_file])
+    main()
+    sequential_alerts = read_json_output(capsys.readouterr().out)
+
+    monkeypatch.setattr(sys, "argv", ["dummy_cli_script_name", log_file, "--workers", "2"])
+    main()
+
+    assert len(sequential_alerts) > 0
+    assert read_json_output(capsys.readouterr().out) == sequential_alerts
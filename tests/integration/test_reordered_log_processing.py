@@ -0,0 +1,68 @@
+import os
+import random
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+
+from my_mission_control.alerter.log_file_processor_v2 import process_log_file
+from my_mission_control.entrypoints.cli import main
+from tests.utils.log_helper import make_log_line
+
+ALLOWED_LATENESS_US = 30_000_000
+
+
+def write_log_file(lines) -> str:
+    with tempfile.NamedTemporaryFile(mode="w+", delete=False) as tmp:
+        tmp.write("\n".join(lines))
+        return tmp.name
+
+
+@pytest.fixture
+def ordered_and_shuffled_log_files():
+    rng = random.Random(0)
+    base_time = datetime(2018, 1, 1, 23, 0, 0)
+    events = []
+    for i in range(2000):
+        ts = base_time + timedelta(seconds=i * 5)
+        if i % 2:
+            events.append((ts, make_log_line(ts, 1000 + i % 3, 17, 15, 9, 8, rng.choice((7.5, 8.5)), "BATT")))
+        else:
+            events.append((ts, make_log_line(ts, 1000 + i % 4, 101, 98, 25, 20, rng.choice((99.0, 101.5)), "TSTAT")))
+
+    # Each line arrives up to the allowed lateness after its timestamp
+    arrivals = sorted(events, key=lambda event: event[0] + timedelta(microseconds=rng.randint(0, ALLOWED_LATENESS_US)))
+    ordered_path = write_log_file(line for _, line in events)
+    shuffled_path = write_log_file(line for _, line in arrivals)
+    yield ordered_path, shuffled_path
+    os.remove(ordered_path)  # cleanup
+    os.remove(shuffled_path)  # cleanup
+
+
+@pytest.mark.parametrize("memory_mapped", [False, True])
+def test_reordered_processing_matches_ordered_input(ordered_and_shuffled_log_files, memory_mapped):
+    ordered_path, shuffled_path = ordered_and_shuffled_log_files
+    expected_alerts = process_log_file(ordered_path)
+
+    assert len(expected_alerts) > 0
+    assert process_log_file(shuffled_path) != expected_alerts
+    assert process_log_file(shuffled_path, memory_mapped=memory_mapped, allowed_lateness_us=ALLOWED_LATENESS_US) == expected_alerts
+
+
+def test_lines_later_than_allowed_lateness_are_dropped():
+    base_time = datetime(2018, 1, 1, 23, 0, 0)
+    lines = [make_log_line(base_time + timedelta(seconds=seconds), 1000, 17, 15, 9, 8, 7.5, "BATT") for seconds in (0, 10, 400, 20, 410)]
+    path = write_log_file(lines)
+    try:
+        # The line at 20 seconds arrives 380 seconds late
+        assert process_log_file(path, allowed_lateness_us=60_000_000) == []
+        assert len(process_log_file(path, allowed_lateness_us=400_000_000)) == 1
+    finally:
+        os.remove(path)  # cleanup
+
+
+def test_cli_rejects_negative_lateness(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["dummy_cli_script_name", "data/sample.log", "--allowed-lateness", "-1"])
+    with pytest.raises(SystemExit):
+        main()
@@ -0,0 +1,111 @@
+import multiprocessing
+import os
+import queue
+import random
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+
+from my_mission_control.alerter import sharded_log_processor
+from my_mission_control.alerter.log_file_processor_v2 import process_log_file
+from my_mission_control.alerter.sharded_log_processor import process_log_file_sharded, route_log_line
+from my_mission_control.config.settings import InputLogFileCfg
+from my_mission_control.entrypoints.cli import main
+from tests.utils.log_helper import make_log_line
+
+
+@pytest.fixture
+def log_file():
+    rng = random.Random(1)
+    ts = datetime(2018, 1, 1, 23, 0, 0)
+    lines = []
+    for _ in range(3000):
+        ts += timedelta(milliseconds=rng.randint(0, 5_000))
+        sat_id = rng.randint(1000, 1030)
+        if rng.random() < 0.5:
+            lines.append(make_log_line(ts, sat_id, 17, 15, 9, 8, round(rng.uniform(7.0, 9.0), 1), "BATT"))
+        else:
+            lines.append(make_log_line(ts, sat_id, 101, 98, 25, 20, round(rng.uniform(99.0, 103.0), 1), "TSTAT"))
+        if rng.random() < 0.01:
+            lines.append("20180101 23:01:09.521|abc|17|15|9|8|7.8|BATT")  # non numeric satellite id
+
+    with tempfile.NamedTemporaryFile(mode="w+", delete=False) as tmp:
+        tmp.write("\n".join(lines))
+        path = tmp.name
+    yield path
+    os.remove(path)  # cleanup
+
+
+@pytest.mark.parametrize(
+    "line, expected_shard",
+    [
+        (b"20180101 23:01:09.521|1001|17|15|9|8|7.8|BATT", 1001 % 4),
+        (b"20180101 23:01:09.521| 1002 |17|15|9|8|7.8|BATT", 1002 % 4),
+        (b"20180101 23:01:09.521|abc|17|15|9|8|7.8|BATT", 0),
+        (b"20180101 23:01:09.521", 0),
+        (b"", 0),
+    ],
+)
+def test_route_log_line(line, expected_shard):
+    assert route_log_line(line, 4) == expected_shard
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_sharded_matches_process_log_file(log_file, workers, monkeypatch):
+    # Small batches so every worker receives several messages
+    monkeypatch.setattr(InputLogFileCfg, "LOG_SHARD_BATCH_SIZE", 64)
+
+    expected_alerts = process_log_file(log_file)
+
+    assert len(expected_alerts) > 0
+    assert process_log_file_sharded(log_file, workers) == expected_alerts
+
+
+def exit_worker(shard_index, batches, results):
+    os._exit(3)
+
+
+def test_sharded_fails_when_a_worker_exits(log_file, monkeypatch):
+    # Small batches and queues so the reader fills the queue of the dead worker
+    monkeypatch.setattr(InputLogFileCfg, "LOG_SHARD_BATCH_SIZE", 16)
+    monkeypatch.setattr(InputLogFileCfg, "LOG_SHARD_QUEUE_SIZE", 1)
+    monkeypatch.setattr(sharded_log_processor, "_shard_worker", exit_worker)
+
+    with pytest.raises(RuntimeError, match="exited with code 3"):
+        process_log_file_sharded(log_file, 2)
+
+
+class LateResults:
+    """
+    Results queue whose get times out although the alerts were sent, as when a worker sends them and exits right after the timeout.
+    """
+
+    def __init__(self, results):
+        self.results = list(results)
+
+    def get(self, timeout):
+        raise queue.Empty
+
+    def get_nowait(self):
+        if not self.results:
+            raise queue.Empty
+        return self.results.pop(0)
+
+
+def test_alerts_sent_before_a_worker_exits_are_collected():
+    worker = multiprocessing.Process(target=int)
+    worker.start()
+    worker.join()
+    alerts = [(7, {"satelliteId": 1001})]
+
+    assert sharded_log_processor._collect_shard_alerts(LateResults([(0, alerts)]), [worker]) == [alerts]  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("extra_args", [[], ["--workers", "1"]])
+def test_cli_sharded_requires_several_workers(log_file, extra_args, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["dummy_cli_script_name", log_file, "--sharded", *extra_args])
+
+    with pytest.raises(SystemExit):
+        main()
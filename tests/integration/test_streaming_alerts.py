@@ -0,0 +1,111 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import types
+from datetime import datetime, timedelta
+
+import pytest
+
+from my_mission_control.alerter.log_file_processor_v2 import follow_alerts, iter_alerts, iter_stream_alerts, process_log_file
+from my_mission_control.entrypoints.cli import main
+from tests.utils.log_helper import make_log_line
+
+
+@pytest.fixture
+def log_file():
+    base_time = datetime(2018, 1, 1, 23, 0, 0)
+    lines = []
+    for i in range(2000):
+        ts = base_time + timedelta(seconds=i * 7)
+        if i % 2:
+            lines.append(make_log_line(ts, 1000 + i % 3, 17, 15, 9, 8, 7.5 if i % 5 else 8.5, "BATT"))
+        else:
+            lines.append(make_log_line(ts, 1000 + i % 4, 101, 98, 25, 20, 101.5 if i % 7 else 99.0, "TSTAT"))
+    lines.append("20180101 23:01:09.521|1000|17|15|9|8|7.8")  # malformed
+
+    with tempfile.NamedTemporaryFile(mode="w+", delete=False) as tmp:
+        tmp.write("\n".join(lines))
+        path = tmp.name
+    yield path
+    os.remove(path)  # cleanup
+
+
+@pytest.mark.parametrize("memory_mapped", [False, True])
+@pytest.mark.parametrize("allowed_lateness_us", [None, 60_000_000])
+def test_iter_alerts_matches_process_log_file(log_file, memory_mapped, allowed_lateness_us):
+    alerts = iter_alerts(log_file, memory_mapped=memory_mapped, allowed_lateness_us=allowed_lateness_us)
+
+    assert isinstance(alerts, types.GeneratorType)
+    expected_alerts = process_log_file(log_file)
+    assert len(expected_alerts) > 0
+    assert list(alerts) == expected_alerts
+
+
+def test_iter_alerts_yields_before_the_file_is_read(log_file):
+    alerts = iter_alerts(log_file)
+    first_alert = next(alerts)
+    alerts.close()
+
+    assert first_alert == process_log_file(log_file)[0]
+
+
+def test_cli_ndjson_output(log_file, capsysbinary, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["dummy_cli_script_name", log_file, "--format", "ndjson"])
+    main()
+
+    lines = capsysbinary.readouterr().out.splitlines()
+    alert_lines = [line for line in lines if line.startswith(b"{")]
+    assert [json.loads(line) for line in alert_lines] == process_log_file(log_file)
+
+
+def test_follow_alerts_matches_process_log_file_for_appended_lines(log_file):
+    expected_alerts = process_log_file(log_file)
+    with open(log_file, "rb") as source:
+        data = source.read()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        followed_file = os.path.join(tmp_dir, "telemetry.log")
+        stop = threading.Event()
+
+        def append_in_chunks():
+            # Chunk boundaries fall inside lines
+            for start in range(0, len(data), 7001):
+                with open(followed_file, "ab") as followed:
+                    followed.write(data[start : start + 7001])
+                time.sleep(0.005)
+
+        writer = threading.Thread(target=append_in_chunks)
+        writer.start()
+        # Stops following if alerts go missing
+        timeout = threading.Timer(30, stop.set)
+        timeout.start()
+        alerts = []
+        for alert in follow_alerts(followed_file, stop):
+            alerts.append(alert)
+            if len(alerts) == len(expected_alerts):
+                stop.set()
+        timeout.cancel()
+        writer.join()
+
+    assert alerts == expected_alerts
+
+
+@pytest.mark.parametrize("allowed_lateness_us", [None, 60_000_000])
+def test_iter_stream_alerts_matches_process_log_file(log_file, allowed_lateness_us):
+    with open(log_file, "rb") as source:
+        assert list(iter_stream_alerts(source, allowed_lateness_us)) == process_log_file(log_file)
+
+
+def test_cli_reads_stdin(log_file, capsysbinary, monkeypatch):
+    with open(log_file, "rb") as source:
+        monkeypatch.setattr(sys, "stdin", types.SimpleNamespace(buffer=io.BytesIO(source.read())))
+    monkeypatch.setattr(sys, "argv", ["dummy_cli_script_name", "-"])
+    main()
+
+    lines = capsysbinary.readouterr().out.splitlines()
+    alert_lines = [line for line in lines if line.startswith(b"{")]
+    assert [json.loads(line) for line in alert_lines] == process_log_file(log_file)
@@ -0,0 +1,150 @@
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from my_mission_control.alerter.log_file_processor_v2 import process_log_file
+from my_mission_control.api.app import create_app
+from my_mission_control.api.ingestion_executor import IngestionExecutor
+from my_mission_control.config.settings import ApiCfg
+from tests.utils.log_helper import make_log_line
+
+
+@pytest.fixture
+def log_file():
+    base_time = datetime(2018, 1, 1, 23, 0, 0)
+    lines = []
+    for i in range(2000):
+        ts = base_time + timedelta(seconds=i * 7)
+        if i % 2:
+            lines.append(make_log_line(ts, 1000 + i % 3, 17, 15, 9, 8, 7.5 if i % 5 else 8.5, "BATT"))
+        else:
+            lines.append(make_log_line(ts, 1000 + i % 4, 101, 98, 25, 20, 101.5 if i % 7 else 99.0, "TSTAT"))
+    lines.append("20180101 23:01:09.521|1000|17|15|9|8|7.8")  # malformed
+
+    with tempfile.NamedTemporaryFile(mode="w+", delete=False) as tmp:
+        tmp.write("\n".join(lines))
+        path = tmp.name
+    yield path
+    os.remove(path)  # cleanup
+
+
+@pytest.fixture
+def client():
+    with TestClient(create_app()) as test_client:
+        yield test_client
+
+
+def read_log_file(log_file: str) -> bytes:
+    with open(log_file, "rb") as f:
+        return f.read()
+
+
+def ndjson_alerts(response) -> list:
+    assert response.headers["content-type"] == "application/x-ndjson"
+    return [json.loads(line) for line in response.content.splitlines()]
+
+
+def test_upload_log_lines(client, log_file):
+    response = client.post("/missions/apollo/telemetry", content=read_log_file(log_file), headers={"Content-Type": "text/plain"})
+
+    assert response.status_code == 200
+    expected_alerts = process_log_file(log_file)
+    assert len(expected_alerts) > 0
+    assert ndjson_alerts(response) == expected_alerts
+    assert response.headers["X-Telemetry-Lines"] == "2001"
+    assert response.headers["X-Telemetry-Malformed-Lines"] == "1"
+
+
+def test_chunked_upload_split_mid_line(client, log_file):
+    data = read_log_file(log_file)
+
+    def chunks():
+        for start in range(0, len(data), 1000):
+            yield data[start : start + 1000]
+
+    response = client.post("/missions/apollo/telemetry", content=chunks())
+
+    assert response.status_code == 200
+    assert ndjson_alerts(response) == process_log_file(log_file)
+
+
+def test_multipart_upload_of_several_files(client, log_file):
+    data = read_log_file(log_file)
+    split = data.index(b"\n", len(data) // 2)
+    files = [("files", ("station1.log", data[:split], "text/plain")), ("files", ("station2.log", data[split + 1 :], "text/plain"))]
+
+    response = client.post("/missions/apollo/telemetry", files=files)
+
+    assert response.status_code == 200
+    assert ndjson_alerts(response) == process_log_file(log_file)
+
+
+def test_mission_tracker_state_spans_uploads(client, log_file):
+    data = read_log_file(log_file)
+    split = data.index(b"\n", len(data) // 3)
+
+    first = client.post("/missions/apollo/telemetry", content=data[: split + 1])
+    # Another mission does not see the first upload
+    other = client.post("/missions/gemini/telemetry", content=data[split + 1 :])
+    second = client.post("/missions/apollo/telemetry", content=data[split + 1 :])
+
+    assert ndjson_alerts(first) + ndjson_alerts(second) == process_log_file(log_file)
+    assert ndjson_alerts(other) != ndjson_alerts(second)
+
+
+def test_upload_with_line_too_long(client):
+    response = client.post("/missions/apollo/telemetry", content=b"x" * (ApiCfg.API_MAX_LINE_BYTES * 2))
+
+    assert response.status_code == 413
+
+
+def test_upload_with_complete_line_too_long(client):
+    response = client.post("/missions/apollo/telemetry", content=b"x" * (ApiCfg.API_MAX_LINE_BYTES + 1) + b"\n")
+
+    assert response.status_code == 413
+
+
+def test_upload_too_large(client, log_file, monkeypatch):
+    monkeypatch.setattr(ApiCfg, "API_MAX_UPLOAD_BYTES", 1000)
+
+    response = client.post("/missions/apollo/telemetry", content=read_log_file(log_file))
+
+    assert response.status_code == 413
+
+
+def test_multipart_upload_without_closing_boundary(client):
+    response = client.post(
+        "/missions/apollo/telemetry",
+        content=b'--b\r\nContent-Disposition: form-data; name="files"; filename="a.log"\r\n\r\n20180101 23:01:09.521|1000|17|15|9|8|7.8|BATT',
+        headers={"Content-Type": "multipart/form-data; boundary=b"},
+    )
+
+    assert response.status_code == 400
+
+
+def test_multipart_upload_without_boundary(client):
+    response = client.post("/missions/apollo/telemetry", content=b"", headers={"Content-Type": "multipart/form-data"})
+
+    assert response.status_code == 400
+
+
+def test_upload_for_mission_past_the_cap(log_file):
+    app = create_app()
+    app.state.ingestion_executor = IngestionExecutor(max_missions=2)
+    data = read_log_file(log_file)
+    with TestClient(app) as client:
+        assert client.post("/missions/apollo/telemetry", content=data).status_code == 200
+        assert client.post("/missions/gemini/telemetry", content=data).status_code == 200
+
+        assert client.post("/missions/mercury/telemetry", content=data).status_code == 429
+        assert client.post("/missions/apollo/telemetry", content=data).status_code == 200
+
+
+def test_invalid_mission_id(client):
+    response = client.post("/missions/not%20a%20mission/telemetry", content=b"")
+
+    assert response.status_code == 422
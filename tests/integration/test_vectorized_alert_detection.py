@@ -0,0 +1,40 @@
+import os
+import random
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+
+from my_mission_control.alerter.log_file_processor_v2 import process_log_file
+from tests.utils.log_helper import make_log_line
+
+
+def write_random_log_file(seed: int, line_count: int) -> str:
+    rng = random.Random(seed)
+    ts = datetime(2018, 1, 1, 23, 0, 0)
+    lines = []
+    for _ in range(line_count):
+        ts += timedelta(milliseconds=rng.randint(0, 20_000))
+        sat_id = rng.randint(1000, 1009)
+        if rng.random() < 0.5:
+            lines.append(make_log_line(ts, sat_id, 17, 15, 9, 8, round(rng.uniform(7.0, 9.0), 1), "BATT"))
+        else:
+            lines.append(make_log_line(ts, sat_id, 101, 98, 25, 20, round(rng.uniform(99.0, 103.0), 1), "TSTAT"))
+        if rng.random() < 0.01:
+            lines.append("20180101 23:01:09.521|1000|17|15|9|8|7.8")  # malformed
+
+    with tempfile.NamedTemporaryFile(mode="w+", delete=False) as tmp:
+        tmp.write("\n".join(lines))
+        return tmp.name
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_vectorized_matches_process_log_file(seed):
+    path = write_random_log_file(seed, 5000)
+    try:
+        expected_alerts = process_log_file(path)
+        assert len(expected_alerts) > 0
+        assert process_log_file(path, vectorized=True) == expected_alerts
+        assert process_log_file(path, batch_size=333, vectorized=True) == expected_alerts
+    finally:
+        os.remove(path)  # cleanup
@@ -0,0 +1,120 @@
+import asyncio
+import json
+
+import pytest
+
+from my_mission_control.api.alert_broadcaster import AlertBroadcaster, AlertSubscription
+from my_mission_control.entity.alert import Alert
+
+EPOCH_US = 1_514_847_669_521_000
+
+
+def make_alerts(count: int, satellite_id: int = 1000):
+    return [Alert(satellite_id=satellite_id, severity="RED LOW", component="BATT", timestamp=EPOCH_US + i) for i in range(count)]
+
+
+async def drain(subscription: AlertSubscription):
+    messages = []
+    while batch := await subscription.get_batch():
+        messages.extend(map(json.loads, batch))
+    return messages
+
+
+def test_publish_fans_out_to_mission_subscribers():
+    async def scenario():
+        broadcaster = AlertBroadcaster(queue_size=10)
+        first, second = broadcaster.subscribe("apollo"), broadcaster.subscribe("apollo")
+        other = broadcaster.subscribe("gemini")
+
+        assert broadcaster.publish("apollo", make_alerts(3)) == 2
+        for subscription in (first, second, other):
+            broadcaster.unsubscribe(subscription)
+        return await drain(first), await drain(second), await drain(other)
+
+    first, second, other = asyncio.run(scenario())
+
+    assert first == second == [alert.to_dict() for alert in make_alerts(3)]
+    assert other == []
+
+
+def test_publish_without_subscribers():
+    broadcaster = AlertBroadcaster()
+
+    assert broadcaster.publish("apollo", make_alerts(3)) == 0
+
+
+def test_slow_subscriber_is_dropped_without_affecting_others():
+    async def scenario():
+        broadcaster = AlertBroadcaster(queue_size=4)
+        slow, fast = broadcaster.subscribe("apollo"), broadcaster.subscribe("apollo")
+        delivered = []
+        for alerts in (make_alerts(3), make_alerts(2, 1001), make_alerts(2, 1002)):
+            broadcaster.publish("apollo", alerts)
+            # Only the fast subscriber keeps up
+            delivered.extend(map(json.loads, await fast.get_batch()))
+        return broadcaster, slow, fast, delivered
+
+    broadcaster, slow, fast, delivered = asyncio.run(scenario())
+
+    assert slow.dropped and not fast.dropped
+    assert len(slow) == 0  # pending alerts discarded
+    assert len(delivered) == 7
+    assert broadcaster.dropped_subscriber_count == 1
+    assert broadcaster.subscriber_count("apollo") == 1
+
+
+def test_dropped_subscription_ends_right_away():
+    async def scenario():
+        broadcaster = AlertBroadcaster(queue_size=2)
+        subscription = broadcaster.subscribe("apollo")
+        broadcaster.publish("apollo", make_alerts(2))
+        broadcaster.publish("apollo", make_alerts(1))
+        return await asyncio.wait_for(subscription.get_batch(), 1)
+
+    assert asyncio.run(scenario()) == []
+
+
+@pytest.mark.parametrize("discard_pending", [False, True])
+def test_close_wakes_waiting_subscriber(discard_pending):
+    async def scenario():
+        subscription = AlertSubscription("apollo", queue_size=4)
+        subscription.offer([b"1\n", b"2\n"])
+        first = await subscription.get_batch()
+        waiting = asyncio.create_task(subscription.get_batch())
+        await asyncio.sleep(0)
+        subscription.close(discard_pending)
+        return first, await asyncio.wait_for(waiting, 1), await subscription.get_batch()
+
+    assert asyncio.run(scenario()) == ([b"1\n", b"2\n"], [], [])
+
+
+def test_close_keeps_pending_alerts_unless_discarded():
+    async def scenario(discard_pending):
+        subscription = AlertSubscription("apollo", queue_size=4)
+        subscription.offer([b"1\n"])
+        subscription.close(discard_pending)
+        return await subscription.get_batch(), await subscription.get_batch()
+
+    assert asyncio.run(scenario(False)) == ([b"1\n"], [])
+    assert asyncio.run(scenario(True)) == ([], [])
+
+
+def test_cancelled_get_batch_loses_no_alert():
+    async def scenario():
+        subscription = AlertSubscription("apollo", queue_size=4)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(subscription.get_batch(), 0.01)
+        subscription.offer([b"1\n"])
+        return await subscription.get_batch()
+
+    assert asyncio.run(scenario()) == [b"1\n"]
+
+
+def test_unsubscribe_twice():
+    broadcaster = AlertBroadcaster()
+    subscription = broadcaster.subscribe("apollo")
+
+    broadcaster.unsubscribe(subscription)
+    broadcaster.unsubscribe(subscription)
+
+    assert broadcaster.subscriber_count() == 0
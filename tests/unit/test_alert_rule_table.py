@@ -0,0 +1,177 @@
+import os
+import random
+import tempfile
+from typing import List
+
+import numpy as np
+import pytest
+
+from my_mission_control.alerter.alert_rule_table import ComparisonAlertStrategy, compile_alert_rules, load_alert_rules
+from my_mission_control.alerter.alert_strategy import NO_SEVERITY, RedHighAlertStrategy, RedLowAlertStrategy, SeverityBandAlertStrategy
+from my_mission_control.alerter.alert_tracker import AlertTracker
+from my_mission_control.alerter.batch_alert_detector import BatchAlertDetector
+from my_mission_control.alerter.log_batch_parser import parse_log_lines_batch
+from my_mission_control.alerter.log_line_parser import parse_log_line_us
+from my_mission_control.config.settings import AlertOutputCfg
+from my_mission_control.entity.log_entry import LogEntry
+
+BATT_RULE = {"component": "BATT", "limit": "red_low_limit", "comparison": "<", "severity": "RED LOW", "threshold": 3, "window_minutes": 5}
+TSTAT_RULE = {"component": "TSTAT", "limit": "red_high_limit", "comparison": ">", "severity": "RED HIGH", "threshold": 3, "window_minutes": 5}
+
+RULE_TABLE = """
+[[rules]]
+component = "BATT"
+limit = "red_low_limit"
+comparison = "<"
+severity = "RED LOW"
+threshold = 2
+window_minutes = 1
+
+[[rules]]
+component = "PWR"
+limit = "yellow_high_limit"
+comparison = ">="
+severity = "YELLOW HIGH"
+threshold = 4
+window_minutes = 0.5
+"""
+
+
+def make_log_lines(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    lines = []
+    for i in range(count):
+        ts = f"20180101 23:{i // 60 % 60:02d}:{i % 60:02d}.{rng.randrange(1000):03d}"
+        sat_id = 1000 + rng.randrange(3)
+        component = rng.choice(["BATT", "TSTAT", "PWR"])
+        lines.append(f"{ts}|{sat_id}|101|98|25|20|{rng.choice([10, 21, 97.5, 98, 99, 101.5])}|{component}")
+    return lines
+
+
+def parse_log_entries(lines) -> List[LogEntry[int]]:
+    log_entries = [parse_log_line_us(line) for line in lines]
+    assert None not in log_entries
+    return [log_entry for log_entry in log_entries if log_entry is not None]
+
+
+def test_compiled_rules_match_builtin_strategies():
+    alert_eval_strategy_map = compile_alert_rules([BATT_RULE, TSTAT_RULE])
+    builtin = {"BATT": RedLowAlertStrategy(), "TSTAT": RedHighAlertStrategy()}
+    for log_entry in parse_log_entries(make_log_lines(200)):
+        if log_entry.component in builtin:
+            assert alert_eval_strategy_map[log_entry.component].evaluate(log_entry) == builtin[log_entry.component].evaluate(log_entry)
+    assert alert_eval_strategy_map["BATT"].required_fields == RedLowAlertStrategy.required_fields
+    assert alert_eval_strategy_map["BATT"].window_us == 5 * 60_000_000
+
+
+@pytest.mark.parametrize("comparison", ["<", "<=", ">", ">="])
+def test_evaluate_batch_matches_evaluate(comparison):
+    strategy = ComparisonAlertStrategy("yellow_high_limit", comparison, "YELLOW", 3, 60_000_000)
+    columns = parse_log_lines_batch(make_log_lines(200))
+    codes, severities = strategy.evaluate_batch(columns, np.arange(len(columns)))
+    expected = [strategy.evaluate(log_entry) for log_entry in columns.log_entries()]
+    assert [severities[code] if code != NO_SEVERITY else None for code in codes.tolist()] == expected
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        {key: value for key, value in BATT_RULE.items() if key != "threshold"},
+        {**BATT_RULE, "unknown": 1},
+        {**BATT_RULE, "limit": "raw_value"},
+        {**BATT_RULE, "comparison": "=="},
+        {**BATT_RULE, "severity": ""},
+        {**BATT_RULE, "threshold": 0},
+        {**BATT_RULE, "threshold": True},
+        {**BATT_RULE, "window_minutes": -1},
+        {**BATT_RULE, "window_minutes": float("inf")},
+        {**BATT_RULE, "window_minutes": float("nan")},
+        {**BATT_RULE, "window_minutes": 1e-12},
+    ],
+)
+def test_invalid_rule_is_rejected(rule):
+    with pytest.raises(ValueError):
+        compile_alert_rules([rule])
+
+
+def test_duplicate_component_is_rejected():
+    with pytest.raises(ValueError, match="Duplicate"):
+        compile_alert_rules([BATT_RULE, {**BATT_RULE, "severity": "LOW"}])
+
+
+def test_load_alert_rules():
+    with tempfile.NamedTemporaryFile("w", suffix=".toml", delete=False) as rule_table:
+        rule_table.write(RULE_TABLE)
+        path = rule_table.name
+
+    alert_eval_strategy_map = load_alert_rules(path)
+    assert list(alert_eval_strategy_map) == ["BATT", "PWR"]
+    assert (alert_eval_strategy_map["PWR"].threshold, alert_eval_strategy_map["PWR"].window_us) == (4, 30_000_000)
+
+    with open(path, "w") as rule_table:
+        rule_table.write("rules = 1\n")
+    with pytest.raises(ValueError):
+        load_alert_rules(path)
+    os.remove(path)  # cleanup
+
+
+def test_per_component_windows_and_thresholds():
+    alert_eval_strategy_map = compile_alert_rules(
+        [
+            {**BATT_RULE, "threshold": 2, "window_minutes": 1},
+            {**TSTAT_RULE, "threshold": 3, "window_minutes": 10},
+        ]
+    )
+    alert_tracker = AlertTracker(alert_eval_strategy_map)
+    lines = [
+        "20180101 23:00:00.000|1000|17|15|9|8|7.0|BATT",
+        "20180101 23:01:30.000|1000|17|15|9|8|7.0|BATT",  # 90 seconds later, outside the BATT window
+        "20180101 23:01:50.000|1000|17|15|9|8|7.0|BATT",
+        "20180101 23:00:00.000|1001|101|98|25|20|102|TSTAT",
+        "20180101 23:06:00.000|1001|101|98|25|20|102|TSTAT",
+        "20180101 23:09:00.000|1001|101|98|25|20|102|TSTAT",  # within the 10 minute TSTAT window
+    ]
+    alerts = [alert for alert in map(alert_tracker.process_log_entry, parse_log_entries(lines)) if alert]
+    assert [(alert.severity, alert.component) for alert in alerts] == [(AlertOutputCfg.SEVERITY_RED_LOW, "BATT"), (AlertOutputCfg.SEVERITY_RED_HIGH, "TSTAT")]
+    assert alert_tracker.idle_window_us == 10 * 60_000_000
+
+
+def test_batch_detector_matches_tracker_with_mixed_rules():
+    alert_eval_strategy_map = compile_alert_rules(
+        [
+            {**BATT_RULE, "threshold": 2, "window_minutes": 1},
+            {**TSTAT_RULE, "threshold": 4, "window_minutes": 3},
+            {"component": "PWR", "limit": "red_low_limit", "comparison": "<=", "severity": "LOW", "threshold": 3, "window_minutes": 2},
+        ]
+    )
+    lines = make_log_lines(3000, seed=1)
+    alert_tracker = AlertTracker(alert_eval_strategy_map)
+    expected_alerts = [alert for alert in map(alert_tracker.process_log_entry, parse_log_entries(lines)) if alert]
+
+    detector = BatchAlertDetector(alert_eval_strategy_map)
+    detector.add_columns(parse_log_lines_batch(lines))
+
+    assert len({alert.component for alert in expected_alerts}) == 3
+    assert detector.detect() == expected_alerts
+    assert AlertTracker(alert_eval_strategy_map).process_log_columns(parse_log_lines_batch(lines)) == expected_alerts
+
+
+def test_band_rule_alerts_every_severity_in_one_pass():
+    alert_eval_strategy_map = compile_alert_rules([{"component": "TSTAT", "bands": True, "threshold": 2, "window_minutes": 1}, BATT_RULE])
+    assert isinstance(alert_eval_strategy_map["TSTAT"], SeverityBandAlertStrategy)
+    assert alert_eval_strategy_map["TSTAT"].window_us == 60_000_000
+
+    lines = make_log_lines(3000, seed=2)
+    alert_tracker = AlertTracker(alert_eval_strategy_map)
+    expected_alerts = [alert for alert in map(alert_tracker.process_log_entry, parse_log_entries(lines)) if alert]
+    assert {alert.severity for alert in expected_alerts} == {
+        AlertOutputCfg.SEVERITY_RED_LOW,
+        AlertOutputCfg.SEVERITY_YELLOW_LOW,
+        AlertOutputCfg.SEVERITY_YELLOW_HIGH,
+        AlertOutputCfg.SEVERITY_RED_HIGH,
+    }
+
+    detector = BatchAlertDetector(alert_eval_strategy_map)
+    detector.add_columns(parse_log_lines_batch(lines))
+    assert detector.detect() == expected_alerts
+    assert AlertTracker(alert_eval_strategy_map).process_log_columns(parse_log_lines_batch(lines)) == expected_alerts
@@ -0,0 +1,76 @@
+import json
+from dataclasses import asdict
+from datetime import datetime
+from io import BytesIO
+
+import pytest
+
+from my_mission_control.config.settings import AlertOutputCfg
+from my_mission_control.entity.alert import Alert, AlertSerializer
+from my_mission_control.utils.alert_writer import write_alerts_json, write_alerts_ndjson
+from my_mission_control.utils.epoch_time import datetime_to_epoch_us
+from my_mission_control.utils.utility import snake_to_camel
+
+TIMESTAMPS = [
+    datetime(2018, 1, 1, 23, 1, 9, 521000),
+    datetime(2018, 1, 1, 23, 59, 59, 999999),
+    datetime(2018, 1, 2, 0, 0, 0),
+    datetime(2024, 2, 29, 12, 30, 45, 1),
+    datetime(1969, 12, 31, 23, 59, 59, 500000),
+]
+
+
+def reference_dict(alert: Alert, timestamp: datetime) -> dict:
+    # Serialization as Alert.to_dict did it before the precompiled serializer
+    raw_dict = asdict(alert)
+    raw_dict["timestamp"] = timestamp.strftime(AlertOutputCfg.TIMESTAMP_FORMAT)
+    return {snake_to_camel(k): v for k, v in raw_dict.items()}
+
+
+def make_alerts():
+    alerts = []
+    for timestamp in TIMESTAMPS:
+        alerts.append((Alert(1000, "RED HIGH", "TSTAT", timestamp), timestamp))
+        alerts.append((Alert(-7, 'RED "LOW"', "BATTé", datetime_to_epoch_us(timestamp)), timestamp))
+    return alerts
+
+
+@pytest.mark.parametrize("alert, timestamp", make_alerts())
+def test_serializer_matches_reference(alert, timestamp):
+    expected = reference_dict(alert, timestamp)
+
+    assert alert.to_dict() == expected
+    assert list(alert.to_dict()) == ["satelliteId", "severity", "component", "timestamp"]
+    assert alert.to_json() == json.dumps(expected)
+
+
+def test_custom_timestamp_format_uses_strftime():
+    serializer = AlertSerializer('%Y/%m/%d "%H"')
+    timestamp = TIMESTAMPS[0]
+
+    assert serializer.to_dict(Alert(1, "RED HIGH", "TSTAT", timestamp))["timestamp"] == '2018/01/01 "23"'
+    assert json.loads(serializer.to_ndjson_bytes(Alert(1, "RED HIGH", "TSTAT", datetime_to_epoch_us(timestamp))))["timestamp"] == '2018/01/01 "23"'
+
+
+@pytest.mark.parametrize("as_dict", [False, True])
+def test_json_writer_matches_json_dumps(as_dict):
+    alerts = [alert for alert, _ in make_alerts()]
+    expected = (json.dumps([alert.to_dict() for alert in alerts], indent=4) + "\n").encode()
+
+    stream = BytesIO()
+    assert write_alerts_json((alert.to_dict() if as_dict else alert for alert in alerts), stream) == len(alerts)
+    assert stream.getvalue() == expected
+
+    stream = BytesIO()
+    write_alerts_json([], stream)
+    assert stream.getvalue() == (json.dumps([], indent=4) + "\n").encode()
+
+
+def test_ndjson_writer_emits_alert_objects():
+    alerts = [alert for alert, _ in make_alerts()]
+    stream = BytesIO()
+
+    write_alerts_ndjson(alerts, stream)
+    lines = stream.getvalue().splitlines()
+    assert [json.loads(line) for line in lines] == [alert.to_dict() for alert in alerts]
+    assert lines[0] == b'{"satelliteId":1000,"severity":"RED HIGH","component":"TSTAT","timestamp":"2018-01-01T23:01:09.521000Z"}'
@@ -1,8 +1,11 @@
 from datetime import datetime
+from typing import Optional
 
+import numpy as np
 import pytest
 
-from my_mission_control.alerter.alert_strategy import RedHighAlertStrategy, RedLowAlertStrategy
+from my_mission_control.alerter.alert_strategy import NO_SEVERITY, AlertEvalStrategy, RedHighAlertStrategy, RedLowAlertStrategy, SeverityBandAlertStrategy, evaluate_log_columns
+from my_mission_control.alerter.log_batch_parser import parse_log_lines_batch
 from my_mission_control.config.settings import AlertOutputCfg
 from my_mission_control.entity.log_entry import LogEntry
 
@@ -34,3 +37,61 @@ def test_red_high_alert_not_triggered(base_log_entry):
     strategy = RedHighAlertStrategy()
     base_log_entry.raw_value = base_log_entry.red_high_limit - 1  # Below red_high_limit
     assert strategy.evaluate(base_log_entry) is None
+
+
+BATCH_LINES = [
+    "20180101 23:01:05.001|1001|101|98|25|20|99.9|TSTAT",
+    "20180101 23:01:05.002|1001|101|98|25|20|101.1|TSTAT",
+    "20180101 23:01:09.521|1000|17|15|9|8|7.8|BATT",
+    "20180101 23:01:09.522|1000|17|15|9|8|8|BATT",
+    "20180101 23:01:09.523|1000|17|15|9|8|8.5|BATT",
+    "20180101 23:01:09.524|1000|17|15|9|8|1|PWR",
+    "20180101 23:01:09.525|1001|101|98|25|20|98.5|TSTAT",
+    "20180101 23:01:09.526|1001|101|98|25|20|22|TSTAT",
+    "20180101 23:01:09.527|1001|101|98|25|20|19|TSTAT",
+]
+
+
+class OddSatelliteAlertStrategy(AlertEvalStrategy):
+    """
+    Strategy without a batch implementation, alerting on odd satellite ids
+    """
+
+    def evaluate(self, log_entry: LogEntry) -> Optional[str]:
+        return "ODD" if log_entry.satellite_id % 2 else None
+
+
+@pytest.mark.parametrize("strategy", [RedLowAlertStrategy(), RedHighAlertStrategy(), SeverityBandAlertStrategy(), OddSatelliteAlertStrategy()])
+def test_evaluate_batch_matches_evaluate(strategy):
+    columns = parse_log_lines_batch(BATCH_LINES)
+    rows = np.arange(len(columns))
+    codes, severities = strategy.evaluate_batch(columns, rows)
+    expected = [strategy.evaluate(log_entry) for log_entry in columns.log_entries()]
+    assert [severities[code] if code != NO_SEVERITY else None for code in codes.tolist()] == expected
+
+
+@pytest.mark.parametrize(
+    "raw_value, severity",
+    [
+        (19, AlertOutputCfg.SEVERITY_RED_LOW),
+        (20, AlertOutputCfg.SEVERITY_YELLOW_LOW),
+        (24.9, AlertOutputCfg.SEVERITY_YELLOW_LOW),
+        (25, None),
+        (98, None),
+        (98.1, AlertOutputCfg.SEVERITY_YELLOW_HIGH),
+        (101, AlertOutputCfg.SEVERITY_YELLOW_HIGH),
+        (101.1, AlertOutputCfg.SEVERITY_RED_HIGH),
+    ],
+)
+def test_severity_band_ladder(base_log_entry, raw_value, severity):
+    base_log_entry.red_low_limit, base_log_entry.yellow_low_limit, base_log_entry.yellow_high_limit, base_log_entry.red_high_limit = 20, 25, 98, 101
+    base_log_entry.raw_value = raw_value
+    assert SeverityBandAlertStrategy().evaluate(base_log_entry) == severity
+
+
+def test_evaluate_log_columns_keeps_violation_rows():
+    columns = parse_log_lines_batch(BATCH_LINES)
+    rows, severity_codes, severities = evaluate_log_columns(columns, {"TSTAT": RedHighAlertStrategy(), "BATT": RedLowAlertStrategy()})
+    # PWR has no strategy and is skipped
+    assert rows.tolist() == [1, 2]
+    assert [severities[code] for code in severity_codes.tolist()] == [AlertOutputCfg.SEVERITY_RED_HIGH, AlertOutputCfg.SEVERITY_RED_LOW]
@@ -3,10 +3,12 @@ from typing import Dict, Optional
 
 import pytest
 
-from my_mission_control.alerter.alert_strategy import AlertEvalStrategy, RedHighAlertStrategy, RedLowAlertStrategy
+from my_mission_control.alerter.alert_strategy import AlertEvalStrategy, RedHighAlertStrategy, RedLowAlertStrategy, SeverityBandAlertStrategy
 from my_mission_control.alerter.alert_tracker import AlertTracker
 from my_mission_control.config.settings import AlertOutputCfg, InputLogFileCfg
+from my_mission_control.entity.alert import Alert
 from my_mission_control.entity.log_entry import LogEntry
+from my_mission_control.utils.epoch_time import datetime_to_epoch_us
 
 
 class TestAlertStrategies:
@@ -103,3 +105,89 @@ class TestAlertStrategies:
         alert.severity = MOCK_SEVERITY
         alert.component = InputLogFileCfg.LOG_LINE_COMPONENT_TSTAT
         alert.timestamp = base_time + timedelta(seconds=10)
+
+
+@pytest.mark.parametrize("epoch_us", [False, True])
+def test_alert_timestamp_follows_log_entry_timestamp_kind(epoch_us):
+    alert_tracker = AlertTracker({InputLogFileCfg.LOG_LINE_COMPONENT_BATT: RedLowAlertStrategy()})
+    base_time = datetime(2018, 1, 1, 23, 1, 5)
+
+    alert = None
+    for seconds in (0, 10, 20):
+        timestamp = base_time + timedelta(seconds=seconds)
+        ts = datetime_to_epoch_us(timestamp) if epoch_us else timestamp
+        alert = alert_tracker.process_log_entry(LogEntry(ts, 1000, 17, 15, 9, 8, 7.5, InputLogFileCfg.LOG_LINE_COMPONENT_BATT))
+
+    assert alert is not None
+    assert alert.timestamp == (datetime_to_epoch_us(base_time) if epoch_us else base_time)
+    assert alert.to_dict()["timestamp"] == "2018-01-01T23:01:05.000000Z"
+
+
+def test_state_is_one_flat_table_keyed_by_packed_satellite_and_component():
+    alert_tracker = AlertTracker({InputLogFileCfg.LOG_LINE_COMPONENT_BATT: RedLowAlertStrategy(), InputLogFileCfg.LOG_LINE_COMPONENT_TSTAT: RedHighAlertStrategy()})
+    base_time = datetime(2018, 1, 1, 23, 1, 5)
+
+    alert_tracker.process_log_entry(LogEntry(base_time, 1000, 17, 15, 9, 8, 7.5, InputLogFileCfg.LOG_LINE_COMPONENT_BATT))
+    alert_tracker.process_log_entry(LogEntry(base_time, 1000, 101, 98, 25, 20, 102.5, InputLogFileCfg.LOG_LINE_COMPONENT_TSTAT))
+    alert_tracker.process_log_entry(LogEntry(base_time, 1001, 17, 15, 9, 8, 7.5, InputLogFileCfg.LOG_LINE_COMPONENT_BATT))
+    # Nominal entries create no state
+    alert_tracker.process_log_entry(LogEntry(base_time, 1002, 17, 15, 9, 8, 9.5, InputLogFileCfg.LOG_LINE_COMPONENT_BATT))
+
+    keys = {alert_tracker.state_key(1000, "BATT", AlertOutputCfg.SEVERITY_RED_LOW), alert_tracker.state_key(1000, "TSTAT", AlertOutputCfg.SEVERITY_RED_HIGH), alert_tracker.state_key(1001, "BATT", AlertOutputCfg.SEVERITY_RED_LOW)}
+    assert len(keys) == 3
+    assert set(alert_tracker.violation_windows) == keys
+    assert alert_tracker.state_key(-1, "BATT", AlertOutputCfg.SEVERITY_RED_LOW) != alert_tracker.state_key(0, "BATT", AlertOutputCfg.SEVERITY_RED_LOW)
+
+
+def test_idle_keys_are_evicted_by_event_time():
+    alert_tracker = AlertTracker({InputLogFileCfg.LOG_LINE_COMPONENT_BATT: RedLowAlertStrategy()}, evict_idle_keys=True)
+    base_time = datetime(2018, 1, 1, 23, 1, 5)
+
+    for seconds in (0, 10, 20):
+        alert_tracker.process_log_entry(LogEntry(base_time + timedelta(seconds=seconds), 1000, 17, 15, 9, 8, 7.5, InputLogFileCfg.LOG_LINE_COMPONENT_BATT))
+    alert_tracker.process_log_entry(LogEntry(base_time + timedelta(minutes=6), 1001, 17, 15, 9, 8, 7.5, InputLogFileCfg.LOG_LINE_COMPONENT_BATT))
+    assert alert_tracker.live_key_count == 2
+    assert alert_tracker.evicted_key_count == 0
+
+    # Nominal entries move event time too, satellite 1000 goes idle, 1001 stays live
+    alert_tracker.process_log_entry(LogEntry(base_time + timedelta(minutes=11), 1002, 17, 15, 9, 8, 9.5, InputLogFileCfg.LOG_LINE_COMPONENT_BATT))
+    assert set(alert_tracker.violation_windows) == {alert_tracker.state_key(1001, "BATT", AlertOutputCfg.SEVERITY_RED_LOW)}
+    assert alert_tracker.evicted_key_count == 1
+
+    alert_tracker.process_log_entry(LogEntry(base_time + timedelta(minutes=30), 1002, 17, 15, 9, 8, 9.5, InputLogFileCfg.LOG_LINE_COMPONENT_BATT))
+    assert alert_tracker.live_key_count == 0
+    assert alert_tracker.evicted_key_count == 2
+
+
+def test_idle_key_eviction_keeps_alerts_unchanged():
+    strategies = {InputLogFileCfg.LOG_LINE_COMPONENT_BATT: RedLowAlertStrategy(), InputLogFileCfg.LOG_LINE_COMPONENT_TSTAT: RedHighAlertStrategy()}
+    alert_tracker = AlertTracker(strategies)
+    evicting_tracker = AlertTracker(strategies, evict_idle_keys=True)
+    base_time = datetime(2018, 1, 1, 23, 1, 5)
+
+    ts = datetime_to_epoch_us(base_time)
+    expected_alerts, alerts = [], []
+    for i in range(3000):
+        # Bursts of violations separated by quiet periods longer than the window, over a changing set of satellites
+        ts += 400_000_000 if i % 50 == 0 else (i * 7919 % 90) * 1_000_000
+        satellite_id = 1000 + (i // 200) * 3 + i % 3
+        raw_value = 7.5 if i * 31 % 7 < 4 else 8.5
+        log_entry = LogEntry(ts, satellite_id, 17, 15, 9, 8, raw_value, InputLogFileCfg.LOG_LINE_COMPONENT_BATT)
+        expected_alerts.append(alert_tracker.process_log_entry(log_entry))
+        alerts.append(evicting_tracker.process_log_entry(log_entry))
+
+    assert alerts == expected_alerts
+    assert any(expected_alerts)
+    assert evicting_tracker.evicted_key_count > 0
+    assert evicting_tracker.live_key_count < alert_tracker.live_key_count
+
+
+def test_severity_bands_have_separate_windows():
+    alert_tracker = AlertTracker({InputLogFileCfg.LOG_LINE_COMPONENT_TSTAT: SeverityBandAlertStrategy()})
+    base_time = datetime(2018, 1, 1, 23, 1, 5)
+
+    # Two yellow and one red excursion do not add up to an alert, a third yellow one does
+    alerts = [alert_tracker.process_log_entry(LogEntry(base_time + timedelta(seconds=seconds), 1000, 101, 98, 25, 20, raw_value, InputLogFileCfg.LOG_LINE_COMPONENT_TSTAT)) for seconds, raw_value in ((0, 99.0), (10, 102.0), (20, 99.5), (30, 50.0), (40, 100.0))]
+    assert alerts[:4] == [None] * 4
+    assert alerts[4] == Alert(1000, AlertOutputCfg.SEVERITY_YELLOW_HIGH, InputLogFileCfg.LOG_LINE_COMPONENT_TSTAT, base_time)
+    assert alert_tracker.live_key_count == 2
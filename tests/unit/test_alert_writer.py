@@ -0,0 +1,43 @@
+import json
+from datetime import datetime
+from io import BytesIO
+
+from my_mission_control.entity.alert import Alert
+from my_mission_control.utils.alert_writer import write_alerts_json, write_alerts_ndjson
+
+ALERTS = [
+    {"satelliteId": 1000, "severity": "RED LOW", "component": "BATT", "timestamp": "2018-01-01T23:01:09.521000Z"},
+    {"satelliteId": 1001, "severity": "RED HIGH", "component": "TSTAT", "timestamp": "2018-01-01T23:01:38.001000Z"},
+]
+
+
+def test_write_alerts_ndjson_writes_one_alert_per_line():
+    stream = BytesIO()
+
+    assert write_alerts_ndjson(iter(ALERTS), stream) == 2
+    lines = stream.getvalue().split(b"\n")
+    assert lines[-1] == b""
+    assert [json.loads(line) for line in lines[:-1]] == ALERTS
+    assert b" " not in lines[0].replace(b"RED LOW", b"")
+
+
+def test_write_alerts_ndjson_empty():
+    stream = BytesIO()
+
+    assert write_alerts_ndjson([], stream) == 0
+    assert stream.getvalue() == b""
+
+
+class StationAlert(Alert):
+    pass
+
+
+def test_alert_subclasses_are_serialized_as_alerts():
+    alert = StationAlert(satellite_id=1000, severity="RED LOW", component="BATT", timestamp=datetime(2018, 1, 1, 23, 1, 9, 521000))
+    ndjson_stream, json_stream = BytesIO(), BytesIO()
+
+    write_alerts_ndjson([alert], ndjson_stream)
+    write_alerts_json([alert], json_stream)
+
+    assert json.loads(ndjson_stream.getvalue()) == ALERTS[0]
+    assert json.loads(json_stream.getvalue()) == [ALERTS[0]]
@@ -0,0 +1,100 @@
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+import numpy as np
+import pytest
+
+from my_mission_control.alerter.alert_strategy import AlertEvalStrategy, RedLowAlertStrategy
+from my_mission_control.alerter.alert_tracker import AlertTracker
+from my_mission_control.alerter.batch_alert_detector import detect_alerts, replay_violation_window
+from my_mission_control.config.settings import AlertRuleCfg
+from my_mission_control.entity.alert import Alert
+from my_mission_control.utils.epoch_time import datetime_to_epoch_us
+from tests.utils.log_helper import make_log_entry
+
+THRESHOLD = AlertRuleCfg.ALERT_VIOLATION_COUNT_THRESHOLD
+WINDOW_US = AlertRuleCfg.ALERT_VIOLATION_TIME_WINDOW_MINUTES * 60_000_000
+BASE_TIME = datetime(2018, 1, 1, 23, 0, 0)
+
+
+def streaming_alerts(violations) -> List[Alert]:
+    """
+    Feeds (satellite, component, timestamp) violations to an AlertTracker.
+    """
+    alert_eval_strategy_map: Dict[str, AlertEvalStrategy] = {"BATT": RedLowAlertStrategy(), "PWR": RedLowAlertStrategy()}
+    alert_tracker = AlertTracker(alert_eval_strategy_map)
+    alerts = []
+    for sat_id, component, ts in violations:
+        alert = alert_tracker.process_log_entry(make_log_entry(ts, sat_id, 17, 15, 9, 8, 7.5, component))
+        if alert:
+            alerts.append(alert)
+    return alerts
+
+
+def vectorized_alerts(violations) -> List[Alert]:
+    component_codes = {"BATT": 0, "PWR": 1}
+    satellite_id = np.array([sat_id for sat_id, _, _ in violations], dtype=np.int64)
+    component_code = np.array([component_codes[component] for _, component, _ in violations], dtype=np.int32)
+    timestamp_us = np.array([datetime_to_epoch_us(ts) for _, _, ts in violations], dtype=np.int64)
+
+    positions, first_ts = detect_alerts(satellite_id, component_code, timestamp_us, THRESHOLD, WINDOW_US)
+
+    return [Alert(violations[position][0], "RED LOW", violations[position][1], ts) for position, ts in zip(positions.tolist(), first_ts.astype("datetime64[us]").tolist())]
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_matches_streaming_tracker_in_order(seed):
+    rng = random.Random(seed)
+    violations = []
+    ts = BASE_TIME
+    for _ in range(2000):
+        ts += timedelta(seconds=rng.choice([0, 1, 10, 45, 90, 200]))
+        violations.append((rng.randint(1000, 1004), rng.choice(["BATT", "PWR"]), ts))
+
+    expected_alerts = streaming_alerts(violations)
+
+    assert len(expected_alerts) > 0
+    assert vectorized_alerts(violations) == expected_alerts
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_streaming_tracker_out_of_order(seed):
+    rng = random.Random(seed)
+    violations = []
+    for _ in range(1000):
+        ts = BASE_TIME + timedelta(seconds=rng.randint(0, 3600))
+        violations.append((rng.randint(1000, 1002), rng.choice(["BATT", "PWR"]), ts))
+
+    assert vectorized_alerts(violations) == streaming_alerts(violations)
+
+
+def test_no_violations():
+    positions, first_ts = detect_alerts(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int64), THRESHOLD, WINDOW_US)
+    assert positions.size == 0
+    assert first_ts.size == 0
+
+
+def test_replay_violation_window_rearms_after_window():
+    minute = 60_000_000
+    timestamps = [0, minute, 2 * minute, 3 * minute, 7 * minute, 8 * minute, 9 * minute]
+    assert replay_violation_window(timestamps, 3, 5 * minute) == [(2, 0), (5, 3 * minute)]
+
+
+def test_long_timestamp_span_matches_replay():
+    rng = random.Random(0)
+    minute = 60_000_000
+    satellite_id = np.array([rng.randrange(32) for _ in range(3000)], dtype=np.int64)
+    timestamp_us = np.sort(np.array([rng.randrange(2**58) for _ in range(3000)], dtype=np.int64))
+    timestamp_us[1000:1010] = timestamp_us[1000]  # a burst within one window
+    satellite_id[1000:1010] = 7
+
+    expected = []
+    for sat_id in range(32):
+        group_rows = np.flatnonzero(satellite_id == sat_id)
+        expected.extend((group_rows[position], first_ts) for position, first_ts in replay_violation_window(timestamp_us[group_rows].tolist(), THRESHOLD, 5 * minute))
+
+    positions, first_ts = detect_alerts(satellite_id, np.zeros(3000, dtype=np.int32), timestamp_us, THRESHOLD, 5 * minute)
+
+    assert len(expected) > 0
+    assert list(zip(positions.tolist(), first_ts.tolist())) == sorted(expected)
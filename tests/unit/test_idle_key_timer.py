@@ -0,0 +1,34 @@
+import pytest
+
+from my_mission_control.alerter.idle_key_timer import IdleKeyTimerWheel
+
+
+def test_keys_expire_after_their_slot_ends():
+    wheel = IdleKeyTimerWheel(slot_us=10)
+    wheel.schedule(1, 5)
+    wheel.schedule(2, 25)
+    assert wheel.next_due_us == 10
+
+    assert list(wheel.expire(9)) == []
+    assert list(wheel.expire(10)) == [1]
+    assert wheel.next_due_us == 30
+    assert list(wheel.expire(29)) == []
+    assert list(wheel.expire(1000)) == [2]
+    assert len(wheel) == 0
+
+
+def test_rescheduling_within_a_slot_adds_no_entry():
+    wheel = IdleKeyTimerWheel(slot_us=10)
+    wheel.schedule(1, 11)
+    wheel.schedule(1, 15, previous_deadline_us=11)
+    assert len(wheel) == 1
+
+    # Moving to a later slot leaves a stale entry behind, for the caller to skip
+    wheel.schedule(1, 25, previous_deadline_us=15)
+    assert len(wheel) == 2
+    assert list(wheel.expire(1000)) == [1, 1]
+
+
+def test_slot_width_must_be_positive():
+    with pytest.raises(ValueError):
+        IdleKeyTimerWheel(slot_us=0)
@@ -0,0 +1,132 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from my_mission_control.alerter.log_file_processor_v2 import _iter_log_lines_alerts
+from my_mission_control.alerter.log_line_parser import parse_log_line_bytes
+from my_mission_control.api.ingestion_executor import IngestionExecutor
+from my_mission_control.api.telemetry_ingestion import TooManyMissionsError
+from tests.utils.log_helper import make_log_line
+
+EXECUTORS = [(0, "thread"), (1, "thread"), (3, "thread"), (2, "process")]
+
+
+def make_lines(count: int = 400):
+    base_time = datetime(2018, 1, 1, 23, 0, 0)
+    lines = []
+    for i in range(count):
+        ts = base_time + timedelta(seconds=i * 7)
+        if i % 2:
+            lines.append(make_log_line(ts, 1000 + i % 3, 17, 15, 9, 8, 7.5 if i % 5 else 8.5, "BATT"))
+        else:
+            lines.append(make_log_line(ts, 1000 + i % 4, 101, 98, 25, 20, 101.5 if i % 7 else 99.0, "TSTAT"))
+    return [line.encode() for line in lines]
+
+
+def expected_alerts(lines):
+    return list(_iter_log_lines_alerts(lines, parse_log_line_bytes))
+
+
+def run_with_executor(executor: IngestionExecutor, scenario):
+    try:
+        return asyncio.run(scenario(executor))
+    finally:
+        executor.close()
+
+
+@pytest.mark.parametrize("workers, kind", EXECUTORS)
+def test_chunks_match_sequential_run(workers, kind):
+    lines = make_lines()
+
+    async def scenario(executor):
+        alerts = []
+        for start in range(0, len(lines), 37):
+            chunk_alerts, malformed_line_count = await executor.process("apollo", lines[start : start + 37])
+            assert malformed_line_count == 0
+            alerts.extend(chunk_alerts)
+        return alerts
+
+    alerts = run_with_executor(IngestionExecutor(workers, kind), scenario)
+
+    assert len(alerts) > 0
+    assert alerts == expected_alerts(lines)
+
+
+@pytest.mark.parametrize("workers, kind", EXECUTORS)
+def test_concurrent_chunks_keep_satellite_order(workers, kind):
+    lines = make_lines()
+
+    async def scenario(executor):
+        # Chunks are processed in the order they were sent, even when their results are awaited together
+        results = await asyncio.gather(*(executor.process("apollo", lines[start : start + 50]) for start in range(0, len(lines), 50)))
+        return [alert for chunk_alerts, _ in results for alert in chunk_alerts]
+
+    assert run_with_executor(IngestionExecutor(workers, kind), scenario) == expected_alerts(lines)
+
+
+@pytest.mark.parametrize("workers, kind", EXECUTORS)
+def test_missions_are_tracked_separately(workers, kind):
+    lines = make_lines()
+
+    async def scenario(executor):
+        first, _ = await executor.process("apollo", lines[:200])
+        other, _ = await executor.process("gemini", lines)
+        second, _ = await executor.process("apollo", lines[200:])
+        return first + second, other
+
+    apollo, gemini = run_with_executor(IngestionExecutor(workers, kind), scenario)
+
+    assert apollo == gemini == expected_alerts(lines)
+
+
+@pytest.mark.parametrize("workers, kind", EXECUTORS)
+def test_malformed_lines_are_counted(workers, kind):
+    lines = make_lines(10) + [b"20180101 23:01:09.521|1000|17|15|9|8|7.8", b"", b"not a line"]
+
+    async def scenario(executor):
+        return await executor.process("apollo", lines)
+
+    alerts, malformed_line_count = run_with_executor(IngestionExecutor(workers, kind), scenario)
+
+    assert alerts == expected_alerts(lines[:10])
+    assert malformed_line_count == 3
+
+
+@pytest.mark.parametrize("workers, kind", EXECUTORS)
+def test_missions_past_the_cap_are_refused(workers, kind):
+    lines = make_lines(20)
+
+    async def scenario(executor):
+        await executor.process("apollo", lines)
+        await executor.process("gemini", lines)
+        with pytest.raises(TooManyMissionsError):
+            await executor.process("mercury", lines)
+        return await executor.process("apollo", lines)
+
+    alerts, _ = run_with_executor(IngestionExecutor(workers, kind, max_missions=2), scenario)
+
+    assert alerts == expected_alerts(lines + lines)[len(expected_alerts(lines)) :]
+
+
+@pytest.mark.parametrize("workers, kind", EXECUTORS)
+def test_idle_mission_is_evicted_for_a_new_one(workers, kind):
+    lines = make_lines(20)
+
+    async def scenario(executor):
+        await executor.process("apollo", lines)
+        await executor.process("gemini", lines)
+        # Apollo is the least recently active, evicted for mercury, and gemini for apollo
+        mercury, _ = await executor.process("mercury", lines)
+        apollo, _ = await executor.process("apollo", lines)
+        return mercury, apollo
+
+    mercury, apollo = run_with_executor(IngestionExecutor(workers, kind, max_missions=2, mission_idle_seconds=0), scenario)
+
+    # A mission evicted and seen again starts with new trackers
+    assert mercury == apollo == expected_alerts(lines)
+
+
+def test_unknown_executor_kind():
+    with pytest.raises(ValueError):
+        IngestionExecutor(2, "fiber")
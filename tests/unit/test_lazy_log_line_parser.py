@@ -0,0 +1,80 @@
+from io import StringIO
+from typing import Optional
+
+import pytest
+
+from my_mission_control.alerter.alert_strategy import AlertEvalStrategy, RedHighAlertStrategy, RedLowAlertStrategy
+from my_mission_control.alerter.log_file_processor_v2 import _process_log_lines, _process_log_lines_lazy
+from my_mission_control.alerter.log_line_parser import LazyLogLineParser, parse_log_line_us
+from my_mission_control.entity.log_entry import LogEntry
+
+LINES = [
+    "20180101 23:01:05.001|1001|101|98|25|20|99.9|TSTAT",
+    "20180101 23:01:09.521|1000|17|15|9|8|7.8|BATT",
+    "20180101 23:01:26.011|1001|101|98|25|20|102.9|TSTAT",
+    "20180101 23:01:38.001|1001|101|98|25|20|102.7|TSTAT",
+    "20180101 23:01:49.021|1001|101|98|25|20|101.2|TSTAT",
+    "20180101 23:02:11.302|1000|17|15|9|8|7.7|BATT",
+    "20180101 23:04:11.531|1000|17|15|9|8|7.9|BATT",
+    "20180101 23:04:12.531|1000|17|15|9|8|8.9|BATT",
+]
+
+
+class LowYellowStrategy(AlertEvalStrategy):
+    """
+    Strategy that keeps the default required_fields.
+    """
+
+    def evaluate(self, log_entry: LogEntry) -> Optional[str]:
+        if log_entry.raw_value < log_entry.yellow_low_limit:
+            return "YELLOW LOW"
+        return None
+
+
+@pytest.fixture
+def lazy_parser():
+    return LazyLogLineParser({"BATT": RedLowAlertStrategy(), "TSTAT": RedHighAlertStrategy(), "GYRO": LowYellowStrategy()})
+
+
+def test_strategies_declare_required_fields():
+    assert RedLowAlertStrategy.required_fields == ("raw_value", "red_low_limit")
+    assert RedHighAlertStrategy.required_fields == ("raw_value", "red_high_limit")
+    assert "timestamp" in LowYellowStrategy.required_fields
+
+
+@pytest.mark.parametrize("line", LINES)
+def test_violations_are_fully_parsed(lazy_parser, line):
+    log_entry = parse_log_line_us(line)
+    assert log_entry is not None
+    expected_log_entry = log_entry if RedLowAlertStrategy().evaluate(log_entry) or RedHighAlertStrategy().evaluate(log_entry) else None
+    assert lazy_parser.parse_violation(line) == expected_log_entry
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "bad timestamp|1000|17|15|9|8|8.5|BATT",  # nominal, the timestamp is never decoded
+        "20180101 23:01:09.521|abc|17|15|9|8|8.5|BATT",  # nominal, the satellite id is never decoded
+        "20180101 23:01:09.521|1000|17|15|9|8|raw|BATT",  # raw value cannot be decoded
+        "20180101 23:01:09.521|1000|17|15|9|8|7.8",  # missing field
+        "20180101 23:01:09.521|1000|17|15|9|8|7.8|UNKNOWN",  # no strategy
+        "bad timestamp|1000|17|15|9|8|7.8|BATT",  # violation with an undecodable timestamp
+    ],
+)
+def test_nominal_and_malformed_lines_are_skipped(lazy_parser, line):
+    assert lazy_parser.parse_violation(line) is None
+
+
+def test_default_required_fields_decode_whole_line(lazy_parser):
+    log_entry = lazy_parser.parse_violation("20180101 23:01:09.521|1000|17|15|9|8|7.8|GYRO")
+    assert log_entry == parse_log_line_us("20180101 23:01:09.521|1000|17|15|9|8|7.8|GYRO")
+    assert lazy_parser.parse_violation("bad timestamp|1000|17|15|9|8|10|GYRO") is None
+
+
+def test_lazy_processing_matches_line_processing():
+    log_data = "\n".join(LINES * 3)
+
+    expected_alerts = _process_log_lines(StringIO(log_data))
+
+    assert len(expected_alerts) > 0
+    assert _process_log_lines_lazy(StringIO(log_data)) == expected_alerts
@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta
+from io import StringIO
+
+from my_mission_control.alerter.log_batch_parser import parse_log_lines_batch
+from my_mission_control.alerter.log_file_processor_v2 import _process_log_lines, _process_log_lines_batch
+from my_mission_control.alerter.log_line_parser import parse_log_line
+from my_mission_control.utils.epoch_time import datetime_to_epoch_us
+from tests.utils.log_helper import make_log_line
+
+LINES = [
+    "20180101 23:01:05.001|1001|101|98|25|20|99.9|TSTAT",
+    "20180101 23:01:09.521|1000|17|15|9|8|7.8|BATT",
+    "20180101 23:01:26.5|1001|101|98|25|20|99.8|TSTAT",
+    "20240229 00:00:00.000001|1002|101|98|25|20|102.9|TSTAT",
+    "20180101 3:01:09.521|1000|17|15|9|8|7.7|BATT",  # irregular hour, accepted by strptime
+]
+
+MALFORMED_LINES = [
+    "20180101 23:01:09.521|1000|17|15|9|8|7.8",  # missing field
+    "20180101 23:01:09.521|1000|17|15|9|8|7.8|BATT|EXTRA",  # extra field
+    "20180230 23:01:09.521|1000|17|15|9|8|7.8|BATT",  # no such date
+    "2018/01/01 23:01:09|1000|17|15|9|8|7.8|BATT",  # bad timestamp
+    "20180101 23:01:09.521|abc|17|15|9|8|7.8|BATT",  # non numeric satellite id
+    "20180101 23:01:09.521|1000|17|15|9|low|7.8|BATT",  # non numeric red low limit
+    "20180101 23:01:09.521|1000|17|15|9|8|raw|BATT",  # non numeric raw value
+]
+
+
+def test_columns_match_parse_log_line():
+    columns = parse_log_lines_batch(LINES)
+
+    assert len(columns) == len(LINES)
+    for row, line in enumerate(LINES):
+        log_entry = parse_log_line(line)
+        assert log_entry is not None
+        assert columns.timestamp_us[row] == datetime_to_epoch_us(log_entry.timestamp)
+        assert columns.timestamps()[row] == log_entry.timestamp
+        assert columns.satellite_id[row] == log_entry.satellite_id
+        assert columns.red_high_limit[row] == log_entry.red_high_limit
+        assert columns.yellow_high_limit[row] == log_entry.yellow_high_limit
+        assert columns.yellow_low_limit[row] == log_entry.yellow_low_limit
+        assert columns.red_low_limit[row] == log_entry.red_low_limit
+        assert columns.raw_value[row] == log_entry.raw_value
+        assert columns.component_names[columns.component_code[row]] == log_entry.component
+
+
+def test_component_codes_are_categorical():
+    columns = parse_log_lines_batch(LINES)
+
+    assert columns.component_names == ("TSTAT", "BATT")
+    assert columns.component_code.tolist() == [0, 1, 0, 0, 1]
+
+
+def test_malformed_lines_are_dropped():
+    columns = parse_log_lines_batch(MALFORMED_LINES[:4] + LINES[:2] + MALFORMED_LINES[4:])
+
+    assert len(columns) == 2
+    assert columns.satellite_id.tolist() == [1001, 1000]
+    assert columns.raw_value.tolist() == [99.9, 7.8]
+
+
+def test_empty_chunk():
+    columns = parse_log_lines_batch([])
+
+    assert len(columns) == 0
+    assert columns.component_names == ()
+
+
+def test_batch_processing_matches_line_processing():
+    base_time = datetime(2018, 1, 1, 23, 59, 0)
+    lines = []
+    for i in range(60):
+        timestamp = base_time + timedelta(seconds=i * 7.5)
+        lines.append(make_log_line(timestamp, 1000 + i % 3, 17, 15, 9, 8, 7.5 if i % 2 else 8.5, "BATT"))
+        lines.append(make_log_line(timestamp, 1000 + i % 2, 101, 98, 25, 20, 101.5 if i % 3 else 99.0, "TSTAT"))
+    log_data = "\n".join(lines + MALFORMED_LINES)
+
+    expected_alerts = _process_log_lines(StringIO(log_data))
+
+    assert len(expected_alerts) > 0
+    for batch_size in (1, 7, 1000):
+        assert _process_log_lines_batch(StringIO(log_data), batch_size) == expected_alerts
@@ -0,0 +1,112 @@
+import bz2
+import gzip
+import lzma
+import os
+import tempfile
+import threading
+
+import pytest
+
+from my_mission_control.alerter.log_file_decompressor import detect_compression, iter_chunks_in_thread, iter_decompressed_chunks, iter_decompressed_log_lines
+
+COMPRESSORS = {"gzip": gzip.compress, "bz2": bz2.compress, "xz": lzma.compress}
+
+CONTENT = b"".join(b"20180101 23:01:%02d.%03d|1000|17|15|9|8|7.%d|BATT\n" % (i % 60, i % 1000, i % 10) for i in range(5000))
+
+
+def write_file(data: bytes) -> str:
+    with tempfile.NamedTemporaryFile(delete=False) as tmp:
+        tmp.write(data)
+        return tmp.name
+
+
+@pytest.mark.parametrize("compression", COMPRESSORS)
+def test_detect_compression_by_magic_bytes(compression):
+    path = write_file(COMPRESSORS[compression](CONTENT))
+
+    assert detect_compression(path) == compression
+
+    os.remove(path)  # cleanup
+
+
+@pytest.mark.parametrize("data", [CONTENT, b"", b"\x1f"])
+def test_detect_compression_of_plain_file(data):
+    path = write_file(data)
+
+    assert detect_compression(path) is None
+
+    os.remove(path)  # cleanup
+
+
+@pytest.mark.parametrize("compression", COMPRESSORS)
+@pytest.mark.parametrize("threaded", [False, True])
+def test_decompressed_lines_match_content(compression, threaded):
+    path = write_file(COMPRESSORS[compression](CONTENT))
+
+    lines = list(iter_decompressed_log_lines(path, compression, threaded=threaded, read_size=4096))
+
+    assert lines == CONTENT.splitlines()
+
+    os.remove(path)  # cleanup
+
+
+def test_decompressed_chunks_are_bounded():
+    path = write_file(gzip.compress(CONTENT))
+
+    chunks = list(iter_decompressed_chunks(path, "gzip", read_size=4096))
+
+    assert b"".join(chunks) == CONTENT
+    assert all(len(chunk) == 4096 for chunk in chunks[:-1])
+
+    os.remove(path)  # cleanup
+
+
+@pytest.mark.parametrize("compression", COMPRESSORS)
+def test_multi_member_archive_and_partial_last_line(compression):
+    compress = COMPRESSORS[compression]
+    path = write_file(compress(b"a|1\nb|") + compress(b"2\nc|3"))
+
+    assert list(iter_decompressed_log_lines(path, compression)) == [b"a|1", b"b|2", b"c|3"]
+
+    os.remove(path)  # cleanup
+
+
+@pytest.mark.parametrize("threaded", [False, True])
+def test_truncated_archive_raises_after_the_lines_before_it(threaded):
+    path = write_file(gzip.compress(CONTENT)[:-20])
+
+    lines = []
+    with pytest.raises(EOFError):
+        for line in iter_decompressed_log_lines(path, "gzip", threaded=threaded, read_size=4096):
+            lines.append(line)
+    assert lines == CONTENT.splitlines()[: len(lines)]
+    assert len(lines) > 0
+
+    os.remove(path)  # cleanup
+
+
+def test_unknown_compression_is_rejected():
+    with pytest.raises(ValueError):
+        next(iter_decompressed_chunks("unused.log", "zip"))
+
+
+def test_chunks_in_thread_stops_when_closed_early():
+    produced = []
+
+    def chunks():
+        for i in range(1000):
+            produced.append(i)
+            yield b"%d" % i
+
+    threaded_chunks = iter_chunks_in_thread(chunks(), queue_size=2)
+    assert next(threaded_chunks) == b"0"
+    threaded_chunks.close()
+
+    assert not any(thread.name == "log-decompressor" for thread in threading.enumerate())
+    assert len(produced) < 10
+
+
+def test_chunks_in_thread_keeps_order():
+    chunks = [b"%d" % i for i in range(100)]
+
+    assert list(iter_chunks_in_thread(iter(chunks), queue_size=1)) == chunks
@@ -0,0 +1,81 @@
+import os
+import tempfile
+import threading
+
+import pytest
+
+from my_mission_control.alerter.log_file_follower import LogFileFollower
+
+
+@pytest.fixture
+def log_dir():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        yield tmp_dir
+
+
+def append(path: str, data: bytes):
+    with open(path, "ab") as log_file:
+        log_file.write(data)
+
+
+def test_reads_appended_lines_once_and_completes_partial_lines(log_dir):
+    path = os.path.join(log_dir, "telemetry.log")
+    follower = LogFileFollower(path, read_size=4)
+
+    # The file does not exist yet
+    assert list(follower.iter_available_lines()) == []
+
+    append(path, b"line 1\nline")
+    assert list(follower.iter_available_lines()) == [b"line 1"]
+    assert list(follower.iter_available_lines()) == []
+
+    append(path, b" 2\nline 3\n")
+    assert list(follower.iter_available_lines()) == [b"line 2", b"line 3"]
+    follower.close()
+
+
+def test_follows_rotation_to_the_new_file(log_dir):
+    path = os.path.join(log_dir, "telemetry.log")
+    append(path, b"old 1\n")
+    follower = LogFileFollower(path)
+    assert list(follower.iter_available_lines()) == [b"old 1"]
+
+    # Lines written to the old file before rotation, the last one unterminated, are not lost
+    append(path, b"old 2\nold 3")
+    os.rename(path, path + ".1")
+    append(path, b"new 1\n")
+
+    assert list(follower.iter_available_lines()) == [b"old 2", b"old 3", b"new 1"]
+    assert follower.rotation_count == 1
+    append(path, b"new 2\n")
+    assert list(follower.iter_available_lines()) == [b"new 2"]
+    follower.close()
+
+
+def test_rereads_truncated_file_from_start(log_dir):
+    path = os.path.join(log_dir, "telemetry.log")
+    append(path, b"line 1\nline 2\n")
+    follower = LogFileFollower(path)
+    assert len(list(follower.iter_available_lines())) == 2
+
+    with open(path, "wb") as log_file:
+        log_file.write(b"new\n")
+    assert list(follower.iter_available_lines()) == [b"new"]
+    follower.close()
+
+
+def test_follow_backs_off_while_idle_and_stops(log_dir):
+    path = os.path.join(log_dir, "telemetry.log")
+    append(path, b"line 1\n")
+    follower = LogFileFollower(path, poll_min_seconds=0.001, poll_max_seconds=0.05)
+    stop = threading.Event()
+
+    lines = []
+    for line in follower.follow(stop):
+        lines.append(line)
+        if len(lines) == 1:
+            threading.Timer(0.2, append, (path, b"line 2\n")).start()
+        else:
+            stop.set()
+
+    assert lines == [b"line 1", b"line 2"]
@@ -0,0 +1,125 @@
+import io
+import os
+import tempfile
+from typing import Optional
+
+import pytest
+
+from my_mission_control.alerter.log_file_processor_v2 import process_log_file
+from my_mission_control.alerter.log_file_scanner import LineSplitter, iter_log_lines_mmap, iter_log_lines_stream
+from my_mission_control.alerter.log_line_parser import parse_log_line_bytes, parse_log_line_us
+
+LINES = [
+    "20180101 23:01:05.001|1001|101|98|25|20|99.9|TSTAT",
+    "20180101 23:01:09.521|1000|17|15|9|8|7.8|BATT",
+    "20180101 23:01:26.011|1001|101|98|25|20|102.9|TSTAT",
+    "20180101 23:01:38.001|1001|101|98|25|20|102.7|TSTAT",
+    "20180101 23:01:49.021|1001|101|98|25|20|101.2|TSTAT",
+    "20180101 3:01:09.521|1000|17|15|9|8|7.7|BATT",  # irregular hour, accepted by strptime
+    "  20180101 23:02:11.302|1000|17|15|9|8|7.7|BATT  ",  # surrounding whitespace
+]
+
+MALFORMED_LINES = [
+    "20180101 23:01:09.521|1000|17|15|9|8|7.8",  # missing field
+    "20180101 23:01:09.521|1000|17|15|9|8|7.8|BATT|EXTRA",  # extra field
+    "2018/01/01 23:01:09|1000|17|15|9|8|7.8|BATT",  # bad timestamp
+    "20180101 23:01:09.521|abc|17|15|9|8|7.8|BATT",  # non numeric satellite id
+    "20180101 23:01:09.521|1000|17|15|9|8|raw|BATT",  # non numeric raw value
+    "",
+]
+
+
+@pytest.fixture
+def write_log_file():
+    paths = []
+
+    def _write(data: bytes) -> str:
+        with tempfile.NamedTemporaryFile(mode="wb", delete=False) as tmp:
+            tmp.write(data)
+            paths.append(tmp.name)
+            return tmp.name
+
+    yield _write
+    for path in paths:
+        os.remove(path)  # cleanup
+
+
+@pytest.mark.parametrize("line", LINES + MALFORMED_LINES)
+def test_parse_log_line_bytes_matches_parse_log_line_us(line):
+    assert parse_log_line_bytes(line.encode()) == parse_log_line_us(line)
+
+
+def test_parse_log_line_bytes_non_ascii_timestamp():
+    assert parse_log_line_bytes("2018０101 23:01:09.521|1000|17|15|9|8|7.8|BATT".encode()) is None
+
+
+@pytest.mark.parametrize(
+    "data, expected_lines",
+    [
+        (b"", []),
+        (b"a\nb\n", [b"a", b"b"]),
+        (b"a\nb", [b"a", b"b"]),  # no trailing newline
+        (b"a\r\n\nb\n", [b"a\r", b"", b"b"]),
+    ],
+)
+def test_iter_log_lines_mmap(write_log_file, data, expected_lines):
+    assert list(iter_log_lines_mmap(write_log_file(data))) == expected_lines
+
+
+def test_memory_mapped_matches_text_mode(write_log_file):
+    path = write_log_file(("\n".join(LINES + MALFORMED_LINES + LINES) + "\r\n").encode())
+
+    expected_alerts = process_log_file(path)
+
+    assert len(expected_alerts) > 0
+    assert process_log_file(path, memory_mapped=True) == expected_alerts
+
+
+@pytest.mark.parametrize("options", [{"batch_size": 64}, {"vectorized": True}, {"lazy": True}])
+@pytest.mark.parametrize("mode", [{"memory_mapped": True}, {"allowed_lateness_us": 1_000_000}])
+def test_unsupported_combinations_are_rejected(write_log_file, mode, options):
+    path = write_log_file("\n".join(LINES).encode())
+
+    with pytest.raises(ValueError):
+        process_log_file(path, **mode, **options)
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 3, 5, 1 << 20])
+@pytest.mark.parametrize("data", [b"\n", b"a\n\n", b"ab\ncd\n\nef", b"abc\r\nde\nf\n"])
+def test_iter_log_lines_mmap_matches_text_mode_lines(write_log_file, data, block_size):
+    path = write_log_file(data)
+    with open(path, "rb") as f:
+        expected_lines = [line.rstrip(b"\n") for line in f]
+
+    assert list(iter_log_lines_mmap(path, block_size)) == expected_lines
+
+
+def test_line_splitter_carries_partial_lines():
+    splitter = LineSplitter()
+    assert splitter.feed(b"first li") == []
+    assert splitter.pending == 8
+    assert splitter.feed(b"ne\nsecond\nthi") == [b"first line", b"second"]
+    assert splitter.feed(b"rd\n") == [b"third"]
+    assert splitter.flush() is None
+    assert splitter.feed(b"\n\nlast") == [b"", b""]
+    assert splitter.flush() == b"last"
+
+
+class TrickleStream(io.BytesIO):
+    """
+    Pipe-like stream returning at most a few bytes per read
+    """
+
+    def __init__(self, data: bytes, step: int):
+        super().__init__(data)
+        self._step = step
+
+    def read1(self, size: Optional[int] = -1, /) -> bytes:
+        return super().read1(self._step if size is None or size < 0 else min(size, self._step))
+
+
+@pytest.mark.parametrize("step", [1, 5, 1 << 20])
+def test_iter_log_lines_stream_matches_file_lines(step):
+    data = "\n".join(LINES).encode()
+    assert list(iter_log_lines_stream(TrickleStream(data, step), read_size=64)) == [line.encode() for line in LINES]
+    assert list(iter_log_lines_stream(TrickleStream(data + b"\n", step), read_size=64)) == [line.encode() for line in LINES]
@@ -4,7 +4,7 @@ from typing import Dict, List, Optional
 from my_mission_control.alerter.alert_rules import COMPONENT_BATT, COMPONENT_TSTAT
 from my_mission_control.alerter.alert_strategy import AlertEvalStrategy, RedHighAlertStrategy, RedLowAlertStrategy
 from my_mission_control.alerter.alert_tracker import AlertTracker
-from my_mission_control.alerter.log_file_processor_v2 import _process_log_line
+from my_mission_control.alerter.log_file_processor_v2 import process_log_line
 from my_mission_control.entity.alert import Alert
 from tests.utils.log_helper import format_ts, make_log_line
 
@@ -40,7 +40,7 @@ class TestLogLineProcessing:
         alerts: List[dict] = []
         # Process each log line individually and collect any generated alerts
         for line in lines:
-            alert: Optional[Alert] = _process_log_line(line, self.alert_tracker)
+            alert: Optional[Alert] = process_log_line(line, self.alert_tracker)
             if alert:
                 alerts.append(alert.to_dict())
 
@@ -60,7 +60,7 @@ class TestLogLineProcessing:
 
         alerts: List[dict] = []
         for line in lines:
-            alert: Optional[Alert] = _process_log_line(line, self.alert_tracker)
+            alert: Optional[Alert] = process_log_line(line, self.alert_tracker)
             if alert:
                 print("alert", alert)
                 alerts.append(alert.to_dict())
@@ -82,7 +82,7 @@ class TestLogLineProcessing:
 
         alerts: List[dict] = []
         for line in lines:
-            alert: Optional[Alert] = _process_log_line(line, self.alert_tracker)
+            alert: Optional[Alert] = process_log_line(line, self.alert_tracker)
             if alert:
                 alerts.append(alert.to_dict())
 
@@ -104,7 +104,7 @@ class TestLogLineProcessing:
 
         alerts: List[dict] = []
         for line in lines:
-            alert: Optional[Alert] = _process_log_line(line, self.alert_tracker)
+            alert: Optional[Alert] = process_log_line(line, self.alert_tracker)
             if alert:
                 alerts.append(alert.to_dict())
 
@@ -129,7 +129,7 @@ class TestLogLineProcessing:
 
         alerts: List[dict] = []
         for line in lines:
-            alert: Optional[Alert] = _process_log_line(line, self.alert_tracker)
+            alert: Optional[Alert] = process_log_line(line, self.alert_tracker)
             if alert:
                 alerts.append(alert.to_dict())
 
@@ -150,7 +150,7 @@ class TestLogLineProcessing:
 
         alerts: List[dict] = []
         for line in lines:
-            alert: Optional[Alert] = _process_log_line(line, self.alert_tracker)
+            alert: Optional[Alert] = process_log_line(line, self.alert_tracker)
             if alert:
                 alerts.append(alert.to_dict())
 
@@ -168,7 +168,7 @@ class TestLogLineProcessing:
 
         alerts: List[dict] = []
         for line in lines:
-            alert: Optional[Alert] = _process_log_line(line, self.alert_tracker)
+            alert: Optional[Alert] = process_log_line(line, self.alert_tracker)
             if alert:
                 alerts.append(alert.to_dict())
 
@@ -191,7 +191,7 @@ class TestLogLineProcessing:
         #     alerts: List[dict] = []
         #     # Process each log line individually and collect any generated alerts
         #     for line in lines:
-        #         alert: Optional[Alert] = _process_log_line(line, self.alert_tracker)
+        #         alert: Optional[Alert] = process_log_line(line, self.alert_tracker)
         #         if alert:
         #             alerts.append(alert.to_dict())
 
@@ -220,7 +220,7 @@ class TestLogLineProcessing:
 
         #     alerts = []
         #     for line in lines:
-        #         alert: Optional[Alert] = _process_log_line(line, self.alert_tracker)
+        #         alert: Optional[Alert] = process_log_line(line, self.alert_tracker)
         #         if alert:
         #             alerts.append(alert)
 
@@ -250,7 +250,7 @@ class TestLogLineProcessing:
 #     alert_tracker = AlertTracker(alert_eval_strategy_map)
 #     # Process each log line individually and collect any generated alerts
 #     for line in lines:
-#         alert: Optional[Alert] = _process_log_line(line, alert_tracker)
+#         alert: Optional[Alert] = process_log_line(line, alert_tracker)
 #         if alert:
 #             alerts.append(alert.to_dict())
 
@@ -279,7 +279,7 @@ class TestLogLineProcessing:
 
 #     alerts = []
 #     for line in lines:
-#         alert = _process_log_line(line)
+#         alert = process_log_line(line)
 #         if alert:
 #             alerts.append(alert)
 
@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from my_mission_control.alerter.reorder_buffer import ReorderBuffer
+from my_mission_control.entity.log_entry import LogEntry
+
+
+def make_log_entry(ts: int, satellite_id: int = 1000) -> LogEntry:
+    return LogEntry(ts, satellite_id, 17, 15, 9, 8, 7.5, "BATT")
+
+
+def test_entries_are_released_in_order_as_the_watermark_advances():
+    reorder_buffer = ReorderBuffer(allowed_lateness_us=10)
+
+    assert list(reorder_buffer.push(make_log_entry(100))) == []
+    assert list(reorder_buffer.push(make_log_entry(95))) == []
+    assert reorder_buffer.watermark_us == 90
+    assert [log_entry.timestamp for log_entry in reorder_buffer.push(make_log_entry(108))] == [95]
+    assert [log_entry.timestamp for log_entry in reorder_buffer.push(make_log_entry(120))] == [100, 108]
+    assert len(reorder_buffer) == 1
+    assert [log_entry.timestamp for log_entry in reorder_buffer.flush()] == [120]
+
+
+def test_entries_behind_the_watermark_are_dropped():
+    reorder_buffer = ReorderBuffer(allowed_lateness_us=10)
+    reorder_buffer.push(make_log_entry(100))
+
+    assert list(reorder_buffer.push(make_log_entry(89))) == []
+    assert list(reorder_buffer.push(make_log_entry(90))) == [make_log_entry(90)]
+    assert reorder_buffer.dropped_late_count == 1
+
+    reorder_buffer.flush()
+    assert list(reorder_buffer.push(make_log_entry(99))) == []
+    assert reorder_buffer.dropped_late_count == 2
+
+
+def test_equal_timestamps_keep_arrival_order():
+    reorder_buffer = ReorderBuffer(allowed_lateness_us=0)
+    reorder_buffer.push(make_log_entry(200, 1))
+    reorder_buffer.push(make_log_entry(100, 2))
+    assert list(reorder_buffer.push(make_log_entry(200, 3))) == [make_log_entry(200, 3)]
+
+    reorder_buffer = ReorderBuffer(allowed_lateness_us=50)
+    for satellite_id in range(5):
+        reorder_buffer.push(make_log_entry(100, satellite_id))
+    assert [log_entry.satellite_id for log_entry in reorder_buffer.flush()] == list(range(5))
+
+
+def test_shuffled_within_lateness_comes_out_sorted_and_bounded():
+    rng = random.Random(0)
+    timestamps = [i * 10 + rng.randint(0, 500) for i in range(5000)]
+    reorder_buffer = ReorderBuffer(allowed_lateness_us=500)
+
+    released, max_buffered = [], 0
+    for ts in timestamps:
+        released.extend(reorder_buffer.push(make_log_entry(ts)))
+        max_buffered = max(max_buffered, len(reorder_buffer))
+    released.extend(reorder_buffer.flush())
+
+    assert [log_entry.timestamp for log_entry in released] == sorted(timestamps)
+    assert reorder_buffer.dropped_late_count == 0
+    assert max_buffered <= 101
+
+
+def test_negative_lateness_raises():
+    with pytest.raises(ValueError):
+        ReorderBuffer(allowed_lateness_us=-1)
@@ -0,0 +1,135 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from my_mission_control.api.telemetry_ingestion import LineTooLongError, MissionTrackers, MultipartTelemetryUpload, TelemetryUpload, TooManyMissionsError, UploadTooLargeError
+from tests.utils.log_helper import make_log_line
+
+BOUNDARY = b"telemetry-boundary"
+
+
+def make_lines(count: int = 400) -> bytes:
+    base_time = datetime(2018, 1, 1, 23, 0, 0)
+    lines = []
+    for i in range(count):
+        ts = base_time + timedelta(seconds=i * 7)
+        if i % 2:
+            lines.append(make_log_line(ts, 1000 + i % 3, 17, 15, 9, 8, 7.5 if i % 5 else 8.5, "BATT"))
+        else:
+            lines.append(make_log_line(ts, 1000 + i % 4, 101, 98, 25, 20, 101.5 if i % 7 else 99.0, "TSTAT"))
+    return "\n".join(lines).encode()
+
+
+def feed_in_chunks(upload: TelemetryUpload, body: bytes, chunk_size: int):
+    lines = []
+    for start in range(0, len(body), chunk_size):
+        lines.extend(upload.feed(body[start : start + chunk_size]))
+    lines.extend(upload.finish())
+    return lines
+
+
+def multipart_body(*files: bytes) -> bytes:
+    parts = [b'--%s\r\nContent-Disposition: form-data; name="files"; filename="station%d.log"\r\nContent-Type: text/plain\r\n\r\n%s\r\n' % (BOUNDARY, index, data) for index, data in enumerate(files)]
+    return b"".join(parts) + b"--%s--\r\n" % BOUNDARY
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 100, 1 << 20])
+def test_upload_in_chunks_matches_whole_file(chunk_size):
+    data = make_lines()
+    upload = TelemetryUpload()
+
+    lines = feed_in_chunks(upload, data, chunk_size)
+
+    assert lines == data.splitlines()
+    assert upload.line_count == 400
+
+
+def test_upload_counts_lines_with_and_without_newline():
+    upload = TelemetryUpload()
+
+    lines = upload.feed(make_lines(4) + b"\n20180101 23:01:09.521|1000|17|15|9|8|7.8")
+
+    assert len(lines) == 4
+    assert upload.finish() == [b"20180101 23:01:09.521|1000|17|15|9|8|7.8"]
+    assert upload.line_count == 5
+
+
+def test_upload_rejects_line_too_long():
+    upload = TelemetryUpload(max_line_bytes=100)
+
+    with pytest.raises(LineTooLongError):
+        for _ in range(10):
+            upload.feed(b"x" * 30)
+
+
+def test_upload_rejects_complete_line_too_long():
+    upload = TelemetryUpload(max_line_bytes=100)
+
+    with pytest.raises(LineTooLongError):
+        upload.feed(b"x" * 150 + b"\n")
+
+
+@pytest.mark.parametrize("upload", [TelemetryUpload(max_upload_bytes=1000), MultipartTelemetryUpload(BOUNDARY, max_upload_bytes=1000)])
+def test_upload_rejects_upload_too_large(upload):
+    data = multipart_body(make_lines()) if isinstance(upload, MultipartTelemetryUpload) else make_lines()
+
+    with pytest.raises(UploadTooLargeError):
+        feed_in_chunks(upload, data, 100)
+
+    assert upload.byte_count == 1100
+
+
+@pytest.mark.parametrize("chunk_size", [1, 13, 1 << 20])
+def test_multipart_upload_processes_each_part_as_a_file(chunk_size):
+    data = make_lines()
+    first, second = data[: len(data) // 2], data[len(data) // 2 :]
+    # The first part ends mid-line, its partial last line is not joined to the second part
+    first, rest = first.rsplit(b"\n", 1)
+    upload = MultipartTelemetryUpload(BOUNDARY)
+
+    lines = feed_in_chunks(upload, multipart_body(first, rest + second), chunk_size)
+
+    assert lines == data.splitlines()
+    assert upload.part_count == 2
+
+
+def test_multipart_upload_without_closing_boundary():
+    upload = MultipartTelemetryUpload(BOUNDARY)
+    upload.feed(multipart_body(make_lines(10))[:-30])
+
+    with pytest.raises(ValueError):
+        upload.finish()
+
+
+def test_mission_trackers_are_created_once_per_mission():
+    mission_trackers = MissionTrackers()
+
+    alert_tracker = mission_trackers.get("apollo")
+
+    assert mission_trackers.get("apollo") is alert_tracker
+    assert mission_trackers.get("gemini") is not alert_tracker
+    assert alert_tracker.idle_key_timer is not None
+    assert "apollo" in mission_trackers
+    assert len(mission_trackers) == 2
+
+
+def test_mission_trackers_refuse_missions_past_the_cap():
+    mission_trackers = MissionTrackers(max_missions=2)
+    alert_tracker = mission_trackers.get("apollo")
+    mission_trackers.get("gemini")
+
+    with pytest.raises(TooManyMissionsError):
+        mission_trackers.get("mercury")
+
+    assert mission_trackers.get("apollo") is alert_tracker
+    assert "mercury" not in mission_trackers
+
+
+def test_mission_trackers_drop_a_mission():
+    mission_trackers = MissionTrackers(max_missions=1)
+    alert_tracker = mission_trackers.get("apollo")
+
+    mission_trackers.drop("apollo")
+
+    assert "apollo" not in mission_trackers
+    assert mission_trackers.get("gemini") is not alert_tracker
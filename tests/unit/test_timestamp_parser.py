@@ -0,0 +1,73 @@
+from datetime import datetime
+
+import pytest
+
+from my_mission_control.alerter.timestamp_parser import LogTimestampParser, parse_log_timestamp, parse_log_timestamp_us
+from my_mission_control.config.settings import InputLogFileCfg
+from my_mission_control.utils.epoch_time import datetime_to_epoch_us, epoch_us_to_datetime
+
+
+@pytest.mark.parametrize(
+    "ts_str",
+    [
+        "20180101 23:01:09.521",
+        "20180101 23:01:09.5",
+        "20180101 23:01:09.000001",
+        "20250807 00:00:00.000",
+        "20240229 12:30:45.123456",
+        "20181231 23:59:59.999",
+    ],
+)
+def test_fixed_width_matches_strptime(ts_str):
+    assert parse_log_timestamp(ts_str) == datetime.strptime(ts_str, InputLogFileCfg.LOG_LINE_TIMESTAMP_FORMAT)
+    assert parse_log_timestamp_us(ts_str) == datetime_to_epoch_us(datetime.strptime(ts_str, InputLogFileCfg.LOG_LINE_TIMESTAMP_FORMAT))
+
+
+@pytest.mark.parametrize(
+    "ts_str",
+    [
+        "20180101 3:01:09.521",  # single digit hour, accepted by strptime
+        "2018011 23:01:09.521",  # single digit day, accepted by strptime
+    ],
+)
+def test_irregular_input_falls_back_to_strptime(ts_str):
+    assert parse_log_timestamp(ts_str) == datetime.strptime(ts_str, InputLogFileCfg.LOG_LINE_TIMESTAMP_FORMAT)
+    assert parse_log_timestamp_us(ts_str) == datetime_to_epoch_us(datetime.strptime(ts_str, InputLogFileCfg.LOG_LINE_TIMESTAMP_FORMAT))
+
+
+@pytest.mark.parametrize(
+    "ts_str",
+    [
+        "2025/08/07 19:46:00",
+        "20250230 19:46:00.000",  # no such date
+        "20251301 19:46:00.000",  # no such month
+        "20250807 24:46:00.000",  # hour out of range
+        "20250807 19:46:00.1234567",  # fraction too long
+        "20250807 19:46:00.",
+        "20250807 1+:46:00.000",
+        "",
+    ],
+)
+def test_invalid_timestamp_raises(ts_str):
+    with pytest.raises(ValueError):
+        parse_log_timestamp(ts_str)
+    with pytest.raises(ValueError):
+        parse_log_timestamp_us(ts_str)
+
+
+def test_date_prefix_cache_follows_date_change():
+    parser = LogTimestampParser()
+    assert parser.parse("20180101 23:59:59.999") == datetime(2018, 1, 1, 23, 59, 59, 999000)
+    assert parser.parse("20180102 00:00:00.001") == datetime(2018, 1, 2, 0, 0, 0, 1000)
+    assert parser.parse("20180101 23:59:59.998") == datetime(2018, 1, 1, 23, 59, 59, 998000)
+
+
+def test_custom_format_uses_strptime():
+    parser = LogTimestampParser("%Y-%m-%d %H:%M:%S")
+    assert parser.parse("2018-01-01 23:01:09") == datetime(2018, 1, 1, 23, 1, 9)
+
+
+def test_epoch_us_round_trip():
+    timestamp = datetime(2018, 1, 1, 23, 1, 9, 521000)
+    assert datetime_to_epoch_us(timestamp) == 1514847669521000
+    assert epoch_us_to_datetime(1514847669521000) == timestamp
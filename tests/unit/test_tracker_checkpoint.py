@@ -0,0 +1,98 @@
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+
+from my_mission_control.alerter.alert_strategy import RedHighAlertStrategy, RedLowAlertStrategy, SeverityBandAlertStrategy
+from my_mission_control.alerter.alert_tracker import AlertTracker
+from my_mission_control.alerter.tracker_checkpoint import TrackerCheckpoint, load_checkpoint, save_checkpoint
+from my_mission_control.entity.log_entry import LogEntry
+from my_mission_control.utils.epoch_time import datetime_to_epoch_us
+
+
+def make_alert_tracker() -> AlertTracker:
+    return AlertTracker({"BATT": RedLowAlertStrategy(), "TSTAT": RedHighAlertStrategy()})
+
+
+def make_log_entries(count: int, offset: int = 0):
+    base_time = datetime(2018, 1, 1, 23, 1, 5)
+    for i in range(offset, offset + count):
+        ts = datetime_to_epoch_us(base_time + timedelta(seconds=i * 37 % 1000 + i))
+        if i % 2:
+            yield LogEntry(ts, 1000 + i % 5, 17, 15, 9, 8, 7.5 if i % 3 else 8.5, "BATT")
+        else:
+            yield LogEntry(ts, -1000 - i % 3, 101, 98, 25, 20, 102.5 if i % 5 else 99.0, "TSTAT")
+
+
+def test_checkpoint_round_trip_restores_identical_tracker():
+    alert_tracker = make_alert_tracker()
+    alert_tracker.advance_event_time(0)
+    for log_entry in make_log_entries(500):
+        alert_tracker.process_log_entry(log_entry)
+
+    checkpoint = TrackerCheckpoint.from_bytes(TrackerCheckpoint.capture(alert_tracker, "data/sample.log", 42, 1234).to_bytes())
+    assert checkpoint.log_file == os.path.abspath("data/sample.log")
+    assert (checkpoint.inode, checkpoint.offset, checkpoint.event_time_us) == (42, 1234, alert_tracker.event_time_us)
+
+    restored_tracker = make_alert_tracker()
+    checkpoint.restore(restored_tracker)
+    assert restored_tracker.component_codes == alert_tracker.component_codes
+    assert restored_tracker.severity_codes == alert_tracker.severity_codes
+    assert restored_tracker.violation_windows.keys() == alert_tracker.violation_windows.keys()
+    for key, violation_window in alert_tracker.violation_windows.items():
+        restored_window = restored_tracker.violation_windows[key]
+        assert list(restored_window) == list(violation_window)
+        assert (restored_window.last_alert_ts, restored_window.latest_ts) == (violation_window.last_alert_ts, violation_window.latest_ts)
+
+    # Both trackers raise the same alerts from here on
+    for log_entry in make_log_entries(500, offset=500):
+        assert restored_tracker.process_log_entry(log_entry) == alert_tracker.process_log_entry(log_entry)
+
+
+def test_restored_windows_keep_the_strategy_threshold_as_capacity():
+    alert_tracker = AlertTracker({"BATT": SeverityBandAlertStrategy(threshold=12), "TSTAT": RedHighAlertStrategy()})
+    for log_entry in make_log_entries(50):
+        alert_tracker.process_log_entry(log_entry)
+    checkpoint = TrackerCheckpoint.from_bytes(TrackerCheckpoint.capture(alert_tracker, "data/sample.log", 1, 2).to_bytes())
+
+    restored_tracker = AlertTracker({"BATT": SeverityBandAlertStrategy(threshold=12), "TSTAT": RedHighAlertStrategy()})
+    checkpoint.restore(restored_tracker)
+
+    batt_code = restored_tracker.component_codes["BATT"]
+    for key, violation_window in restored_tracker.violation_windows.items():
+        threshold = 12 if key & 0xFFFF == batt_code else RedHighAlertStrategy.threshold
+        assert violation_window.capacity == max(threshold, len(violation_window))
+
+
+def test_empty_tracker_round_trip():
+    checkpoint = TrackerCheckpoint.from_bytes(TrackerCheckpoint.capture(make_alert_tracker(), "/tmp/x.log", 0, 0).to_bytes())
+    assert checkpoint.event_time_us is None
+    assert checkpoint.component_codes == {}
+    assert checkpoint.violation_windows == {}
+
+
+@pytest.mark.parametrize("data", [b"", b"NOPE" + bytes(40), b"MMCP\x01\x00" + bytes(40)])
+def test_invalid_checkpoint_raises(data):
+    with pytest.raises(ValueError):
+        TrackerCheckpoint.from_bytes(data)
+
+
+def test_truncated_checkpoint_raises():
+    alert_tracker = make_alert_tracker()
+    for log_entry in make_log_entries(50):
+        alert_tracker.process_log_entry(log_entry)
+    data = TrackerCheckpoint.capture(alert_tracker, "data/sample.log", 1, 2).to_bytes()
+
+    with pytest.raises(ValueError):
+        TrackerCheckpoint.from_bytes(data[:-4])
+
+
+def test_save_checkpoint_replaces_previous_checkpoint():
+    with tempfile.TemporaryDirectory() as directory:
+        checkpoint_file = os.path.join(directory, "tracker.ckpt")
+        save_checkpoint(checkpoint_file, TrackerCheckpoint("/data/a.log", 1, 10))
+        save_checkpoint(checkpoint_file, TrackerCheckpoint("/data/a.log", 1, 20))
+
+        assert load_checkpoint(checkpoint_file).offset == 20
+        assert os.listdir(directory) == ["tracker.ckpt"]
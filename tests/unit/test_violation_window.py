@@ -0,0 +1,92 @@
+import random
+from datetime import datetime, timedelta
+from typing import Dict
+
+import pytest
+
+from my_mission_control.alerter.alert_strategy import AlertEvalStrategy, RedLowAlertStrategy
+from my_mission_control.alerter.alert_tracker import TIME_DELTA_US, AlertTracker
+from my_mission_control.alerter.batch_alert_detector import replay_violation_window
+from my_mission_control.alerter.violation_window import ViolationWindow
+from my_mission_control.config.settings import AlertRuleCfg
+from my_mission_control.utils.epoch_time import datetime_to_epoch_us, epoch_us_to_datetime
+from tests.utils.log_helper import make_log_entry
+
+MINUTE_US = 60_000_000
+THRESHOLD = AlertRuleCfg.ALERT_VIOLATION_COUNT_THRESHOLD
+
+
+def test_window_drops_expired_timestamps():
+    window = ViolationWindow(3)
+    for ts in (0, MINUTE_US, 2 * MINUTE_US):
+        window.add(ts, 5 * MINUTE_US)
+    window.add(6 * MINUTE_US + 1, 5 * MINUTE_US)
+
+    assert list(window) == [2 * MINUTE_US, 6 * MINUTE_US + 1]
+    assert window.first_ts == 2 * MINUTE_US
+
+
+def test_ring_grows_during_storm_and_shrinks_back():
+    window = ViolationWindow(3)
+    for second in range(100):
+        window.add(second * 1_000_000, 5 * MINUTE_US)
+
+    assert len(window) == 100
+    assert window.capacity >= 100
+    assert list(window) == [second * 1_000_000 for second in range(100)]
+
+    # One violation long after the storm leaves a single timestamp in the window
+    window.add(60 * MINUTE_US, 5 * MINUTE_US)
+    window.add(61 * MINUTE_US, 5 * MINUTE_US)
+    assert list(window) == [60 * MINUTE_US, 61 * MINUTE_US]
+    assert window.capacity < 100
+
+
+def test_ring_wraps_around():
+    window = ViolationWindow(3)
+    timestamps = [minute * MINUTE_US for minute in range(0, 60, 2)]
+    for ts in timestamps:
+        window.add(ts, 5 * MINUTE_US)
+        assert list(window) == [previous for previous in timestamps if previous <= ts and ts - previous <= 5 * MINUTE_US]
+    assert window.capacity == 3
+
+
+def test_check_alert_rearms_after_last_alert():
+    window = ViolationWindow(3)
+    alerts = []
+    for minute in (0, 1, 2, 3, 7, 8, 9):
+        window.add(minute * MINUTE_US, 5 * MINUTE_US)
+        first_ts = window.check_alert(minute * MINUTE_US, 3)
+        if first_ts is not None:
+            alerts.append(first_ts)
+
+    assert alerts == [0, 3 * MINUTE_US]
+    assert window.last_alert_ts == 8 * MINUTE_US
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("max_step_seconds", [5, 60, 200])
+def test_alert_tracker_matches_deque_replay(seed, max_step_seconds):
+    rng = random.Random(seed)
+    alert_eval_strategy_map: Dict[str, AlertEvalStrategy] = {"BATT": RedLowAlertStrategy()}
+    alert_tracker = AlertTracker(alert_eval_strategy_map)
+
+    base_time = datetime(2018, 1, 1, 23, 0, 0)
+    timestamps = []
+    ts = base_time
+    for _ in range(1000):
+        # Mostly in order, with storms and occasional late timestamps
+        ts += timedelta(seconds=rng.randint(0, max_step_seconds))
+        timestamps.append(ts - timedelta(seconds=rng.randint(0, 400)) if rng.random() < 0.05 else ts)
+
+    alerts = []
+    for position, timestamp in enumerate(timestamps):
+        alert = alert_tracker.process_log_entry(make_log_entry(timestamp, 1000, 17, 15, 9, 8, 7.5, "BATT"))
+        if alert:
+            alerts.append((position, alert.timestamp))
+
+    replayed_alerts = replay_violation_window([datetime_to_epoch_us(timestamp) for timestamp in timestamps], THRESHOLD, TIME_DELTA_US)
+    expected_alerts = [(position, epoch_us_to_datetime(first_ts)) for position, first_ts in replayed_alerts]
+
+    assert len(expected_alerts) > 0
+    assert alerts == expected_alerts